@@ -1,4 +1,5 @@
 # -*- mode: python ; coding: utf-8 -*-
+# 콘솔 스크립트이므로 GUI 라이브러리는 분석 단계에서부터 제외
 
 
 a = Analysis(
@@ -10,7 +11,7 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=['PyQt5', 'tkinter', 'pygame'],
     noarchive=False,
     optimize=0,
 )
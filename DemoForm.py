@@ -2,9 +2,9 @@
 #DemoForm.ui : 화면, DemoForm.py : 로직단
 import sys
 from PyQt5.QtWidgets import *
-from PyQt5 import uic
+from ui_loader import load_ui_class
 
-from_class = uic.loadUiType("DemoForm.ui")[0]
+from_class = load_ui_class("DemoForm.ui")
 
 #폼 클래스 정의
 class DemoForm(QDialog, from_class):
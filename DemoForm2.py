@@ -2,14 +2,12 @@
 #DemoForm2.ui : 화면, DemoForm.py : 로직단
 import sys
 from PyQt5.QtWidgets import *
-from PyQt5 import uic
-# web2.py
-from bs4 import BeautifulSoup
-import urllib.request
+from ui_loader import load_ui_class
+# web2.py의 크롤링 모듈(bs4, urllib.request)은 창이 빨리 뜨도록 버튼을 누를 때 import
 
 
-#파일 로딩 : 파일명 변경
-from_class = uic.loadUiType("DemoForm2.ui")[0]
+#파일 로딩 : 파일명 변경 (ui_loader.py build로 컴파일된 모듈이 있으면 그것을 사용)
+from_class = load_ui_class("DemoForm2.ui")
 
 #폼 클래스 정의 (부모: QMainWindow, from_class)
 class DemoForm(QMainWindow, from_class):
@@ -20,6 +18,9 @@ class DemoForm(QMainWindow, from_class):
 
     #슬럿 메서드
     def firstClick(self):
+        from bs4 import BeautifulSoup
+        import urllib.request
+
         #파일 저장
         f = open("clien.txt", "wt", encoding="utf-8"   )
 
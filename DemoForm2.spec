@@ -1,19 +1,46 @@
 # -*- mode: python ; coding: utf-8 -*-
+# 빌드 전에 `python ui_loader.py build DemoForm2.ui`로 ui_DemoForm2.py를 만들어 두면
+# 실행 시 .ui 파싱 없이 컴파일된 폼 클래스를 사용합니다. (.ui는 대체용으로 함께 포함)
+import os
+
+# 사용하지 않는 Qt 플러그인 제외 (QT_ALL_PLUGINS=1 환경 변수로 빌드하면 모두 포함)
+# 위젯 앱에는 윈도우 플랫폼 플러그인과 스타일만 있으면 됨
+EXCLUDE_UNUSED_QT_PLUGINS = os.environ.get('QT_ALL_PLUGINS') != '1'
+QT_PLUGINS_KEEP = {'platforms/qwindows', 'platforms/qminimal', 'styles'}
+# 앱에서 쓰지 않는 무거운 Qt 모듈
+QT_MODULE_EXCLUDES = [
+    'PyQt5.QtWebEngineWidgets', 'PyQt5.QtWebEngineCore', 'PyQt5.QtWebKit', 'PyQt5.QtQml', 'PyQt5.QtQuick',
+    'PyQt5.QtQuickWidgets', 'PyQt5.QtMultimedia', 'PyQt5.QtNetwork', 'PyQt5.QtSql',
+    'PyQt5.QtBluetooth', 'PyQt5.QtPositioning', 'PyQt5.QtSensors', 'PyQt5.QtSerialPort', 'tkinter',
+]
+
+
+def _keep_qt_plugin(dest):
+    path = dest.replace('\\', '/')
+    marker = 'PyQt5/Qt5/plugins/'
+    if marker not in path:
+        return True
+    plugin = path.split(marker, 1)[1]
+    return any(plugin == keep or plugin.startswith(keep + '/') or plugin.startswith(keep + '.')
+               for keep in QT_PLUGINS_KEEP)
 
 
 a = Analysis(
     ['DemoForm2.py'],
     pathex=[],
     binaries=[],
-    datas=[],
-    hiddenimports=[],
+    datas=[('DemoForm2.ui', '.')],
+    hiddenimports=['ui_DemoForm2'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=QT_MODULE_EXCLUDES if EXCLUDE_UNUSED_QT_PLUGINS else [],
     noarchive=False,
     optimize=0,
 )
+if EXCLUDE_UNUSED_QT_PLUGINS:
+    a.binaries = [entry for entry in a.binaries if _keep_qt_plugin(entry[0])]
+    a.datas = [entry for entry in a.datas if _keep_qt_plugin(entry[0])]
 pyz = PYZ(a.pure)
 
 exe = EXE(
@@ -1,24 +1,26 @@
 import sys
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import pyqtSlot, Qt
-from PyQt5 import uic 
-import sqlite3
-import os.path 
-
-#DB파일이 없으면 만들고 있다면 접속한다. 
-if os.path.exists("ProductList.db"):
-    con = sqlite3.connect("ProductList.db")
-    cur = con.cursor()
-else: 
-    con = sqlite3.connect("ProductList.db")
-    cur = con.cursor()
-    cur.execute(
-        "create table Products (id integer primary key autoincrement, Name text, Price integer);")
-
-#디자인 파일을 로딩
-form_class = uic.loadUiType("ProductList3.ui")[0]
+from ui_loader import load_ui_class
+
+#DB 파일 경로 (저장소는 처음 사용할 때 연다)
+DB_PATH = "ProductList.db"
+
+#디자인 파일을 로딩 (ui_loader.py build로 컴파일된 모듈이 있으면 그것을 사용)
+form_class = load_ui_class("ProductList3.ui")
 
 class Window(QMainWindow, form_class):
+    _store = None
+
+    @property
+    def store(self):
+        #DB파일이 없으면 만들고 있다면 접속한다. (매개변수화된 문장만 사용, 문장 캐시 재사용)
+        #창이 먼저 뜨도록 sqlite3 import와 연결은 처음 조회/저장할 때 한다.
+        if self._store is None:
+            from productlist_store import ProductListStore
+            self._store = ProductListStore(DB_PATH)
+        return self._store
+
     def __init__(self):
         super().__init__()
         self.setupUi(self)
@@ -55,45 +57,46 @@ class Window(QMainWindow, form_class):
         #입력 파라메터 처리 
         self.name = self.prodName.text()
         self.price = self.prodPrice.text()
-        cur.execute("insert into Products (Name, Price) values(?,?);", 
-            (self.name, self.price))
-        #리프레시
-        self.getProduct() 
-        #입력,수정,삭제 작업후에는 커밋을 한다. 
-        con.commit() 
+        #입력,수정,삭제는 저장소에서 바로 커밋된다.
+        if self.runQuery(self.store.add, self.name, self.price):
+            #리프레시
+            self.getProduct()
 
     def updateProduct(self):
         #업데이트 작업시 파라메터 처리 
         self.id  = self.prodID.text()
         self.name = self.prodName.text()
         self.price = self.prodPrice.text()
-        cur.execute("update Products set name=?, price=? where id=?;", 
-            (self.name, self.price, self.id))
-        #리프레시
-        self.getProduct() 
-        #입력,수정,삭제 작업후에는 커밋을 한다. 
-        con.commit()  
+        if self.runQuery(self.store.update, self.id, self.name, self.price):
+            #리프레시
+            self.getProduct()
 
     def removeProduct(self):
         #삭제 파라메터 처리 
         self.id  = self.prodID.text() 
-        strSQL = "delete from Products where id=" + str(self.id)
-        cur.execute(strSQL)
-        #리프레시
-        self.getProduct() 
-        #입력,수정,삭제 작업후에는 커밋을 한다. 
-        con.commit()  
+        #문자열을 이어 붙이지 않고 id를 매개변수로 넘긴다.
+        if self.runQuery(self.store.remove, self.id):
+            #리프레시
+            self.getProduct()
+
+    def runQuery(self, query, *args):
+        #숫자가 아닌 ID/가격을 입력한 경우 경고만 표시
+        try:
+            query(*args)
+            return True
+        except ValueError as e:
+            QMessageBox.warning(self, "입력 오류", str(e))
+            return False
 
     def getProduct(self):
         #검색 결과를 보여주기전에 기존 컨텐트를 삭제(헤더는 제외)
         self.tableWidget.clearContents()
 
-        cur.execute("select * from Products;") 
         #행숫자 카운트 
         row = 0 
-        for item in cur: 
-            int_as_strID = "{:10}".format(item[0])
-            int_as_strPrice = "{:10}".format(item[2])
+        for item in self.store.all(): 
+            int_as_strID = "{:10}".format(item.id)
+            int_as_strPrice = "{:10}".format(item.price)
             
             #각 열을 Item으로 생성해서 숫자를 오른쪽으로 정렬해서 출력한다. 
             itemID = QTableWidgetItem(int_as_strID) 
@@ -101,7 +104,7 @@ class Window(QMainWindow, form_class):
             self.tableWidget.setItem(row, 0, itemID)
             
             #제품명은 그대로 출력한다. 
-            self.tableWidget.setItem(row, 1, QTableWidgetItem(item[1]))
+            self.tableWidget.setItem(row, 1, QTableWidgetItem(item.name))
             
             #각 열을 Item으로 생성해서 숫자를 오른쪽으로 정렬해서 출력한다. 
             itemPrice = QTableWidgetItem(int_as_strPrice) 
@@ -1,9 +1,7 @@
 import sys
 from PyQt5.QtWidgets import *
-import urllib.request
-from bs4 import BeautifulSoup
-import webbrowser   #브라우저로 넘기는 경우 
-import re 
+#크롤링 모듈(urllib.request, bs4)과 webbrowser는 창이 빨리 뜨도록 사용할 때 import
+from keyword_matcher import KeywordMatcher, parse_keywords
 
 class Form(QMainWindow):
     def __init__(self):
@@ -36,9 +34,14 @@ class Form(QMainWindow):
         self.tableWidget.doubleClicked.connect(self.doubleClicked)
 
     def setTableWidgetData(self):
+        import urllib.request
+        from bs4 import BeautifulSoup
+
         row = 0
         #User-Agent를 조작하는 경우 
         hdr = {'User-agent':'Mozila/5.0 (compatible; MSIE 5.5; Windows NT)'}
+        #라인에디터에 쉼표로 입력된 키워드들을 한 번만 컴파일
+        matcher = KeywordMatcher(parse_keywords(self.lineEdit.text()))
         for n in range(0,5):
             #클리앙의 중고장터 주소 
             data ='https://www.clien.net/service/board/sold?&od=T31&po=' + str(n)
@@ -54,8 +57,8 @@ class Form(QMainWindow):
                 try:
                     span = item.contents[3]
                     title = item.text.strip()
-                    #라인에디터에 입력된 문자열 받아서 검색
-                    if (re.search(self.lineEdit.text(), title)):
+                    #라인에디터에 입력된 키워드들을 한 번에 검색 (비어 있으면 전체 출력)
+                    if not matcher or matcher.search(title):
                         title = title.replace("\t", "")
                         title = title.replace("\n", "")
                         print(title)
@@ -74,6 +77,8 @@ class Form(QMainWindow):
             f.close()
 
     def doubleClicked(self):
+        import webbrowser   #브라우저로 넘기는 경우
+
         url = self.tableWidget.item(self.tableWidget.currentRow(), 1).text()
         webbrowser.open(url) 
 
@@ -0,0 +1,360 @@
+"""
+breakout_engine.py
+
+블럭깨기 게임(breakout_game.py, demGame.py)의 패들/공/블럭 이동과 충돌 처리를
+화면과 분리한 헤드리스 엔진.
+
+- 고정 타임스텝: step()이 1/60초 한 틱을 진행하고, advance()는 경과 시간만큼 틱을 누적 실행
+- 블럭 충돌은 spatial_grid.SpatialGrid로 공이 걸친 칸만 검사
+- 공이 많을 때는 NumPy 배열로 모든 공을 한 번에 움직이는 VectorBalls 사용 가능
+- SDL dummy 비디오 드라이버에서 수천 프레임을 돌려 FPS를 재는 벤치마크 포함
+
+Usage:
+    python breakout_engine.py --frames 5000 --rows 40 --cols 60 --balls 200
+    python breakout_engine.py --frames 5000 --rows 40 --cols 60 --balls 2000 --numpy
+
+클래스: Body, PaddleBody, BallBody, BlockBody, VectorBalls, BreakoutEngine
+함수: benchmark
+"""
+import argparse
+import os
+import random
+import time
+from typing import List, Optional
+
+import pygame
+
+from spatial_grid import SpatialGrid
+
+TICK = 1 / 60
+BLOCK_SIZE = (75, 15)
+BLOCK_SPACING = (80, 25)
+BLOCK_TOP = 30
+PADDLE_SIZE = (100, 15)
+BALL_SIZE = 10
+
+
+class Body(pygame.sprite.Sprite):
+    """rect만 가진 헤드리스 스프라이트. 화면용 클래스는 이를 상속해 이미지를 붙임"""
+
+    def __init__(self, rect: pygame.Rect):
+        super().__init__()
+        self.rect = rect
+
+    def moved(self) -> None:
+        """엔진이 rect를 옮긴 뒤 호출 (화면용 클래스에서 dirty 표시 등에 사용)"""
+
+
+class PaddleBody(Body):
+    def __init__(self, width: int, height: int):
+        super().__init__(pygame.Rect(0, 0, *PADDLE_SIZE))
+        self.rect.center = (width // 2, height - 30)
+        self.speed = 7
+
+    def step(self, direction: int, width: int) -> None:
+        if direction < 0 and self.rect.left > 0:
+            self.rect.x -= self.speed
+            self.moved()
+        if direction > 0 and self.rect.right < width:
+            self.rect.x += self.speed
+            self.moved()
+
+
+class BallBody(Body):
+    def __init__(self, width: int, height: int, speed_x: int = 5, speed_y: int = -5):
+        super().__init__(pygame.Rect(0, 0, BALL_SIZE, BALL_SIZE))
+        self.rect.center = (width // 2, height // 2)
+        self.speed_x = speed_x
+        self.speed_y = speed_y
+
+    def step(self, width: int) -> None:
+        self.rect.x += self.speed_x
+        self.rect.y += self.speed_y
+        self.moved()
+
+        # 벽에 튕김
+        if self.rect.left <= 0 or self.rect.right >= width:
+            self.speed_x = -self.speed_x
+        if self.rect.top <= 0:
+            self.speed_y = -self.speed_y
+
+
+class BlockBody(Body):
+    def __init__(self, x: int, y: int):
+        super().__init__(pygame.Rect(x, y, *BLOCK_SIZE))
+
+
+class VectorBalls:
+    """여러 공의 위치/속도를 NumPy 배열로 보관하고 한 번에 갱신"""
+
+    def __init__(self, n: int, width: int, height: int, rng: random.Random):
+        import numpy as np
+
+        self.np = np
+        self.size = BALL_SIZE
+        self.pos = np.empty((n, 2), dtype=np.float64)
+        self.vel = np.empty((n, 2), dtype=np.float64)
+        for i in range(n):
+            self.pos[i] = (width // 2 - BALL_SIZE // 2 + rng.randint(-width // 4, width // 4), height // 2)
+            self.vel[i] = (rng.choice((-5, 5)), -5)
+
+    def __len__(self) -> int:
+        return len(self.pos)
+
+    def rect(self, i: int) -> pygame.Rect:
+        x, y = self.pos[i]
+        return pygame.Rect(int(x), int(y), self.size, self.size)
+
+    def step(self, width: int) -> None:
+        pos, vel, size = self.pos, self.vel, self.size
+        pos += vel
+        hit_x = (pos[:, 0] <= 0) | (pos[:, 0] + size >= width)
+        vel[hit_x, 0] *= -1
+        vel[pos[:, 1] <= 0, 1] *= -1
+
+    def bounce_rect(self, rect: pygame.Rect) -> None:
+        """rect와 겹치는 공의 y 속도를 반전 (패들 충돌)"""
+        pos, size = self.pos, self.size
+        overlap = (
+            (pos[:, 0] < rect.right) & (pos[:, 0] + size > rect.left)
+            & (pos[:, 1] < rect.bottom) & (pos[:, 1] + size > rect.top)
+        )
+        self.vel[overlap, 1] *= -1
+
+    def remove(self, mask) -> None:
+        keep = ~mask
+        self.pos = self.pos[keep]
+        self.vel = self.vel[keep]
+
+
+class BreakoutEngine:
+    """
+    화면 없이 동작하는 블럭깨기 게임 상태
+
+    Args:
+        rows, cols: 블럭 행/열 수 (화면 크기는 블럭 배치에 맞춰 늘어남)
+        balls: 공 개수
+        vectorized: True면 공을 NumPy 배열(VectorBalls)로 처리 (벤치마크용, 화면 렌더링 미지원)
+        endless: True면 바닥에서도 공이 튕겨 게임이 끝나지 않음 (스트레스 테스트용)
+        paddle_cls, ball_cls, block_cls: 화면용 스프라이트 클래스 (기본은 헤드리스 Body)
+    """
+
+    def __init__(
+        self,
+        width: int = 800,
+        height: int = 600,
+        rows: int = 4,
+        cols: int = 10,
+        balls: int = 1,
+        vectorized: bool = False,
+        endless: bool = False,
+        seed: Optional[int] = None,
+        paddle_cls=PaddleBody,
+        ball_cls=BallBody,
+        block_cls=BlockBody,
+    ):
+        self.width = max(width, cols * BLOCK_SPACING[0])
+        self.height = max(height, BLOCK_TOP + rows * BLOCK_SPACING[1] + 300)
+        self.endless = endless
+        self.rng = random.Random(seed)
+        self.score = 0
+        self.game_over = False
+        self.ticks = 0
+        self._accumulator = 0.0
+
+        self.paddle = paddle_cls(self.width, self.height)
+        self.paddle_group = pygame.sprite.Group(self.paddle)
+
+        self.block_group = pygame.sprite.Group()
+        for row in range(rows):
+            for col in range(cols):
+                block = block_cls(col * BLOCK_SPACING[0], row * BLOCK_SPACING[1] + BLOCK_TOP)
+                block.cell = (row, col)
+                self.block_group.add(block)
+        self.blocks_bottom = BLOCK_TOP + rows * BLOCK_SPACING[1]
+        # 블럭은 움직이지 않으므로 격자에 한 번만 등록해 두고, 공이 걸친 칸만 충돌 검사
+        self.grid = SpatialGrid(cell_size=BLOCK_SPACING[0], sprites=self.block_group)
+
+        self.vector_balls: Optional[VectorBalls] = None
+        self.ball_group = pygame.sprite.Group()
+        if vectorized:
+            import numpy as np
+
+            self.vector_balls = VectorBalls(balls, self.width, self.height, self.rng)
+            # 남은 블럭 위치 (행, 열) - 블럭과 겹치는 공을 배열 연산으로 먼저 골라냄
+            self._alive = np.ones((rows, cols), dtype=bool)
+        else:
+            for i in range(balls):
+                ball = ball_cls(self.width, self.height)
+                if i:
+                    ball.rect.x += self.rng.randint(-self.width // 4, self.width // 4)
+                    ball.speed_x = self.rng.choice((-5, 5))
+                self.ball_group.add(ball)
+
+    @property
+    def won(self) -> bool:
+        return len(self.block_group) == 0
+
+    @property
+    def ball_count(self) -> int:
+        if self.vector_balls is not None:
+            return len(self.vector_balls)
+        return len(self.ball_group)
+
+    def step(self, direction: int = 0) -> List[pygame.sprite.Sprite]:
+        """고정 타임스텝 한 틱 진행. direction: -1(왼쪽)/0/1(오른쪽). Returns 이번 틱에 깨진 블럭"""
+        if self.game_over:
+            return []
+        self.ticks += 1
+        self.paddle.step(direction, self.width)
+        if self.vector_balls is not None:
+            destroyed = self._step_vector()
+        else:
+            destroyed = self._step_sprites()
+
+        # 모든 공이 화면 밖으로 나가거나 모든 블럭 파괴됨
+        if self.ball_count == 0 or self.won:
+            self.game_over = True
+        return destroyed
+
+    def advance(self, elapsed: float, direction: int = 0, max_steps: int = 5) -> List[pygame.sprite.Sprite]:
+        """경과 시간(초)만큼 고정 틱을 실행 (프레임이 밀려도 max_steps까지만 따라잡음)"""
+        self._accumulator = min(self._accumulator + elapsed, max_steps * TICK)
+        destroyed: List[pygame.sprite.Sprite] = []
+        while self._accumulator >= TICK:
+            self._accumulator -= TICK
+            destroyed.extend(self.step(direction))
+        return destroyed
+
+    def _step_sprites(self) -> List[pygame.sprite.Sprite]:
+        destroyed: List[pygame.sprite.Sprite] = []
+        for ball in self.ball_group.sprites():
+            ball.step(self.width)
+
+            # 공이 패들과 충돌
+            if ball.rect.colliderect(self.paddle.rect):
+                ball.speed_y = -ball.speed_y
+
+            # 공이 블럭과 충돌
+            if ball.rect.top < self.blocks_bottom:
+                hit_blocks = self.grid.spritecollide(ball, True)
+                if hit_blocks:
+                    ball.speed_y = -ball.speed_y
+                    self.score += len(hit_blocks) * 10
+                    destroyed.extend(hit_blocks)
+
+            # 공이 화면 밖으로 나감
+            if self.endless and ball.rect.bottom >= self.height:
+                ball.speed_y = -abs(ball.speed_y)
+            elif ball.rect.top >= self.height:
+                ball.kill()
+        return destroyed
+
+    def _step_vector(self) -> List[pygame.sprite.Sprite]:
+        vb = self.vector_balls
+        np = vb.np
+        vb.step(self.width)
+        vb.bounce_rect(self.paddle.rect)
+
+        destroyed: List[pygame.sprite.Sprite] = []
+        # 남은 블럭과 실제로 겹치는 공만 격자 검사
+        for i in self._touching_blocks():
+            probe = Body(vb.rect(i))
+            hit_blocks = self.grid.spritecollide(probe, True)
+            if hit_blocks:
+                vb.vel[i, 1] *= -1
+                self.score += len(hit_blocks) * 10
+                for block in hit_blocks:
+                    self._alive[block.cell] = False
+                destroyed.extend(hit_blocks)
+
+        if self.endless:
+            at_bottom = vb.pos[:, 1] + vb.size >= self.height
+            vb.vel[at_bottom, 1] = -np.abs(vb.vel[at_bottom, 1])
+        else:
+            out = vb.pos[:, 1] >= self.height
+            if out.any():
+                vb.remove(out)
+        return destroyed
+
+
+    def _touching_blocks(self):
+        """남은 블럭과 겹치는 공의 인덱스 (공 네 모서리가 속한 블럭 칸만 검사)"""
+        np = self.vector_balls.np
+        size = self.vector_balls.size
+        pos = self.vector_balls.pos.astype(np.int64)
+        x, y = pos[:, 0], pos[:, 1]
+        (sx, sy), (bw, bh) = BLOCK_SPACING, BLOCK_SIZE
+        rows, cols = self._alive.shape
+        hit = np.zeros(len(x), dtype=bool)
+        for r in ((y - BLOCK_TOP) // sy, (y + size - 1 - BLOCK_TOP) // sy):
+            for c in (x // sx, (x + size - 1) // sx):
+                inside = (r >= 0) & (r < rows) & (c >= 0) & (c < cols)
+                rc, cc = np.clip(r, 0, rows - 1), np.clip(c, 0, cols - 1)
+                top, left = BLOCK_TOP + rc * sy, cc * sx
+                hit |= (
+                    inside & self._alive[rc, cc]
+                    & (x < left + bw) & (x + size > left) & (y < top + bh) & (y + size > top)
+                )
+        return np.nonzero(hit)[0]
+
+
+def benchmark(frames: int = 3000, rows: int = 40, cols: int = 60, balls: int = 100,
+              vectorized: bool = False, render: bool = False, seed: int = 1) -> dict:
+    """frames 틱을 최대한 빠르게 실행하고 측정 결과 반환 (render면 dummy 화면에 블럭/공도 그림)"""
+    pygame.init()
+    engine = BreakoutEngine(rows=rows, cols=cols, balls=balls, vectorized=vectorized, endless=True, seed=seed)
+    screen = pygame.display.set_mode((engine.width, engine.height)) if render else None
+    blocks_start = len(engine.block_group)
+
+    t0 = time.perf_counter()
+    ran = 0
+    for _ in range(frames):
+        engine.step(0)
+        ran += 1
+        if screen is not None:
+            screen.fill((0, 0, 0))
+            for block in engine.block_group:
+                screen.fill((255, 0, 0), block.rect)
+            if engine.vector_balls is not None:
+                for i in range(len(engine.vector_balls)):
+                    screen.fill((255, 255, 255), engine.vector_balls.rect(i))
+            else:
+                for ball in engine.ball_group:
+                    screen.fill((255, 255, 255), ball.rect)
+            pygame.display.update()
+        if engine.game_over:
+            break
+    elapsed = time.perf_counter() - t0
+    pygame.quit()
+    return {
+        "frames": ran,
+        "seconds": elapsed,
+        "fps": ran / elapsed if elapsed else float("inf"),
+        "blocks": blocks_start,
+        "blocks_left": len(engine.block_group),
+        "balls": balls,
+        "score": engine.score,
+    }
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="블럭깨기 엔진 헤드리스 벤치마크")
+    p.add_argument("--frames", type=int, default=3000, help="실행할 프레임(틱) 수")
+    p.add_argument("--rows", type=int, default=40, help="블럭 행 수")
+    p.add_argument("--cols", type=int, default=60, help="블럭 열 수")
+    p.add_argument("--balls", type=int, default=100, help="공 개수")
+    p.add_argument("--numpy", action="store_true", help="공 이동을 NumPy로 벡터화")
+    p.add_argument("--render", action="store_true", help="dummy 화면에 그리기까지 포함해서 측정")
+    p.add_argument("--seed", type=int, default=1, help="난수 시드")
+    args = p.parse_args(argv)
+
+    # 창 없이 실행 (pygame.init() 전에 설정해야 적용됨)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    r = benchmark(args.frames, args.rows, args.cols, args.balls, args.numpy, args.render, args.seed)
+    print(f"블럭 {r['blocks']}개, 공 {r['balls']}개: {r['frames']} 프레임 / {r['seconds']:.2f}초 = {r['fps']:.0f} FPS")
+    print(f"남은 블럭 {r['blocks_left']}개, 점수 {r['score']}")
+
+
+if __name__ == "__main__":
+    main()
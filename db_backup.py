@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+db_backup.py
+
+앱을 끄지 않고 SQLite DB(MyProduct.db, myprod.db 등)를 복사하는 온라인 백업.
+
+- sqlite3.Connection.backup()으로 pages개씩 나눠 복사하고, 단계 사이에 sleep초씩 쉬어서
+  그동안 다른 연결의 쓰기가 진행될 수 있게 합니다. (백업은 단계 사이에 잠금을 잡고 있지 않음)
+- 백업 도중 다른 연결이 원본을 수정하면 SQLite가 백업을 처음부터 다시 시작하고,
+  같은 연결로 수정한 내용은 백업에 바로 반영됩니다. 다른 연결의 쓰기가 끊이지 않아
+  max_restarts번 넘게 다시 시작되면 남은 복사를 한 단계로 끝냅니다. (그동안만 읽기 잠금)
+- compact=True면 복사본에서 VACUUM INTO를 실행해 조각난 페이지를 정리한 파일을 만듭니다.
+  (원본 DB에는 VACUUM을 하지 않으므로 운영 중인 DB를 오래 잠그지 않음)
+- 결과는 임시 파일에 만든 뒤 교체하므로 중간에 실패해도 기존 백업 파일이 망가지지 않습니다.
+
+Usage:
+    python db_backup.py MyProduct.db backup/MyProduct.db
+    python db_backup.py myprod.db backup/myprod.db --pages 256 --sleep 0.01 --compact
+
+    # 코드에서
+    pdb.backup("backup/MyProduct.db", progress=lambda done, total: print(done, total))
+
+함수: online_backup, vacuum_into
+"""
+import argparse
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class _TooManyRestarts(Exception):
+    pass
+
+
+def _tmp_path(dest_path: str) -> str:
+    return dest_path + ".part"
+
+
+def _remove(path: str) -> None:
+    for p in (path, path + "-journal", path + "-wal", path + "-shm"):
+        if os.path.exists(p):
+            os.remove(p)
+
+
+def vacuum_into(conn: sqlite3.Connection, dest_path: str) -> None:
+    """VACUUM INTO로 조각 모음된 사본 생성 (SQLite 3.27 이상, dest_path는 없어야 함)"""
+    if sqlite3.sqlite_version_info < (3, 27, 0):
+        raise RuntimeError(f"VACUUM INTO는 SQLite 3.27 이상이 필요합니다 (현재 {sqlite3.sqlite_version})")
+    conn.execute("VACUUM INTO ?", (dest_path,))
+
+
+def online_backup(
+    conn: sqlite3.Connection,
+    dest_path: str,
+    pages: int = 256,
+    sleep: float = 0.01,
+    progress: Optional[ProgressCallback] = None,
+    compact: bool = False,
+    max_restarts: int = 3,
+) -> Dict:
+    """
+    conn의 main DB를 dest_path로 백업
+
+    Args:
+        pages: 한 단계에 복사할 페이지 수 (작을수록 쓰기 연결이 자주 끼어들 수 있음)
+        sleep: 단계 사이에 쉬는 시간(초)
+        progress: progress(복사한 페이지 수, 전체 페이지 수) - 단계마다 호출
+        compact: 복사본에서 VACUUM INTO로 정리한 파일을 최종 결과로 사용
+        max_restarts: 다른 연결의 쓰기로 백업이 다시 시작된 횟수가 이를 넘으면 한 단계로 복사
+
+    Returns:
+        {"pages", "steps", "restarts", "seconds", "bytes", "compacted"}
+    """
+    if pages <= 0:
+        raise ValueError("pages는 1 이상이어야 합니다.")
+    folder = os.path.dirname(os.path.abspath(dest_path))
+    os.makedirs(folder, exist_ok=True)
+    tmp = _tmp_path(dest_path)
+    _remove(tmp)
+
+    stats = {"pages": 0, "steps": 0, "restarts": 0, "seconds": 0.0, "bytes": 0, "compacted": False}
+    t0 = time.perf_counter()
+    last_remaining = [None]
+
+    def on_step(status, remaining, total):
+        stats["steps"] += 1
+        stats["pages"] = total
+        if last_remaining[0] is not None and remaining > last_remaining[0]:
+            # 남은 페이지가 늘었다 = 다른 연결의 쓰기로 처음부터 다시 시작됨
+            stats["restarts"] += 1
+            if stats["restarts"] > max_restarts:
+                raise _TooManyRestarts()
+        last_remaining[0] = remaining
+        if progress is not None:
+            progress(total - remaining, total)
+        if remaining and sleep > 0:
+            # 다음 단계 전에 쉬는 동안 다른 연결이 쓰기를 마칠 수 있음
+            time.sleep(sleep)
+
+    target = sqlite3.connect(tmp)
+    try:
+        try:
+            conn.backup(target, pages=pages, progress=on_step)
+        except _TooManyRestarts:
+            conn.backup(target, pages=-1)
+            if progress is not None:
+                progress(stats["pages"], stats["pages"])
+    except BaseException:
+        target.close()
+        _remove(tmp)
+        raise
+    if compact:
+        packed = tmp + ".vacuum"
+        _remove(packed)
+        try:
+            vacuum_into(target, packed)
+        finally:
+            target.close()
+        os.replace(packed, tmp)
+        stats["compacted"] = True
+    else:
+        target.close()
+    os.replace(tmp, dest_path)
+
+    stats["seconds"] = time.perf_counter() - t0
+    stats["bytes"] = os.path.getsize(dest_path)
+    return stats
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="SQLite 온라인 백업 (앱 실행 중에도 가능)")
+    p.add_argument("source", help="원본 DB 파일")
+    p.add_argument("dest", help="백업 파일 경로")
+    p.add_argument("--pages", type=int, default=256, help="한 단계에 복사할 페이지 수")
+    p.add_argument("--sleep", type=float, default=0.01, help="단계 사이 대기 시간(초)")
+    p.add_argument("--compact", action="store_true", help="VACUUM INTO로 조각 모음한 사본 생성")
+    args = p.parse_args(argv)
+
+    if not os.path.exists(args.source):
+        print(f"✗ 원본 DB가 없습니다: {args.source}")
+        return
+
+    def show(done, total):
+        print(f"\r  {done:,}/{total:,} pages ({done * 100 // max(total, 1)}%)", end="", flush=True)
+
+    # 읽기 전용으로 열어 원본을 실수로 수정하지 않도록
+    src = sqlite3.connect(Path(args.source).resolve().as_uri() + "?mode=ro", uri=True)
+    try:
+        stats = online_backup(src, args.dest, args.pages, args.sleep, show, args.compact)
+    finally:
+        src.close()
+    print()
+    print(f"✓ {args.dest}: {stats['bytes']:,} bytes, {stats['pages']:,} pages, "
+          f"{stats['steps']} steps, {stats['restarts']} restarts, {stats['seconds']:.2f}s{' (compacted)' if stats['compacted'] else ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+db_metrics.py
+
+ProductDB / ProductManager의 SQLite 쿼리 시간 계측.
+
+- InstrumentedConnection/InstrumentedCursor: execute/executemany 벽시계 시간과 fetch로 받은 행 수를
+  문장(리터럴을 ?로 바꾼 형태)별로 기록
+- set_trace_callback: SQLite가 실제로 실행한 문장(암묵적 BEGIN/COMMIT, 트리거 본문 포함)의 횟수 집계
+- 느린 쿼리: slow_ms 이상 걸린 문장을 on_slow로 알리고 최근 목록을 보관
+- metrics(): 스냅샷 dict, to_prometheus(): Prometheus 텍스트 형식, to_json(): JSON 문자열
+
+Usage:
+    metrics = QueryMetrics(slow_ms=50)
+    pdb = ProductDB("MyProduct.db", metrics=metrics)
+    ...
+    print(metrics.to_prometheus())
+
+    python db_metrics.py --db MyProduct.db --format prometheus   # 예제 쿼리를 돌려 보고 출력
+
+클래스: QueryMetrics, InstrumentedConnection, InstrumentedCursor
+함수: normalize_sql, connect
+"""
+import argparse
+import bisect
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Sequence
+
+# 지연 시간 히스토그램 경계(초)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_SPACES = re.compile(r"\s+")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(sql: str, max_len: int = 200) -> str:
+    """리터럴을 ?로 바꾸고 공백을 정리해 같은 모양의 문장을 하나로 묶음 (같은 문장은 캐시에서 바로 반환)"""
+    s = _SPACES.sub(" ", sql).strip().rstrip(";").strip()
+    s = _STRING.sub("?", s)
+    s = _NUMBER.sub("?", s)
+    s = _IN_LIST.sub("(?...)", s)
+    return s if len(s) <= max_len else s[:max_len] + "…"
+
+
+class _Stat:
+    __slots__ = ("count", "errors", "rows", "seconds", "fetch_seconds", "max_seconds", "buckets")
+
+    def __init__(self, n_buckets: int):
+        self.count = 0
+        self.errors = 0
+        self.rows = 0
+        self.seconds = 0.0
+        self.fetch_seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * (n_buckets + 1)  # 마지막 칸 = +Inf
+
+
+class QueryMetrics:
+    def __init__(
+        self,
+        slow_ms: float = 100.0,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        on_slow: Optional[Callable[[str, float], None]] = None,
+        keep_slow: int = 100,
+    ):
+        """
+        Args:
+            slow_ms: 느린 쿼리 기준(밀리초)
+            buckets: 히스토그램 경계(초, 오름차순)
+            on_slow: on_slow(sql, 밀리초) - 기본은 print
+            keep_slow: 보관할 최근 느린 쿼리 수
+        """
+        self.slow_ms = slow_ms
+        self.buckets = tuple(sorted(buckets))
+        self.on_slow = on_slow or (lambda sql, ms: print(f"⚠ 느린 쿼리 {ms:.1f} ms: {sql}"))
+        self._stats: Dict[str, _Stat] = {}
+        self._backend: Dict[str, int] = {}
+        self._slow = deque(maxlen=keep_slow)
+        self._slow_total = 0
+        self._lock = threading.Lock()
+
+    def _stat(self, key: str) -> _Stat:
+        st = self._stats.get(key)
+        if st is None:
+            st = self._stats[key] = _Stat(len(self.buckets))
+        return st
+
+    def record(self, sql: str, seconds: float, rows: int = 0, error: bool = False, key: Optional[str] = None) -> None:
+        """문장 한 번 실행 기록 (key: 미리 계산한 normalize_sql(sql))"""
+        key = key or normalize_sql(sql)
+        with self._lock:
+            st = self._stat(key)
+            st.count += 1
+            st.rows += rows
+            st.seconds += seconds
+            st.max_seconds = max(st.max_seconds, seconds)
+            if error:
+                st.errors += 1
+            st.buckets[bisect.bisect_left(self.buckets, seconds)] += 1
+            slow = seconds * 1000 >= self.slow_ms
+            if slow:
+                self._slow_total += 1
+                self._slow.append({"sql": sql, "ms": seconds * 1000, "at": time.time()})
+        if slow:
+            self.on_slow(sql, seconds * 1000)
+
+    def record_fetch(self, sql: str, seconds: float, rows: int, key: Optional[str] = None) -> None:
+        """execute 이후 fetch에 걸린 시간과 받은 행 수 추가"""
+        key = key or normalize_sql(sql)
+        with self._lock:
+            st = self._stat(key)
+            st.rows += rows
+            st.fetch_seconds += seconds
+
+    def trace(self, statement: str, key: Optional[str] = None) -> None:
+        """SQLite 엔진이 실행한 문장 수 집계 (InstrumentedConnection의 trace 콜백에서 호출)"""
+        key = key or normalize_sql(statement)
+        with self._lock:
+            self._backend[key] = self._backend.get(key, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._backend.clear()
+            self._slow.clear()
+            self._slow_total = 0
+
+    def metrics(self) -> Dict:
+        """현재까지의 지표 스냅샷"""
+        with self._lock:
+            statements = {}
+            for key, st in self._stats.items():
+                cumulative = 0
+                hist = {}
+                for le, n in zip(list(self.buckets) + ["+Inf"], st.buckets):
+                    cumulative += n
+                    hist[str(le)] = cumulative
+                statements[key] = {
+                    "count": st.count,
+                    "errors": st.errors,
+                    "rows": st.rows,
+                    "total_ms": st.seconds * 1000,
+                    "mean_ms": st.seconds * 1000 / st.count if st.count else 0.0,
+                    "max_ms": st.max_seconds * 1000,
+                    "fetch_ms": st.fetch_seconds * 1000,
+                    "histogram": hist,
+                }
+            return {
+                "slow_threshold_ms": self.slow_ms,
+                "slow_total": self._slow_total,
+                "slow_recent": list(self._slow),
+                "statements": statements,
+                "backend_statements": dict(self._backend),
+            }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.metrics(), ensure_ascii=False, indent=indent)
+
+    def to_prometheus(self, prefix: str = "sqlite") -> str:
+        """Prometheus 텍스트 노출 형식"""
+        snap = self.metrics()
+
+        def label(value: str) -> str:
+            return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+        lines = [
+            f"# HELP {prefix}_query_duration_seconds Statement execute latency.",
+            f"# TYPE {prefix}_query_duration_seconds histogram",
+        ]
+        for key, st in snap["statements"].items():
+            stmt = label(key)
+            for le, n in st["histogram"].items():
+                lines.append(f'{prefix}_query_duration_seconds_bucket{{stmt="{stmt}",le="{le}"}} {n}')
+            lines.append(f'{prefix}_query_duration_seconds_sum{{stmt="{stmt}"}} {st["total_ms"] / 1000:.6f}')
+            lines.append(f'{prefix}_query_duration_seconds_count{{stmt="{stmt}"}} {st["count"]}')
+        for name, field, help_text in (
+            ("query_rows_total", "rows", "Rows fetched or affected."),
+            ("query_errors_total", "errors", "Statements that raised an error."),
+            ("query_fetch_seconds_total", "fetch_ms", "Time spent fetching rows after execute."),
+        ):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for key, st in snap["statements"].items():
+                value = st[field] / 1000 if field == "fetch_ms" else st[field]
+                lines.append(f'{prefix}_{name}{{stmt="{label(key)}"}} {value}')
+        lines.append(f"# HELP {prefix}_backend_statements_total Statements run by the SQLite engine (trace callback).")
+        lines.append(f"# TYPE {prefix}_backend_statements_total counter")
+        for key, n in snap["backend_statements"].items():
+            lines.append(f'{prefix}_backend_statements_total{{stmt="{label(key)}"}} {n}')
+        lines.append(f"# HELP {prefix}_slow_queries_total Statements slower than {snap['slow_threshold_ms']} ms.")
+        lines.append(f"# TYPE {prefix}_slow_queries_total counter")
+        lines.append(f"{prefix}_slow_queries_total {snap['slow_total']}")
+        return "\n".join(lines) + "\n"
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """execute/executemany 시간과 fetch 행 수를 연결의 QueryMetrics에 기록하는 커서
+
+    문장 키(normalize_sql)는 execute마다 한 번만 계산해 두고, 행 단위 순회(__next__)는
+    커서 안에서 세었다가 다 읽었을 때/다음 execute/close 때 한 번에 기록합니다.
+    """
+
+    _key = None
+    _rows = 0
+    _fetch_seconds = 0.0
+
+    def _metrics(self) -> Optional[QueryMetrics]:
+        return getattr(self.connection, "metrics", None)
+
+    def _flush(self) -> None:
+        if self._rows or self._fetch_seconds:
+            m = self._metrics()
+            if m is not None and self._key:
+                m.record_fetch("", self._fetch_seconds, self._rows, key=self._key)
+            self._rows = 0
+            self._fetch_seconds = 0.0
+
+    def _run(self, method, sql, arg):
+        m = self._metrics()
+        if m is None:
+            return method(sql, arg)
+        self._flush()
+        key = self._key = normalize_sql(sql)
+        conn = self.connection
+        # 이 문장이 도는 동안 trace 콜백은 문장을 다시 정규화하지 않고 이 키로 센다
+        conn._trace_key = key
+        t0 = time.perf_counter()
+        try:
+            method(sql, arg)
+        except sqlite3.Error:
+            m.record(sql, time.perf_counter() - t0, error=True, key=key)
+            raise
+        finally:
+            conn._trace_key = None
+        elapsed = time.perf_counter() - t0
+        # SELECT가 아니면 영향받은 행 수를 기록
+        m.record(sql, elapsed, rows=max(self.rowcount, 0) if self.description is None else 0, key=key)
+        return self
+
+    def execute(self, sql, parameters=()):
+        return self._run(super().execute, sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self._run(super().executemany, sql, seq_of_parameters)
+
+    def _fetched(self, t0: float, rows: int) -> None:
+        m = self._metrics()
+        if m is not None and self._key:
+            m.record_fetch("", time.perf_counter() - t0, rows, key=self._key)
+
+    def fetchone(self):
+        t0 = time.perf_counter()
+        row = super().fetchone()
+        self._fetched(t0, 0 if row is None else 1)
+        return row
+
+    def fetchmany(self, size=None):
+        t0 = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._fetched(t0, len(rows))
+        return rows
+
+    def fetchall(self):
+        t0 = time.perf_counter()
+        rows = super().fetchall()
+        self._fetched(t0, len(rows))
+        return rows
+
+    def __next__(self):
+        t0 = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._flush()
+            raise
+        self._fetch_seconds += time.perf_counter() - t0
+        self._rows += 1
+        return row
+
+    def close(self):
+        self._flush()
+        super().close()
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """cursor()와 execute 단축 메서드가 모두 InstrumentedCursor를 쓰는 연결"""
+
+    metrics: Optional[QueryMetrics] = None
+    _trace_key: Optional[str] = None
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def _trace(self, statement: str) -> None:
+        # executemany는 행마다 (값이 채워진) 문장으로 호출되므로 실행 중인 문장의 키를 그대로 사용
+        # (sqlite3 모듈이 문장 앞에 넣는 암묵적 BEGIN은 따로 셈)
+        key = self._trace_key
+        if key is not None and statement.startswith("BEGIN"):
+            key = None
+        self.metrics.trace(statement, key=key)
+
+
+def connect(database: str, metrics: QueryMetrics, **kwargs) -> InstrumentedConnection:
+    """계측 연결 생성 (sqlite3.connect와 같은 인자)"""
+    conn = sqlite3.connect(database, factory=InstrumentedConnection, **kwargs)
+    conn.metrics = metrics
+    conn.set_trace_callback(conn._trace)
+    return conn
+
+
+def main(argv=None):
+    from product_db import ProductDB
+
+    p = argparse.ArgumentParser(description="ProductDB 쿼리 계측 예제")
+    p.add_argument("--db", default="MyProduct.db", help="Database file path (default: MyProduct.db)")
+    p.add_argument("--slow-ms", type=float, default=50.0, help="느린 쿼리 기준(밀리초)")
+    p.add_argument("--format", choices=["prometheus", "json"], default="prometheus", help="출력 형식")
+    args = p.parse_args(argv)
+
+    metrics = QueryMetrics(slow_ms=args.slow_ms)
+    pdb = ProductDB(db_path=args.db, metrics=metrics)
+    pdb.create_table()
+    total = pdb.count_products()
+    for product_id in range(1, 101):
+        pdb.get_product(product_id)
+    pdb.select_all(limit=1000, offset=max(total - 1000, 0))
+    sum(1 for _ in pdb.iter_products())
+    pdb.close()
+    print(metrics.to_prometheus() if args.format == "prometheus" else metrics.to_json())
+
+
+if __name__ == "__main__":
+    main()
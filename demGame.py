@@ -1,6 +1,7 @@
 import pygame
 import random
 import sys
+from breakout_engine import BallBody, BlockBody, BreakoutEngine, PaddleBody
 
 # 초기화
 pygame.init()
@@ -19,121 +20,117 @@ RED = (255, 0, 0)
 BLUE = (0, 0, 255)
 GREEN = (0, 255, 0)
 
-# 패들 클래스
-class Paddle(pygame.sprite.Sprite):
-    def __init__(self):
-        super().__init__()
-        self.image = pygame.Surface((100, 15))
-        self.image.fill(BLUE)
-        self.rect = self.image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
-        self.speed = 7
-
-    def update(self):
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT] and self.rect.left > 0:
-            self.rect.x -= self.speed
-        if keys[pygame.K_RIGHT] and self.rect.right < SCREEN_WIDTH:
-            self.rect.x += self.speed
+# 배경 (지워진 영역을 다시 칠할 때 사용)
+background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+background.fill(BLACK)
+
+def solid_surface(size, color):
+    """단색 Surface를 화면 픽셀 형식으로 한 번만 변환해서 반환"""
+    surface = pygame.Surface(size).convert()
+    surface.fill(color)
+    return surface
+
+# 모든 블럭이 같은 이미지를 공유 (블럭마다 Surface를 만들지 않음)
+BLOCK_IMAGE = solid_surface((75, 15), RED)
+
+# 패들 클래스 - 이동은 엔진(PaddleBody)이 처리하고 여기서는 이미지만 붙임
+class Paddle(PaddleBody, pygame.sprite.DirtySprite):
+    def __init__(self, width, height):
+        super().__init__(width, height)
+        self.image = solid_surface(self.rect.size, BLUE)
+
+    def moved(self):
+        self.dirty = 1
 
 # 공 클래스
-class Ball(pygame.sprite.Sprite):
-    def __init__(self):
-        super().__init__()
-        self.image = pygame.Surface((10, 10))
-        self.image.fill(WHITE)
-        self.rect = self.image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.speed_x = 5
-        self.speed_y = -5
-
-    def update(self):
-        self.rect.x += self.speed_x
-        self.rect.y += self.speed_y
-
-        # 벽에 튕김
-        if self.rect.left <= 0 or self.rect.right >= SCREEN_WIDTH:
-            self.speed_x = -self.speed_x
-        if self.rect.top <= 0:
-            self.speed_y = -self.speed_y
-        
-        # 게임오버
-        if self.rect.top >= SCREEN_HEIGHT:
-            return False
-        return True
+class Ball(BallBody, pygame.sprite.DirtySprite):
+    def __init__(self, width, height):
+        super().__init__(width, height)
+        self.image = solid_surface(self.rect.size, WHITE)
+
+    def moved(self):
+        self.dirty = 1
 
 # 블럭 클래스
-class Block(pygame.sprite.Sprite):
+class Block(BlockBody, pygame.sprite.DirtySprite):
     def __init__(self, x, y):
-        super().__init__()
-        self.image = pygame.Surface((75, 15))
-        self.image.fill(RED)
-        self.rect = self.image.get_rect(topleft=(x, y))
-
-# 스프라이트 그룹
-paddle_group = pygame.sprite.Group(Paddle())
-ball_group = pygame.sprite.Group(Ball())
-block_group = pygame.sprite.Group()
+        super().__init__(x, y)
+        self.image = BLOCK_IMAGE
 
-# 블럭 생성
-for row in range(4):
-    for col in range(10):
-        block_group.add(Block(col * 80, row * 25 + 30))
+# 글자 스프라이트 - 내용이 바뀔 때만 다시 렌더링
+class TextSprite(pygame.sprite.DirtySprite):
+    def __init__(self, font, pos):
+        super().__init__()
+        self.font = font
+        self.pos = pos
+        self.text = None
+        self.color = None
+        self.image = pygame.Surface((0, 0))
+        self.rect = self.image.get_rect(topleft=pos)
+        self.visible = 0
+
+    def set_text(self, text, color):
+        if text == self.text and color == self.color:
+            return
+        self.text = text
+        self.color = color
+        # 배경 없이 렌더링해서(투명) 아래 블럭을 가리지 않음
+        self.image = self.font.render(text, True, color).convert_alpha()
+        # 이전 글자 영역은 LayeredDirty가 배경으로 지우고 겹친 스프라이트를 다시 그림
+        self.rect = self.image.get_rect(topleft=self.pos)
+        self.visible = 1
+        self.dirty = 1
+
+# 게임 상태(이동/충돌/점수)는 헤드리스 엔진이 고정 타임스텝으로 진행
+engine = BreakoutEngine(SCREEN_WIDTH, SCREEN_HEIGHT, paddle_cls=Paddle, ball_cls=Ball, block_cls=Block)
+paddle_group = engine.paddle_group
+ball_group = engine.ball_group
+block_group = engine.block_group
 
-score = 0
 font = pygame.font.Font(None, 36)
 game_over = False
 
+# 점수/종료 문구는 값이 바뀔 때만 다시 렌더링
+score_sprite = TextSprite(font, (10, 10))
+score_sprite.set_text(f"Score: {engine.score}", WHITE)
+end_sprite = TextSprite(font, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2))
+
+# 움직이거나 바뀐 스프라이트 영역만 다시 그리는 렌더링 그룹
+render_group = pygame.sprite.LayeredDirty()
+render_group.add(block_group.sprites(), layer=0)
+render_group.add(paddle_group.sprites(), ball_group.sprites(), layer=1)
+render_group.add(score_sprite, end_sprite, layer=2)
+render_group.clear(screen, background)
+screen.blit(background, (0, 0))
+pygame.display.flip()
+
 # 게임 루프
 running = True
 while running:
-    clock.tick(60)
-    
+    elapsed = clock.tick(60) / 1000
+
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
 
-    if not game_over:
-        paddle_group.update()
-        ball_group.update()
-        
-        ball = ball_group.sprites()[0]
-        paddle = paddle_group.sprites()[0]
-
-        # 공이 패들과 충돌
-        if pygame.sprite.spritecollide(ball, paddle_group, False):
-            ball.speed_y = -ball.speed_y
-
-        # 공이 블럭과 충돌
-        hit_blocks = pygame.sprite.spritecollide(ball, block_group, True)
-        if hit_blocks:
-            ball.speed_y = -ball.speed_y
-            score += len(hit_blocks) * 10
-
-        # 공이 화면 밖으로 나감
-        if ball.rect.top >= SCREEN_HEIGHT:
-            game_over = True
-
-        # 모든 블럭 파괴됨
-        if len(block_group) == 0:
-            game_over = True
-
-    # 화면 그리기
-    screen.fill(BLACK)
-    paddle_group.draw(screen)
-    ball_group.draw(screen)
-    block_group.draw(screen)
-
-    # 점수 표시
-    score_text = font.render(f"Score: {score}", True, WHITE)
-    screen.blit(score_text, (10, 10))
+    keys = pygame.key.get_pressed()
+    direction = keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]
+    # 깨진 블럭과 나간 공은 엔진이 kill()하므로 렌더링 그룹에서도 함께 빠짐
+    engine.advance(elapsed, direction)
+    game_over = engine.game_over
+
+    # 점수 표시 (점수가 바뀐 경우에만 다시 렌더링됨)
+    score_sprite.set_text(f"Score: {engine.score}", WHITE)
 
     if game_over:
-        if len(block_group) == 0:
-            end_text = font.render("You Win!", True, GREEN)
+        if engine.won:
+            end_sprite.set_text("You Win!", GREEN)
         else:
-            end_text = font.render("Game Over!", True, RED)
-        screen.blit(end_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2))
+            end_sprite.set_text("Game Over!", RED)
 
-    pygame.display.flip()
+    # 화면 그리기 - 바뀐 영역만 갱신
+    dirty_rects = render_group.draw(screen)
+    pygame.display.update(dirty_rects)
 
 pygame.quit()
 sys.exit()
\ No newline at end of file
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+driver_pool.py
+
+Selenium 스크립트에서 재사용하는 크롬 웹드라이버 풀.
+
+브라우저 실행 비용이 작업 시간 대부분을 차지하므로, 헤드리스 세션을 미리 띄워 두고
+작업마다 빌려주고 돌려받습니다. 고정 time.sleep 대신 WebDriverWait 조건으로 기다리는
+헬퍼와, 필요 없는 페이지에서 이미지/폰트 로딩을 막는 옵션을 제공합니다.
+
+Usage:
+    python driver_pool.py --size 2 --runs 10        # web_study/index.html로 오프라인 확인
+    python driver_pool.py --url https://www.naver.com --block-images
+
+클래스 메서드: warm_up, acquire, map, close
+함수: wait_for, wait_clickable, wait_count_above, file_url
+"""
+import argparse
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from selenium import webdriver
+from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+FONT_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+
+# 세션을 버려 자리가 비었음을 기다리는 acquire()에 알리는 표시
+_FREE_SLOT = object()
+
+
+def file_url(path: str) -> str:
+    """로컬 파일 경로를 file:// URL로 변환 (예: web_study/index.html)"""
+    return "file:///" + os.path.abspath(path).replace("\\", "/").lstrip("/")
+
+
+def wait_for(driver, locator: Tuple[str, str], timeout: float = 10):
+    """locator 요소가 DOM에 나타날 때까지 기다린 뒤 반환"""
+    return WebDriverWait(driver, timeout).until(EC.presence_of_element_located(locator))
+
+
+def wait_clickable(driver, locator: Tuple[str, str], timeout: float = 10):
+    """locator 요소가 클릭 가능해질 때까지 기다린 뒤 반환"""
+    return WebDriverWait(driver, timeout).until(EC.element_to_be_clickable(locator))
+
+
+def wait_count_above(driver, css: str, count: int, timeout: float = 10) -> bool:
+    """css 선택자에 맞는 요소 수가 count보다 많아지면 True, 시간 초과면 False"""
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: len(d.find_elements(By.CSS_SELECTOR, css)) > count
+        )
+        return True
+    except WebDriverException:
+        return False
+
+
+class DriverPool:
+    """미리 띄운 크롬 세션을 작업마다 빌려주는 풀"""
+
+    def __init__(
+        self,
+        size: int = 2,
+        headless: bool = True,
+        block_images: bool = False,
+        block_fonts: bool = False,
+        page_load_strategy: str = "eager",
+    ):
+        self.size = size
+        self.headless = headless
+        self.block_images = block_images
+        self.block_fonts = block_fonts
+        self.page_load_strategy = page_load_strategy
+        self._idle: "queue.Queue" = queue.Queue()
+        self._all: List = []
+        # 생성 중인 세션 수 (_all에 들어가기 전까지 자리를 잡아 둠)
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _options(self) -> webdriver.ChromeOptions:
+        opts = webdriver.ChromeOptions()
+        if self.headless:
+            opts.add_argument("--headless=new")
+        opts.add_argument("--disable-gpu")
+        opts.add_argument("--no-sandbox")
+        opts.add_argument("--disable-dev-shm-usage")
+        opts.add_argument("--allow-file-access-from-files")
+        # DOMContentLoaded까지만 기다림 (이미지 등 나머지는 WebDriverWait 조건으로 처리)
+        opts.page_load_strategy = self.page_load_strategy
+        if self.block_images:
+            opts.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        return opts
+
+    def _create(self):
+        driver = webdriver.Chrome(options=self._options())
+        if self.block_fonts:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": FONT_PATTERNS})
+        with self._lock:
+            self._all.append(driver)
+        return driver
+
+    def _try_create(self):
+        """풀에 빈자리가 있으면 lock 안에서 자리를 잡고 세션 생성, 없으면 None"""
+        with self._lock:
+            if len(self._all) + self._pending >= self.size:
+                return None
+            self._pending += 1
+        try:
+            return self._create()
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _discard(self, driver) -> None:
+        with self._lock:
+            if driver in self._all:
+                self._all.remove(driver)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+        if not self._closed:
+            # 빈자리가 생겼으므로 기다리는 acquire()가 새 세션을 만들 수 있게 깨움
+            self._idle.put(_FREE_SLOT)
+
+    def warm_up(self) -> None:
+        """size개의 세션을 미리 띄워 둠"""
+        while True:
+            driver = self._try_create()
+            if driver is None:
+                break
+            self._idle.put(driver)
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator:
+        """with pool.acquire() as driver: 형태로 세션을 빌려 씀"""
+        if self._closed:
+            raise RuntimeError("DriverPool이 이미 종료되었습니다.")
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = self._try_create()
+                if driver is None:
+                    driver = self._idle.get(timeout=timeout)
+            if driver is not _FREE_SLOT:
+                break
+            # 버려진 세션 자리 - 다시 돌아가 새로 만들거나 돌려받은 세션을 기다림
+
+        # TimeoutException/NoSuchElementException 같은 작업 오류는 세션을 그대로 돌려받고,
+        # 세션이 끊긴 경우나 아래 초기화(상태 확인)에 실패한 경우에만 버림
+        healthy = True
+        try:
+            yield driver
+        except InvalidSessionIdException:
+            healthy = False
+            raise
+        finally:
+            if healthy and not self._closed:
+                try:
+                    # 다음 작업에 상태가 남지 않도록 빈 페이지로 초기화
+                    driver.delete_all_cookies()
+                    driver.get("about:blank")
+                except WebDriverException:
+                    healthy = False
+            if healthy and not self._closed:
+                self._idle.put(driver)
+            else:
+                self._discard(driver)
+
+    def map(self, func: Callable, items: Iterable) -> List:
+        """items마다 func(driver, item)을 풀 크기만큼 동시에 실행하고 결과를 순서대로 반환"""
+        def run(item):
+            with self.acquire() as driver:
+                return func(driver, item)
+
+        with ThreadPoolExecutor(max_workers=self.size) as ex:
+            return list(ex.map(run, items))
+
+    def close(self) -> None:
+        self._closed = True
+        with self._lock:
+            drivers = list(self._all)
+            self._all.clear()
+        for d in drivers:
+            try:
+                d.quit()
+            except WebDriverException:
+                pass
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="웹드라이버 풀 동작 확인 (기본: 로컬 web_study/index.html)")
+    p.add_argument("--url", default=None, help="열어볼 URL (기본: web_study/index.html)")
+    p.add_argument("--size", type=int, default=2, help="풀 크기")
+    p.add_argument("--runs", type=int, default=6, help="작업 횟수")
+    p.add_argument("--wait-css", default="body", help="로딩 완료로 판단할 CSS 선택자")
+    p.add_argument("--block-images", action="store_true", help="이미지 로딩 차단")
+    p.add_argument("--block-fonts", action="store_true", help="웹폰트 로딩 차단")
+    args = p.parse_args(argv)
+
+    url = args.url or file_url(os.path.join(os.path.dirname(os.path.abspath(__file__)), "web_study", "index.html"))
+
+    def task(driver, i):
+        driver.get(url)
+        wait_for(driver, (By.CSS_SELECTOR, args.wait_css))
+        return driver.title
+
+    with DriverPool(size=args.size, block_images=args.block_images, block_fonts=args.block_fonts) as pool:
+        t0 = time.time()
+        pool.warm_up()
+        t1 = time.time()
+        titles = pool.map(task, range(args.runs))
+        t2 = time.time()
+    print(f"세션 {args.size}개 준비: {t1 - t0:.2f}초, 작업 {args.runs}회: {t2 - t1:.2f}초")
+    print(f"페이지 제목: {titles[0] if titles else ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+duplicate_finder.py
+
+내용이 같은 파일(중복) 찾기.
+
+1) 크기로 묶고 → 2) 앞/뒤 블록만 읽은 부분 해시로 다시 묶고 → 3) 남은 후보만 전체 해시
+순서로 좁혀 가므로 대부분의 파일은 끝까지 읽지 않습니다. 전체 해시는 청크 단위로 읽으며
+여러 프로세스(코어)에서 병렬로 계산합니다. 계산한 해시는 (장치, inode, mtime, 크기)를 키로
+SQLite 캐시에 저장해 두므로 다시 실행할 때는 바뀐 파일만 읽습니다.
+
+Usage:
+    python duplicate_finder.py D:/Downloads                  # 중복 보고
+    python duplicate_finder.py D:/Downloads --action link    # 하드 링크로 합치기
+    python duplicate_finder.py D:/Downloads --action remove  # 중복본 삭제
+
+클래스: HashCache
+함수: find_duplicates, dedupe, iter_tree
+"""
+import argparse
+import hashlib
+import os
+import sqlite3
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+BLOCK_SIZE = 64 * 1024
+CHUNK_SIZE = 1024 * 1024
+CACHE_NAME = ".dup_hash_cache.db"
+
+
+def partial_hash(path: str, size: int) -> str:
+    """첫 블록과 마지막 블록만 읽은 해시"""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        h.update(f.read(BLOCK_SIZE))
+        if size > BLOCK_SIZE:
+            f.seek(max(BLOCK_SIZE, size - BLOCK_SIZE))
+            h.update(f.read(BLOCK_SIZE))
+    return h.hexdigest()
+
+
+def full_hash(path: str) -> str:
+    """파일 전체를 CHUNK_SIZE씩 읽으며 계산한 SHA-256"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _full_hash_job(path: str) -> Tuple[str, Optional[str]]:
+    try:
+        return path, full_hash(path)
+    except OSError:
+        return path, None
+
+
+class HashCache:
+    """(dev, inode) → (mtime_ns, size, partial, full) SQLite 캐시"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS Hashes (
+                dev INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                partial TEXT,
+                full TEXT,
+                PRIMARY KEY (dev, inode)
+            )
+            """
+        )
+        self.conn.commit()
+
+    def get(self, st: os.stat_result) -> Tuple[Optional[str], Optional[str]]:
+        row = self.conn.execute(
+            "SELECT partial, full FROM Hashes WHERE dev = ? AND inode = ? AND mtime_ns = ? AND size = ?",
+            (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size),
+        ).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+    def put(self, st: os.stat_result, partial: Optional[str], full: Optional[str]) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO Hashes (dev, inode, mtime_ns, size, partial, full) VALUES (?, ?, ?, ?, ?, ?)",
+            (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size, partial, full),
+        )
+
+    def commit(self) -> None:
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.commit()
+        self.conn.close()
+
+
+def iter_tree(root: str, skip_names: Iterable[str] = (CACHE_NAME,)) -> Iterable[str]:
+    """root 아래 모든 일반 파일 경로 (심볼릭 링크는 제외)"""
+    skip = set(skip_names)
+    stack = [root]
+    while stack:
+        d = stack.pop()
+        with os.scandir(d) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and entry.name not in skip:
+                    yield entry.path
+
+
+def find_duplicates(paths: Iterable[str], cache: Optional[HashCache] = None, workers: Optional[int] = None) -> List[List[str]]:
+    """
+    내용이 같은 파일 그룹 목록 반환 (각 그룹은 2개 이상, 빈 파일은 제외)
+
+    이미 하드 링크로 연결된 경로(같은 inode)도 같은 그룹에 포함됩니다.
+    """
+    stats: Dict[str, os.stat_result] = {}
+    by_size: Dict[int, List[str]] = defaultdict(list)
+    for p in paths:
+        try:
+            st = os.stat(p)
+        except OSError:
+            continue
+        if st.st_size == 0:
+            continue
+        stats[p] = st
+        by_size[st.st_size].append(p)
+
+    # 1) 크기가 같은 파일이 있는 경우만 → 2) 부분 해시
+    by_partial: Dict[Tuple[int, str], List[str]] = defaultdict(list)
+    partials: Dict[str, str] = {}
+    fulls: Dict[str, Optional[str]] = {}
+    for size, group in by_size.items():
+        if len(group) < 2:
+            continue
+        for p in group:
+            partial, full = cache.get(stats[p]) if cache else (None, None)
+            if partial is None:
+                try:
+                    partial = partial_hash(p, size)
+                except OSError:
+                    continue
+                if cache:
+                    cache.put(stats[p], partial, None)
+            partials[p] = partial
+            if full is not None:
+                fulls[p] = full
+            by_partial[(size, partial)].append(p)
+
+    # 3) 부분 해시까지 같은 후보만 전체 해시 (캐시에 없는 것만 프로세스 풀에서 계산)
+    candidates = [g for g in by_partial.values() if len(g) >= 2]
+    todo = [p for g in candidates for p in g if p not in fulls]
+    # 같은 inode는 한 번만 읽음
+    inode_first: Dict[Tuple[int, int], str] = {}
+    unique_todo = []
+    for p in todo:
+        key = (stats[p].st_dev, stats[p].st_ino)
+        if key not in inode_first:
+            inode_first[key] = p
+            unique_todo.append(p)
+    if unique_todo:
+        if len(unique_todo) == 1 or workers == 1:
+            results = list(map(_full_hash_job, unique_todo))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_full_hash_job, unique_todo, chunksize=8))
+        for p, digest in results:
+            fulls[p] = digest
+    for p in todo:
+        if p not in fulls:
+            fulls[p] = fulls.get(inode_first[(stats[p].st_dev, stats[p].st_ino)])
+
+    if cache:
+        for g in candidates:
+            for p in g:
+                if fulls.get(p):
+                    cache.put(stats[p], partials[p], fulls[p])
+        cache.commit()
+
+    groups: Dict[str, List[str]] = defaultdict(list)
+    for g in candidates:
+        for p in g:
+            if fulls.get(p):
+                groups[fulls[p]].append(p)
+    return [sorted(g) for g in groups.values() if len(g) >= 2]
+
+
+def dedupe(groups: List[List[str]], action: str = "report", keep: Optional[Callable[[List[str]], str]] = None) -> Tuple[int, int]:
+    """
+    중복 그룹 처리
+
+    Args:
+        action: "report"(출력만), "link"(원본으로 하드 링크), "remove"(중복본 삭제)
+        keep: 그룹에서 남길 원본을 고르는 함수 (기본: 수정 시각이 가장 오래된 파일)
+
+    Returns:
+        (처리한 파일 수, 절약한 바이트)
+    """
+    keep = keep or (lambda g: min(g, key=lambda p: (os.stat(p).st_mtime_ns, p)))
+    handled = 0
+    saved = 0
+    for group in groups:
+        original = keep(group)
+        ost = os.stat(original)
+        print(f"✓ 원본: {original}")
+        for p in group:
+            if p == original:
+                continue
+            st = os.stat(p)
+            already_linked = (st.st_dev, st.st_ino) == (ost.st_dev, ost.st_ino)
+            print(f"  ⊘ 중복: {p}{' (이미 하드 링크)' if already_linked else ''}")
+            if action == "report" or (action == "link" and already_linked):
+                continue
+            try:
+                if action == "remove":
+                    os.remove(p)
+                elif action == "link":
+                    tmp = p + ".duplink"
+                    os.link(original, tmp)
+                    os.replace(tmp, p)
+            except OSError as e:
+                print(f"  ✗ 처리 실패 ({p}): {e}")
+                continue
+            handled += 1
+            if not already_linked:
+                saved += st.st_size
+    return handled, saved
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="내용이 같은 중복 파일 찾기")
+    p.add_argument("root", help="검사할 폴더")
+    p.add_argument("--action", choices=["report", "link", "remove"], default="report", help="중복 처리 방법")
+    p.add_argument("--workers", type=int, default=None, help="전체 해시 계산 프로세스 수 (기본: CPU 수)")
+    p.add_argument("--no-cache", action="store_true", help="해시 캐시 사용 안 함")
+    args = p.parse_args(argv)
+
+    cache = None if args.no_cache else HashCache(os.path.join(args.root, CACHE_NAME))
+    try:
+        groups = find_duplicates(iter_tree(args.root), cache=cache, workers=args.workers)
+    finally:
+        if cache:
+            cache.close()
+    handled, saved = dedupe(groups, args.action)
+    print(f"\n중복 그룹 {len(groups)}개, 처리 {handled}개, 절약 {saved:,} bytes")
+
+
+if __name__ == "__main__":
+    main()
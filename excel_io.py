@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+excel_io.py
+
+대용량 Products 테이블을 엑셀로 내보내고/가져오는 스트리밍 입출력 모듈.
+
+- 내보내기: Workbook(write_only=True) 스트리밍 시트에 DB 커서에서 청크 단위로 받은 행을 바로 기록
+- 가져오기: load_workbook(read_only=True) + iter_rows(values_only=True)로 행을 읽어 청크 단위로 삽입
+메모리 사용량은 행 수와 무관하게 일정하고, 처리 시간은 행 수에 비례합니다.
+
+ProductDB(product_db.py)와 ProductManager(product_manager.py) 모두 사용할 수 있습니다.
+
+Usage:
+    python excel_io.py export --db MyProduct.db --xlsx products.xlsx
+    python excel_io.py import --db MyProduct.db --xlsx products.xlsx
+
+함수: write_rows, write_block, iter_rows, iter_chunks, filter_rows, export_products, import_products
+"""
+import argparse
+import time
+from itertools import islice
+from typing import Callable, Collection, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell.cell import Cell, WriteOnlyCell
+from openpyxl.styles.numbers import BUILTIN_FORMATS_MAX_SIZE, BUILTIN_FORMATS_REVERSE
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.utils.cell import coordinate_to_tuple
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+
+PRODUCT_HEADER = ["productID", "productName", "productPrice"]
+
+
+def iter_chunks(rows: Iterable, chunk_size: int) -> Iterator[List]:
+    """rows를 chunk_size개씩 리스트로 묶어 생성"""
+    it = iter(rows)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_rows(path: str, rows: Iterable[Sequence], header: Optional[Sequence] = None, sheet_title: str = "Sheet") -> int:
+    """write_only 워크북에 rows를 스트리밍으로 기록. Returns 기록한 데이터 행 수"""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=sheet_title)
+    if header:
+        ws.append(list(header))
+    n = 0
+    for row in rows:
+        ws.append(row)
+        n += 1
+    wb.save(path)
+    return n
+
+
+def _has_fast_internals(ws) -> bool:
+    """write_block의 빠른 경로가 쓰는 openpyxl 내부 속성이 있는지 확인
+
+    requirements.txt의 openpyxl==3.1.5 기준 구현이므로, 다른 버전에서 속성이 없으면
+    공개 API(ws.cell, cell.number_format)로 기록합니다.
+    """
+    if not hasattr(ws.parent, "_number_formats"):
+        return False
+    if isinstance(ws, WriteOnlyWorksheet):
+        # WriteOnlyCell은 Cell을 돌려주는 함수
+        return hasattr(Cell, "_style")
+    return isinstance(getattr(ws, "_cells", None), dict) and hasattr(ws, "_current_row")
+
+
+def _number_format_style(wb, fmt: Optional[str]) -> Optional[StyleArray]:
+    """표시 형식 문자열을 워크북에 한 번만 등록하고 셀에 복사해 줄 StyleArray 반환"""
+    if not fmt:
+        return None
+    if fmt in BUILTIN_FORMATS_REVERSE:
+        idx = BUILTIN_FORMATS_REVERSE[fmt]
+    else:
+        idx = wb._number_formats.add(fmt) + BUILTIN_FORMATS_MAX_SIZE
+    style = StyleArray()
+    style.numFmtId = idx
+    return style
+
+
+def _block_rows(data) -> Tuple[Optional[List], List[List]]:
+    """list of lists / NumPy 배열 / DataFrame을 (헤더, 파이썬 값 2차원 리스트)로 변환"""
+    if hasattr(data, "columns") and hasattr(data, "to_numpy"):
+        # DataFrame: NaN/NaT는 빈 셀로
+        header = [str(c) for c in data.columns]
+        values = data.astype(object).where(data.notna(), None).to_numpy().tolist()
+        return header, values
+    if hasattr(data, "tolist") and hasattr(data, "ndim"):
+        # NumPy 배열: tolist()가 numpy 스칼라를 파이썬 값으로 한 번에 변환
+        values = data.tolist()
+        if data.ndim == 1:
+            values = [[v] for v in values]
+        return None, values
+    return None, [list(r) for r in data]
+
+
+def write_block(
+    ws,
+    data,
+    top_left: str = "A1",
+    number_formats: Union[None, str, Sequence[Optional[str]], Dict[Union[int, str], str]] = None,
+    header: bool = False,
+) -> Tuple[int, int]:
+    """
+    2차원 데이터(list of lists, NumPy 배열, DataFrame)를 top_left부터 한 번에 기록
+
+    ws.cell()을 셀마다 호출하는 대신 Cell 객체를 직접 만들어 시트에 넣고,
+    표시 형식은 열마다 한 번만 계산한 StyleArray를 복사해 쓰므로 셀마다 스타일 객체를 만들지 않습니다.
+    write_only 시트에서는 top_left의 열 위치만 반영해 행을 이어서 append합니다.
+    값이 None인 칸은 기존 셀의 값을 비웁니다. (기존 범위를 덮어쓸 때 이전 값이 남지 않음)
+    이미 있는 셀은 값/표시 형식만 바꾸고 글꼴·테두리·채우기는 유지하며, 병합된 셀의 안쪽과 겹치면 ValueError.
+
+    Args:
+        number_formats: 모든 열에 같은 형식(str), 열 순서대로의 목록, 또는 {열 번호(0부터)/헤더명: 형식}
+        header: DataFrame의 열 이름을 첫 행으로 기록할지 여부
+
+    Returns:
+        (기록한 행 수, 열 수)
+    """
+    cols, values = _block_rows(data)
+    if header and cols is not None:
+        values = [cols] + values
+    if not values:
+        return 0, 0
+    width = max(len(r) for r in values)
+    row0, col0 = coordinate_to_tuple(top_left)
+
+    if isinstance(number_formats, str):
+        formats = [number_formats] * width
+    elif isinstance(number_formats, dict):
+        formats = [None] * width
+        for key, fmt in number_formats.items():
+            if isinstance(key, str):
+                if cols is None or key not in cols:
+                    raise KeyError(f"number_formats의 열 {key!r}이(가) 헤더에 없습니다: {cols}")
+                idx = cols.index(key)
+            else:
+                idx = key
+            if isinstance(idx, int) and 0 <= idx < width:
+                formats[idx] = fmt
+    elif number_formats:
+        formats = list(number_formats) + [None] * (width - len(number_formats))
+    else:
+        formats = [None] * width
+    # 헤더 행에는 표시 형식을 적용하지 않음
+    first_data = 1 if header and cols is not None else 0
+    if not isinstance(ws, WriteOnlyWorksheet):
+        _check_merged(ws, row0, col0, row0 + len(values) - 1, col0 + width - 1)
+
+    if not _has_fast_internals(ws):
+        return _write_block_public(ws, values, row0, col0, formats, first_data), width
+    styles = [_number_format_style(ws.parent, f) for f in formats]
+
+    if isinstance(ws, WriteOnlyWorksheet):
+        pad = [None] * (col0 - 1)
+        for i, row in enumerate(values):
+            out = pad + list(row)
+            if i >= first_data:
+                for j, style in enumerate(styles):
+                    if style is not None and j < len(row) and row[j] is not None:
+                        cell = WriteOnlyCell(ws, row[j])
+                        cell._style = StyleArray(style)
+                        out[col0 - 1 + j] = cell
+            ws.append(out)
+        return len(values), width
+
+    cells = ws._cells
+    for i, row in enumerate(values):
+        r = row0 + i
+        use_style = i >= first_data
+        for j, v in enumerate(row):
+            c = col0 + j
+            old = cells.get((r, c))
+            if old is not None:
+                # 기존 셀은 글꼴/테두리/채우기를 유지한 채 값(과 표시 형식)만 바꿈
+                # None이면 값을 비워서 기존 범위를 덮어쓸 때 이전 값이 남지 않게 함
+                old.value = v
+                if use_style and v is not None and formats[j]:
+                    old.number_format = formats[j]
+                continue
+            if v is None:
+                continue
+            cells[(r, c)] = Cell(ws, row=r, column=c, value=v, style_array=styles[j] if use_style else None)
+    ws._current_row = max(ws._current_row, row0 + len(values) - 1)
+    return len(values), width
+
+
+def _check_merged(ws, min_row: int, min_col: int, max_row: int, max_col: int) -> None:
+    """기록할 범위가 병합된 셀의 안쪽(왼쪽 위 셀 제외)과 겹치면 ValueError"""
+    for mr in ws.merged_cells.ranges:
+        if mr.max_row < min_row or mr.min_row > max_row or mr.max_col < min_col or mr.min_col > max_col:
+            continue
+        # 겹치는 칸이 병합 범위의 왼쪽 위 한 칸뿐이면 값을 쓸 수 있음
+        if (max(mr.min_row, min_row), max(mr.min_col, min_col)) == (mr.min_row, mr.min_col) and \
+                (min(mr.max_row, max_row), min(mr.max_col, max_col)) == (mr.min_row, mr.min_col):
+            continue
+        raise ValueError(f"기록할 범위가 병합된 셀 {mr.coord}의 안쪽과 겹칩니다.")
+
+
+def _write_block_public(ws, values: List[List], row0: int, col0: int, formats: List[Optional[str]], first_data: int) -> int:
+    """write_block의 공개 API 경로 (openpyxl 내부 속성이 없는 버전용, 셀마다 스타일을 설정하므로 느림)"""
+    if isinstance(ws, WriteOnlyWorksheet):
+        pad = [None] * (col0 - 1)
+        for i, row in enumerate(values):
+            out = pad + list(row)
+            if i >= first_data:
+                for j, fmt in enumerate(formats):
+                    if fmt and j < len(row) and row[j] is not None:
+                        cell = WriteOnlyCell(ws, row[j])
+                        cell.number_format = fmt
+                        out[col0 - 1 + j] = cell
+            ws.append(out)
+        return len(values)
+    for i, row in enumerate(values):
+        for j, v in enumerate(row):
+            cell = ws.cell(row=row0 + i, column=col0 + j)
+            cell.value = v
+            if v is not None and i >= first_data and j < len(formats) and formats[j]:
+                cell.number_format = formats[j]
+    return len(values)
+
+
+def iter_rows(path: str, sheet: Optional[str] = None, min_row: int = 1) -> Iterator[Tuple]:
+    """read_only 워크북에서 값 튜플을 한 행씩 생성 (빈 행은 건너뜀)"""
+    for _, row in _iter_numbered_rows(path, sheet, min_row):
+        yield row
+
+
+def _iter_numbered_rows(path: str, sheet: Optional[str] = None, min_row: int = 1) -> Iterator[Tuple[int, Tuple]]:
+    """iter_rows와 같지만 (엑셀 행 번호, 값 튜플)을 생성"""
+    wb = load_workbook(path, read_only=True)
+    try:
+        ws = wb[sheet] if sheet else wb.worksheets[0]
+        for idx, row in enumerate(ws.iter_rows(min_row=min_row, values_only=True), start=min_row):
+            if row and any(v is not None for v in row):
+                yield idx, row
+    finally:
+        # read_only 모드는 파일 핸들을 열어 두므로 명시적으로 닫아야 함
+        wb.close()
+
+
+def filter_rows(
+    src_path: str,
+    dst_path: str,
+    keep: Optional[Callable[[int, Tuple], bool]] = None,
+    drop_rows: Optional[Collection[int]] = None,
+    sheet: Optional[str] = None,
+) -> Tuple[int, int]:
+    """
+    행 삭제를 한 번의 스트리밍 패스로 처리해 새 파일로 저장
+
+    ws.delete_rows()는 호출마다 아래쪽 셀을 모두 옮기므로 흩어진 행을 여러 번 지우면
+    O(행 수 × 삭제 횟수)가 됩니다. 여기서는 read_only로 한 행씩 읽어 남길 행만 write_only 시트에
+    기록하므로 선형 시간, 일정한 메모리로 끝납니다. (값만 복사하며 셀 서식은 유지되지 않습니다.)
+
+    Args:
+        keep: (행 번호(1부터), 값 튜플)을 받아 남길 행이면 True를 반환하는 함수
+        drop_rows: 지울 행 번호(1부터) 집합 - keep과 함께 주면 둘 다 적용
+        sheet: 필터링할 시트 이름 (기본: 첫 시트). 나머지 시트는 그대로 복사
+
+    Returns:
+        (남긴 행 수, 지운 행 수)
+    """
+    drop = set(drop_rows) if drop_rows else set()
+    src = load_workbook(src_path, read_only=True)
+    dst = Workbook(write_only=True)
+    kept = dropped = 0
+    try:
+        target = sheet or src.sheetnames[0]
+        for name in src.sheetnames:
+            out = dst.create_sheet(title=name)
+            rows = src[name].iter_rows(values_only=True)
+            if name != target:
+                for row in rows:
+                    out.append(row)
+                continue
+            for idx, row in enumerate(rows, start=1):
+                if idx in drop or (keep is not None and not keep(idx, row)):
+                    dropped += 1
+                    continue
+                out.append(row)
+                kept += 1
+        dst.save(dst_path)
+    finally:
+        src.close()
+    return kept, dropped
+
+
+def _iter_db_rows(db, chunk_size: int) -> Iterator[Tuple]:
+    if hasattr(db, "iter_products"):
+        return db.iter_products(chunk_size)
+    return db.iter_all(chunk_size)
+
+
+def export_products(db, path: str, chunk_size: int = 5000, sheet_title: str = "Products") -> int:
+    """Products 테이블 전체를 엑셀로 내보냄. Returns 내보낸 행 수"""
+    return write_rows(path, _iter_db_rows(db, chunk_size), header=PRODUCT_HEADER, sheet_title=sheet_title)
+
+
+def _product_columns(header: Tuple) -> Tuple[int, int]:
+    """헤더에서 (제품명 열, 가격 열) 위치 결정"""
+    names = [str(h).strip().lower() if h is not None else "" for h in header]
+    name_keys = ("productname", "제품명", "name")
+    price_keys = ("productprice", "가격", "price")
+    name_col = next((i for i, h in enumerate(names) if h in name_keys), None)
+    price_col = next((i for i, h in enumerate(names) if h in price_keys), None)
+    if name_col is None or price_col is None:
+        # 헤더를 알아볼 수 없으면 (ID, 이름, 가격) 또는 (이름, 가격) 순서로 가정
+        return (1, 2) if len(header) >= 3 else (0, 1)
+    return name_col, price_col
+
+
+def _parse_price(value) -> Optional[int]:
+    """가격 셀 값을 정수로 변환 ("1,234" 같은 서식 문자열 허용). 변환할 수 없으면 None"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else None
+    if isinstance(value, str):
+        try:
+            return int(value.strip().replace(",", ""))
+        except ValueError:
+            return None
+    return None
+
+
+def import_products(
+    db,
+    path: str,
+    sheet: Optional[str] = None,
+    chunk_size: int = 5000,
+    skipped: Optional[List[Tuple[int, object]]] = None,
+) -> int:
+    """
+    엑셀의 제품 행(첫 행은 헤더)을 청크 단위로 삽입. productID는 새로 발급됨
+
+    제품명이 비었거나 가격이 정수로 읽히지 않는 행은 가져오기를 멈추지 않고 건너뜁니다.
+
+    Args:
+        skipped: 주면 건너뛴 행의 (엑셀 행 번호, 가격 셀 값)을 추가
+
+    Returns:
+        삽입한 행 수
+    """
+    rows = _iter_numbered_rows(path, sheet)
+    first = next(rows, None)
+    if first is None:
+        return 0
+    name_col, price_col = _product_columns(first[1])
+
+    def items():
+        for row_no, r in rows:
+            name = r[name_col] if len(r) > name_col else None
+            raw = r[price_col] if len(r) > price_col else None
+            price = _parse_price(raw)
+            if name is None or str(name).strip() == "" or price is None:
+                if skipped is not None:
+                    skipped.append((row_no, raw))
+                continue
+            yield (str(name), price)
+
+    items = items()
+    if hasattr(db, "bulk_insert"):
+        # ProductDB.bulk_insert는 이터러블을 받아 자체적으로 청크 단위 커밋
+        return db.bulk_insert(items, chunk_size=chunk_size)
+    total = 0
+    for chunk in iter_chunks(items, chunk_size):
+        total += db.insert_many(chunk)
+    return total
+
+
+def main(argv=None):
+    from product_db import ProductDB
+
+    p = argparse.ArgumentParser(description="Products 테이블 <-> 엑셀 스트리밍 입출력")
+    p.add_argument("command", choices=["export", "import"], help="export: DB→엑셀, import: 엑셀→DB")
+    p.add_argument("--db", default="MyProduct.db", help="Database file path (default: MyProduct.db)")
+    p.add_argument("--xlsx", default="products.xlsx", help="엑셀 파일 경로")
+    p.add_argument("--sheet", default=None, help="가져올 시트 이름 (기본: 첫 시트)")
+    p.add_argument("--chunk", type=int, default=5000, help="청크 크기")
+    args = p.parse_args(argv)
+
+    pdb = ProductDB(db_path=args.db)
+    pdb.create_table()
+    t0 = time.time()
+    if args.command == "export":
+        n = export_products(pdb, args.xlsx, chunk_size=args.chunk)
+        print(f"Exported {n} rows to {args.xlsx} in {time.time() - t0:.2f} seconds")
+    else:
+        skipped = []
+        n = import_products(pdb, args.xlsx, sheet=args.sheet, chunk_size=args.chunk, skipped=skipped)
+        print(f"Imported {n} rows from {args.xlsx} in {time.time() - t0:.2f} seconds")
+        if skipped:
+            print(f"⚠ 제품명이 없거나 가격이 정수가 아닌 {len(skipped)}개 행을 건너뛰었습니다.")
+            for row_no, raw in skipped[:10]:
+                print(f"  {row_no}행: 가격 {raw!r}")
+    pdb.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,11 @@
 import os
+import json
 import shutil
+import time
+import fnmatch
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # 다운로드 폴더 경로
@@ -13,89 +19,481 @@ FILE_CATEGORIES = {
     r"\archive": [".zip"]
 }
 
-def create_folders_if_not_exist(base_path, folders):
+# 이동 기록(저널) 파일 이름 - 대상 폴더 안에 생성
+JOURNAL_NAME = ".organize_journal.jsonl"
+# 중복 검사용 해시 캐시 파일 이름 (duplicate_finder.CACHE_NAME과 같음)
+HASH_CACHE_NAME = ".dup_hash_cache.db"
+
+
+def build_extension_map(categories):
+    """확장자 → 폴더 이름 조회용 딕셔너리 생성 (파일마다 규칙 전체를 훑지 않도록)"""
+    ext_map = {}
+    for category_folder, extensions in categories.items():
+        for ext in extensions:
+            ext_map[ext.lower()] = category_folder.lstrip("\\")
+    return ext_map
+
+
+EXTENSION_MAP = build_extension_map(FILE_CATEGORIES)
+
+
+def create_folders_if_not_exist(base_path, folders, verbose=True):
     """필요한 폴더가 없으면 생성"""
     for folder in folders:
         folder_path = os.path.join(base_path, folder.lstrip("\\"))
         if not os.path.exists(folder_path):
             os.makedirs(folder_path)
             print(f"✓ 폴더 생성: {folder_path}")
-        else:
+        elif verbose:
             print(f"✓ 폴더 이미 존재: {folder_path}")
 
 def get_destination_folder(file_extension, base_path):
     """파일 확장자에 따라 목적지 폴더 결정"""
-    file_extension = file_extension.lower()
-    
-    for category_folder, extensions in FILE_CATEGORIES.items():
-        if file_extension in extensions:
-            return os.path.join(base_path, category_folder.lstrip("\\"))
-    
-    return None
-
-def organize_files(downloads_path):
+    folder = EXTENSION_MAP.get(file_extension.lower())
+    if folder is None:
+        return None
+    return os.path.join(base_path, folder)
+
+def _list_names(folder_path):
+    """폴더 안의 이름 집합 (폴더가 없으면 빈 집합)"""
+    try:
+        with os.scandir(folder_path) as it:
+            return {entry.name for entry in it}
+    except FileNotFoundError:
+        return set()
+
+def _matches(rel_path, include=None, exclude=None):
+    """포함/제외 glob 검사 (상대 경로 또는 파일명 중 하나라도 맞으면 일치)"""
+    rel_path = rel_path.replace("\\", "/")
+    name = rel_path.rsplit("/", 1)[-1]
+
+    def hit(patterns):
+        return any(fnmatch.fnmatch(rel_path, g) or fnmatch.fnmatch(name, g) for g in patterns)
+
+    if include and not hit(include):
+        return False
+    if exclude and hit(exclude):
+        return False
+    return True
+
+def is_category_dir(downloads_path, path):
+    """분류 결과 폴더(images, data 등)인지 - 재귀/감시 대상에서 제외"""
+    parent, name = os.path.split(os.path.normpath(path))
+    return os.path.normcase(parent) == os.path.normcase(os.path.normpath(downloads_path)) and name in set(EXTENSION_MAP.values())
+
+def iter_files(downloads_path, recursive=False, include=None, exclude=None):
+    """정리 대상 파일의 (파일명, 경로) 생성. recursive이면 분류 폴더를 뺀 하위 폴더까지 탐색"""
+    stack = [downloads_path]
+    while stack:
+        folder = stack.pop()
+        with os.scandir(folder) as it:
+            for entry in it:
+                # 폴더는 제외하고 파일만 처리 (scandir 결과의 캐시된 타입 정보 사용)
+                if entry.is_dir():
+                    if recursive and not is_category_dir(downloads_path, entry.path):
+                        stack.append(entry.path)
+                    continue
+                if not entry.is_file():
+                    continue
+                if (include or exclude) and not _matches(os.path.relpath(entry.path, downloads_path), include, exclude):
+                    continue
+                yield entry.name, entry.path
+
+def _iter_paths(downloads_path, paths, include=None, exclude=None):
+    """변경된 파일 경로 목록 중 아직 존재하고 분류 폴더 밖에 있는 파일만 (파일명, 경로)로 생성"""
+    for path in paths:
+        if not os.path.isfile(path):
+            continue
+        rel = os.path.relpath(path, downloads_path)
+        if rel.startswith(os.pardir) or is_category_dir(downloads_path, os.path.join(downloads_path, rel.split(os.sep)[0])):
+            continue
+        if (include or exclude) and not _matches(rel, include, exclude):
+            continue
+        yield os.path.basename(path), path
+
+def plan_moves(downloads_path, recursive=False, include=None, exclude=None, paths=None, conflicts=None):
+    """
+    이동 계획 작성 (파일은 건드리지 않음)
+
+    paths를 주면 폴더 전체 대신 그 파일들만 검사합니다 (감시 모드에서 변경된 파일만 처리).
+    conflicts 리스트를 주면 목적지에 같은 이름이 있어 건너뛴 (원본, 목적지) 쌍을 담아 줍니다.
+    (하위 폴더의 같은 이름 파일이 먼저 이동 예정이면 목적지 대신 그 파일의 원본 경로)
+
+    Returns:
+        (plan, skipped): plan은 [(원본 경로, 목적지 경로), ...],
+                         skipped는 [(파일명, 사유), ...]
+    """
+    plan = []
+    skipped = []
+    # 목적지 폴더별 기존 파일 이름 - 폴더마다 한 번만 읽음
+    existing = {}
+    # 목적지 폴더별 이번 계획으로 옮겨 갈 파일 이름 -> 원본 경로 (재귀 모드에서 같은 이름이 여럿일 수 있음)
+    planned = {}
+
+    if paths is None:
+        files = iter_files(downloads_path, recursive, include, exclude)
+    else:
+        files = _iter_paths(downloads_path, paths, include, exclude)
+
+    for name, path in files:
+        if name in (JOURNAL_NAME, HASH_CACHE_NAME):
+            continue
+        file_extension = os.path.splitext(name)[1]
+        folder = EXTENSION_MAP.get(file_extension.lower())
+
+        if folder is None:
+            if file_extension:
+                skipped.append((name, f"미분류 (확장자: {file_extension})"))
+            else:
+                skipped.append((name, "확장자 없음"))
+            continue
+
+        if folder not in existing:
+            existing[folder] = _list_names(os.path.join(downloads_path, folder))
+            planned[folder] = {}
+        if name in existing[folder]:
+            # 파일이 이미 목적지에 있으면 스킵
+            skipped.append((name, "이미 존재"))
+            if conflicts is not None:
+                conflicts.append((path, os.path.join(downloads_path, folder, name)))
+            continue
+        first = planned[folder].get(name)
+        if first is not None:
+            # 목적지에는 아직 없지만 같은 이름의 다른 파일이 먼저 그 자리로 이동 예정
+            skipped.append((name, f"같은 이름 파일이 이동 예정 ({os.path.relpath(first, downloads_path)})"))
+            if conflicts is not None:
+                conflicts.append((path, first))
+            continue
+
+        planned[folder][name] = path
+        plan.append((path, os.path.join(downloads_path, folder, name)))
+
+    return plan, skipped
+
+
+class MoveJournal:
+    """이동 계획과 완료 기록을 JSON Lines로 남겨 중단된 작업을 이어하거나 되돌릴 수 있게 함"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+
+    def start(self, plan, append=False):
+        """새 계획 기록 (append가 아니면 이전 저널은 덮어씀)"""
+        self._file = open(self.path, "a" if append else "w", encoding="utf-8")
+        for src, dst in plan:
+            self._write({"op": "plan", "src": src, "dst": dst})
+
+    def resume(self):
+        """기존 저널에 이어서 기록"""
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def mark(self, op, src, dst):
+        with self._lock:
+            self._write({"op": op, "src": src, "dst": dst})
+
+    def _write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def load(path):
+        """
+        Returns:
+            (pending, done): 아직 이동하지 않은 계획과 이동을 마친 항목 (기록 순서 유지)
+        """
+        planned = []
+        moved = {}
+        if not os.path.exists(path):
+            return [], []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    # 중단 시 마지막 줄이 잘렸을 수 있음
+                    continue
+                key = (rec["src"], rec["dst"])
+                if rec["op"] == "plan":
+                    planned.append(key)
+                elif rec["op"] == "done":
+                    moved[key] = True
+                elif rec["op"] == "undone":
+                    moved.pop(key, None)
+        pending = [k for k in planned if k not in moved]
+        done = [k for k in planned if k in moved]
+        return pending, done
+
+
+def _device_of(path):
+    try:
+        return os.stat(path).st_dev
+    except OSError:
+        return None
+
+def _move_no_replace(src, dst, cross_device):
+    """dst가 이미 있으면 FileExistsError (계획 후에 생긴 파일을 덮어쓰지 않도록 이동 직전에 확인)"""
+    if os.path.exists(dst):
+        raise FileExistsError(dst)
+    if cross_device:
+        shutil.move(src, dst)
+    elif os.name == "nt":
+        # Windows의 os.rename은 dst가 있으면 실패함
+        os.rename(src, dst)
+    else:
+        # POSIX의 os.rename은 dst를 조용히 덮어쓰므로 링크 생성(이미 있으면 실패) 후 원본 삭제
+        try:
+            os.link(src, dst)
+        except FileExistsError:
+            raise
+        except OSError:
+            # 하드 링크를 지원하지 않는 파일 시스템
+            os.rename(src, dst)
+        else:
+            os.unlink(src)
+
+def execute_plan(plan, journal, workers=4, verbose=False, skipped=None):
+    """
+    계획대로 파일 이동
+
+    같은 드라이브 안에서는 os.rename(메타데이터만 변경)으로 바로 옮기고,
+    다른 드라이브로 가는 이동(복사 + 삭제)만 스레드 풀에서 병렬로 처리합니다.
+    skipped 리스트를 주면 계획 뒤에 목적지에 같은 이름이 생겨 건너뛴 (파일명, 사유)를 추가합니다.
+
+    Returns:
+        (move_count, error_count)
+    """
+    counts = {"moved": 0, "errors": 0}
+    lock = threading.Lock()
+    devices = {}
+
+    def move(src, dst, cross_device):
+        try:
+            _move_no_replace(src, dst, cross_device)
+        except FileExistsError:
+            print(f"⚠ 건너뜀 ({os.path.basename(src)}): 목적지에 같은 이름의 파일이 생겼습니다.")
+            if skipped is not None:
+                with lock:
+                    skipped.append((os.path.basename(src), "이동 직전에 목적지에 생김"))
+            return
+        except Exception as e:
+            print(f"✗ 오류 발생 ({os.path.basename(src)}): {str(e)}")
+            with lock:
+                counts["errors"] += 1
+            return
+        journal.mark("done", src, dst)
+        with lock:
+            counts["moved"] += 1
+        if verbose:
+            print(f"✓ 이동 완료: {os.path.basename(src)} → {os.path.dirname(dst)}")
+
+    cross = []
+    for src, dst in plan:
+        src_dir, dst_dir = os.path.dirname(src), os.path.dirname(dst)
+        for d in (src_dir, dst_dir):
+            if d not in devices:
+                devices[d] = _device_of(d)
+        if devices[src_dir] is not None and devices[src_dir] == devices[dst_dir]:
+            move(src, dst, False)
+        else:
+            cross.append((src, dst))
+
+    if cross:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for src, dst in cross:
+                pool.submit(move, src, dst, True)
+
+    return counts["moved"], counts["errors"]
+
+def resolve_conflicts(downloads_path, conflicts, action="report"):
+    """
+    목적지에 같은 이름이 있어 건너뛴 파일 중 내용까지 같은 것(진짜 중복)을 찾아 처리
+
+    분류 폴더에 있는 파일을 원본으로 남기고, action에 따라 다운로드 폴더 쪽 사본을
+    보고만 하거나("report") 하드 링크로 바꾸거나("link") 삭제("remove")합니다.
+
+    Returns:
+        (처리한 파일 수, 절약한 바이트)
+    """
+    from duplicate_finder import HashCache, find_duplicates, dedupe
+
+    if not conflicts:
+        return 0, 0
+    destinations = {dst for _, dst in conflicts}
+    paths = [p for pair in conflicts for p in pair]
+    cache = HashCache(os.path.join(downloads_path, HASH_CACHE_NAME))
+    try:
+        groups = find_duplicates(paths, cache=cache)
+    finally:
+        cache.close()
+    groups = [g for g in groups if destinations.intersection(g)]
+    return dedupe(groups, action, keep=lambda g: next(p for p in g if p in destinations))
+
+def undo_moves(downloads_path, journal_path=None):
+    """저널에 기록된 완료 이동을 역순으로 되돌림. Returns 되돌린 파일 수"""
+    journal_path = journal_path or os.path.join(downloads_path, JOURNAL_NAME)
+    _, done = MoveJournal.load(journal_path)
+    journal = MoveJournal(journal_path)
+    journal.resume()
+    restored = 0
+    try:
+        for src, dst in reversed(done):
+            if os.path.exists(src) or not os.path.exists(dst):
+                print(f"⊘ 되돌릴 수 없음 (스킵): {os.path.basename(dst)}")
+                continue
+            shutil.move(dst, src)
+            journal.mark("undone", src, dst)
+            restored += 1
+    finally:
+        journal.close()
+    return restored
+
+def organize_files(downloads_path, dry_run=False, resume=False, workers=4, verbose=False, journal_path=None,
+                   recursive=False, include=None, exclude=None, dedupe=None):
     """다운로드 폴더의 파일들을 분류해서 이동"""
-    
+
     # 경로 유효성 확인
     if not os.path.exists(downloads_path):
         print(f"오류: {downloads_path} 폴더가 존재하지 않습니다.")
         return
-    
+
     print(f"대상 폴더: {downloads_path}\n")
-    
-    # 필요한 폴더 생성
+    journal_path = journal_path or os.path.join(downloads_path, JOURNAL_NAME)
+
     print("=" * 50)
-    print("1단계: 필요한 폴더 생성 중...")
+    print("1단계: 이동 계획 작성 중...")
     print("=" * 50)
-    create_folders_if_not_exist(downloads_path, FILE_CATEGORIES.keys())
-    
+    if resume:
+        pending, _ = MoveJournal.load(journal_path)
+        # 기록 직전에 중단되어 이미 옮겨진 항목은 제외
+        plan = [(src, dst) for src, dst in pending if os.path.exists(src) and not os.path.exists(dst)]
+        skipped = []
+        print(f"저널에서 남은 이동 {len(plan)}개를 이어서 진행합니다.")
+    else:
+        conflicts = []
+        plan, skipped = plan_moves(downloads_path, recursive, include, exclude, conflicts=conflicts)
+        print(f"이동 예정: {len(plan)}개, 처리 안 함: {len(skipped)}개")
+        if dedupe and conflicts:
+            # dry run에서는 중복 보고만 함
+            handled, saved = resolve_conflicts(downloads_path, conflicts, "report" if dry_run else dedupe)
+            if handled:
+                print(f"중복 처리: {handled}개 ({saved:,} bytes 절약)")
+
+    if verbose or dry_run:
+        for filename, reason in skipped:
+            print(f"⊘ {reason}: {filename}")
+
+    if dry_run:
+        for src, dst in plan:
+            print(f"→ {os.path.basename(src)} → {os.path.dirname(dst)}")
+        print("\n(dry run) 실제로 이동하지 않았습니다.")
+        return plan
+
+    # 필요한 폴더 생성
     print("\n" + "=" * 50)
-    print("2단계: 파일 이동 중...")
+    print("2단계: 필요한 폴더 생성 / 파일 이동 중...")
     print("=" * 50)
-    
-    # 다운로드 폴더의 모든 파일 순회
-    move_count = 0
-    skip_count = 0
-    
-    for filename in os.listdir(downloads_path):
-        file_path = os.path.join(downloads_path, filename)
-        
-        # 폴더는 제외하고 파일만 처리
-        if os.path.isdir(file_path):
-            continue
-        
-        # 파일 확장자 추출
-        file_extension = os.path.splitext(filename)[1]
-        
-        # 목적지 폴더 결정
-        destination_folder = get_destination_folder(file_extension, downloads_path)
-        
-        if destination_folder:
-            destination_path = os.path.join(destination_folder, filename)
-            
-            try:
-                # 파일이 이미 목적지에 있으면 스킵
-                if os.path.exists(destination_path):
-                    print(f"⊘ 이미 존재 (스킵): {filename}")
-                    skip_count += 1
-                else:
-                    shutil.move(file_path, destination_path)
-                    print(f"✓ 이동 완료: {filename} → {destination_folder}")
-                    move_count += 1
-            except Exception as e:
-                print(f"✗ 오류 발생 ({filename}): {str(e)}")
-        else:
-            skip_count += 1
-            if file_extension:
-                print(f"⊘ 미분류 파일: {filename} (확장자: {file_extension})")
-            else:
-                print(f"⊘ 확장자 없는 파일: {filename}")
-    
+    create_folders_if_not_exist(downloads_path, FILE_CATEGORIES.keys(), verbose=verbose)
+
+    journal = MoveJournal(journal_path)
+    if resume:
+        journal.resume()
+    else:
+        journal.start(plan)
+    try:
+        late_skips = []
+        move_count, error_count = execute_plan(plan, journal, workers=workers, verbose=verbose, skipped=late_skips)
+        skipped = skipped + late_skips
+    finally:
+        journal.close()
+
     print("\n" + "=" * 50)
     print("작업 완료!")
     print("=" * 50)
     print(f"이동된 파일: {move_count}개")
-    print(f"처리되지 않은 파일: {skip_count}개")
+    print(f"처리되지 않은 파일: {len(skipped) + error_count}개")
+    return plan
+
+def watch_and_organize(downloads_path, recursive=False, include=None, exclude=None,
+                       workers=4, verbose=False, polling=False, interval=1.0, quiet=0.5):
+    """
+    감시 모드: 폴더 변경 이벤트를 모아 새로 생기거나 바뀐 파일만 정리
+
+    한 번의 처리 비용이 폴더 크기가 아니라 변경된 파일 수에 비례합니다.
+    이동 기록은 저널에 계속 덧붙여지므로 --undo로 되돌릴 수 있습니다.
+    """
+    from fs_watcher import open_watcher, collect_batch
+
+    if not os.path.exists(downloads_path):
+        print(f"오류: {downloads_path} 폴더가 존재하지 않습니다.")
+        return
+
+    create_folders_if_not_exist(downloads_path, FILE_CATEGORIES.keys(), verbose=verbose)
+    journal_path = os.path.join(downloads_path, JOURNAL_NAME)
+    watcher = open_watcher(downloads_path, recursive,
+                           skip_dir=lambda path: is_category_dir(downloads_path, path), polling=polling)
+    print(f"감시 시작 ({type(watcher).__name__}): {downloads_path}  (Ctrl+C로 종료)")
+
+    try:
+        # 감시 시작 전에 이미 있던 파일 먼저 정리
+        paths = None
+        while True:
+            if watcher.overflowed:
+                # 이벤트 유실 시 전체를 한 번 다시 훑음
+                watcher.overflowed = False
+                paths = None
+            plan, skipped = plan_moves(downloads_path, recursive, include, exclude, paths=paths)
+            if plan:
+                journal = MoveJournal(journal_path)
+                journal.start(plan, append=True)
+                try:
+                    move_count, error_count = execute_plan(plan, journal, workers=workers, verbose=verbose,
+                                                           skipped=skipped)
+                finally:
+                    journal.close()
+                print(f"[{time.strftime('%H:%M:%S')}] 이동 {move_count}개, 오류 {error_count}개, 처리 안 함 {len(skipped)}개")
+            paths = collect_batch(watcher, interval, quiet)
+    except KeyboardInterrupt:
+        print("감시를 종료합니다.")
+    finally:
+        watcher.close()
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="다운로드 폴더 파일을 확장자별 폴더로 정리")
+    p.add_argument("--path", default=DOWNLOADS_FOLDER, help="정리할 폴더 (기본: DOWNLOADS_FOLDER)")
+    p.add_argument("--dry-run", action="store_true", help="이동 계획만 출력")
+    p.add_argument("--resume", action="store_true", help="중단된 이전 작업을 저널에서 이어서 진행")
+    p.add_argument("--undo", action="store_true", help="저널에 기록된 마지막 작업을 되돌림")
+    p.add_argument("--workers", type=int, default=4, help="다른 드라이브로 이동할 때 동시 작업 수")
+    p.add_argument("-v", "--verbose", action="store_true", help="파일마다 결과 출력")
+    p.add_argument("-r", "--recursive", action="store_true", help="하위 폴더까지 정리 (분류 폴더 제외)")
+    p.add_argument("--include", action="append", help="포함할 glob (여러 번 지정 가능, 예: '*.pdf')")
+    p.add_argument("--exclude", action="append", help="제외할 glob (여러 번 지정 가능, 예: 'tmp/*')")
+    p.add_argument("--dedupe", choices=["report", "link", "remove"],
+                   help="목적지에 같은 이름이 있을 때 내용이 같으면 보고/하드 링크/삭제")
+    p.add_argument("--watch", action="store_true", help="감시 모드: 변경된 파일만 계속 정리")
+    p.add_argument("--polling", action="store_true", help="감시 모드에서 inotify 대신 주기적 비교 사용")
+    p.add_argument("--interval", type=float, default=1.0, help="감시 모드 확인 주기(초)")
+    args = p.parse_args(argv)
+
+    if args.undo:
+        restored = undo_moves(args.path)
+        print(f"되돌린 파일: {restored}개")
+    elif args.watch:
+        watch_and_organize(args.path, recursive=args.recursive, include=args.include, exclude=args.exclude,
+                           workers=args.workers, verbose=args.verbose, polling=args.polling,
+                           interval=args.interval)
+    else:
+        organize_files(args.path, dry_run=args.dry_run, resume=args.resume,
+                       workers=args.workers, verbose=args.verbose,
+                       recursive=args.recursive, include=args.include, exclude=args.exclude,
+                       dedupe=args.dedupe)
 
 if __name__ == "__main__":
-    organize_files(DOWNLOADS_FOLDER)
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+fs_watcher.py
+
+폴더 변경 감지기. 리눅스에서는 inotify(ctypes)로 커널 이벤트를 구독하고,
+그 외 환경(윈도우 등)이나 inotify를 쓸 수 없을 때는 주기적인 scandir 비교로 대체합니다.
+
+두 감지기 모두 read(timeout)으로 "새로 생기거나 내용이 바뀐 파일 경로 집합"을 돌려주며,
+collect_batch()는 이벤트가 잠잠해질 때까지 모아서 한 번에 넘겨 줍니다.
+
+Usage:
+    python fs_watcher.py /tmp/some_folder --recursive
+
+클래스: InotifyWatcher, PollingWatcher
+함수: open_watcher, collect_batch
+"""
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from typing import Callable, Dict, Optional, Set, Tuple
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_ISDIR = 0x40000000
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+
+_EVENT = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """리눅스 inotify 기반 감지기 (쓰기가 끝난 파일과 이동되어 들어온 파일만 보고)"""
+
+    MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+    def __init__(self, root: str, recursive: bool = False, skip_dir: Optional[Callable[[str], bool]] = None):
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError("inotify를 사용할 수 없는 환경입니다.")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.root = os.path.abspath(root)
+        self.recursive = recursive
+        self.skip_dir = skip_dir or (lambda path: False)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+        self._dirs: Dict[int, str] = {}
+        self.overflowed = False
+        self._add_tree(self.root)
+
+    def _add_watch(self, path: str) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), self.MASK)
+        if wd >= 0:
+            self._dirs[wd] = path
+
+    def _add_tree(self, path: str) -> None:
+        self._add_watch(path)
+        if not self.recursive:
+            return
+        for dirpath, dirnames, _ in os.walk(path):
+            dirnames[:] = [d for d in dirnames if not self.skip_dir(os.path.join(dirpath, d))]
+            for d in dirnames:
+                self._add_watch(os.path.join(dirpath, d))
+
+    def read(self, timeout: float) -> Set[str]:
+        changed: Set[str] = set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return changed
+        try:
+            buf = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset + _EVENT.size <= len(buf):
+            wd, mask, _cookie, length = _EVENT.unpack_from(buf, offset)
+            offset += _EVENT.size
+            name = buf[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                # 커널 큐가 넘치면 이벤트 일부가 사라지므로 호출 측에서 전체를 다시 훑도록 표시
+                self.overflowed = True
+                continue
+            if mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            parent = self._dirs.get(wd)
+            if parent is None or not name:
+                continue
+            path = os.path.join(parent, os.fsdecode(name))
+            if mask & IN_ISDIR:
+                if self.recursive and mask & (IN_CREATE | IN_MOVED_TO) and not self.skip_dir(path):
+                    self._add_tree(path)
+                    # 감시를 붙이기 전에 폴더 안에 이미 생긴 파일도 보고
+                    for dirpath, dirnames, filenames in os.walk(path):
+                        dirnames[:] = [d for d in dirnames if not self.skip_dir(os.path.join(dirpath, d))]
+                        changed.update(os.path.join(dirpath, f) for f in filenames)
+                continue
+            if mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingWatcher:
+    """scandir로 (mtime, size)를 비교하는 대체 감지기.
+    복사 중인 파일을 넘기지 않도록 두 번 연속 같은 상태로 관찰된 파일만 보고합니다."""
+
+    def __init__(self, root: str, recursive: bool = False, skip_dir: Optional[Callable[[str], bool]] = None):
+        self.root = os.path.abspath(root)
+        self.recursive = recursive
+        self.skip_dir = skip_dir or (lambda path: False)
+        self.overflowed = False
+        self._known = self._snapshot()
+        self._unstable: Dict[str, Tuple[int, int]] = {}
+
+    def _snapshot(self) -> Dict[str, Tuple[int, int]]:
+        snap: Dict[str, Tuple[int, int]] = {}
+        stack = [self.root]
+        while stack:
+            d = stack.pop()
+            try:
+                it = os.scandir(d)
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            if self.recursive and not self.skip_dir(entry.path):
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            st = entry.stat()
+                            snap[entry.path] = (st.st_mtime_ns, st.st_size)
+                    except OSError:
+                        continue
+        return snap
+
+    def read(self, timeout: float) -> Set[str]:
+        time.sleep(timeout)
+        current = self._snapshot()
+        changed: Set[str] = set()
+        unstable: Dict[str, Tuple[int, int]] = {}
+        for path, sig in current.items():
+            if self._known.get(path) == sig:
+                continue
+            if self._unstable.get(path) == sig:
+                changed.add(path)
+            else:
+                unstable[path] = sig
+        for path in changed:
+            self._known[path] = current[path]
+        self._known = {p: s for p, s in self._known.items() if p in current}
+        self._unstable = unstable
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+def open_watcher(root: str, recursive: bool = False, skip_dir: Optional[Callable[[str], bool]] = None, polling: bool = False):
+    """가능하면 InotifyWatcher, 아니면 PollingWatcher 반환"""
+    if not polling:
+        try:
+            return InotifyWatcher(root, recursive, skip_dir)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(root, recursive, skip_dir)
+
+
+def collect_batch(watcher, interval: float = 1.0, quiet: float = 0.5) -> Set[str]:
+    """첫 변경이 올 때까지 기다린 뒤, quiet초 동안 추가 이벤트가 없을 때까지 모아서 반환"""
+    batch: Set[str] = set()
+    while not batch and not watcher.overflowed:
+        batch |= watcher.read(interval)
+    while True:
+        more = watcher.read(quiet)
+        if not more:
+            return batch
+        batch |= more
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="폴더 변경 감지 테스트")
+    p.add_argument("root", help="감시할 폴더")
+    p.add_argument("--recursive", action="store_true", help="하위 폴더까지 감시")
+    p.add_argument("--polling", action="store_true", help="inotify 대신 주기적 비교 사용")
+    args = p.parse_args(argv)
+
+    watcher = open_watcher(args.root, args.recursive, polling=args.polling)
+    print(f"감지기: {type(watcher).__name__}")
+    try:
+        while True:
+            for path in sorted(collect_batch(watcher)):
+                print(f"변경: {path}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+image_downloader.py
+
+이미지 URL 목록을 병렬로 내려받는 다운로드 스테이지.
+
+- 스레드마다 keep-alive requests.Session을 재사용하는 제한된 크기의 스레드 풀
+- 응답을 청크 단위로 받아 바로 파일에 쓰면서 SHA-256을 계산 (메모리에 통째로 올리지 않음)
+- 내용 해시가 같은 이미지는 한 번만 저장 (중복 제거)
+- 폴더 안의 매니페스트(.download_manifest.jsonl)에 완료 항목을 기록해 중단된 작업을 이어서 수행
+
+Usage:
+    python image_downloader.py --folder 고양이 --prefix 고양이 urls.txt
+
+함수: download_images, load_manifest
+"""
+import argparse
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+MANIFEST_NAME = ".download_manifest.jsonl"
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+}
+
+_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/jpg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "image/bmp": ".bmp",
+}
+
+_local = threading.local()
+
+
+def _session() -> requests.Session:
+    """스레드별 keep-alive 세션 (requests.Session은 스레드 간 공유가 안전하지 않음)"""
+    s = getattr(_local, "session", None)
+    if s is None:
+        s = requests.Session()
+        s.headers.update(HEADERS)
+        _local.session = s
+    return s
+
+
+def load_manifest(folder: str) -> Dict[str, Dict]:
+    """매니페스트를 읽어 {url: 기록} 반환 (파일이 없거나 깨진 줄은 무시)"""
+    path = os.path.join(folder, MANIFEST_NAME)
+    done: Dict[str, Dict] = {}
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            done[rec["url"]] = rec
+    return done
+
+
+def _fetch_one(url: str, part_path: str, timeout: int, chunk_size: int) -> Tuple[str, str]:
+    """url을 part_path로 스트리밍 저장. Returns (sha256, 확장자)"""
+    h = hashlib.sha256()
+    with _session().get(url, stream=True, timeout=timeout) as resp:
+        resp.raise_for_status()
+        ctype = resp.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        with open(part_path, "wb") as f:
+            for chunk in resp.iter_content(chunk_size):
+                if chunk:
+                    f.write(chunk)
+                    h.update(chunk)
+    return h.hexdigest(), _EXTENSIONS.get(ctype, ".jpg")
+
+
+def download_images(
+    urls: Iterable[str],
+    folder: str,
+    prefix: str,
+    workers: int = 8,
+    timeout: int = 15,
+    chunk_size: int = 64 * 1024,
+) -> Dict[str, int]:
+    """urls를 folder/prefix_번호.확장자 로 병렬 저장.
+
+    Returns:
+        {"saved": 새로 저장, "duplicate": 내용 중복으로 버림, "skipped": 이전 실행에서 완료, "failed": 실패}
+    """
+    os.makedirs(folder, exist_ok=True)
+    done = load_manifest(folder)
+    # 내용 해시 -> 그 내용을 파일로 가진 URL (파일이 지워진 기록은 빼야 다시 받은 이미지가 복구됨)
+    seen_hashes: Dict[str, str] = {
+        rec["sha256"]: url
+        for url, rec in done.items()
+        if rec.get("sha256") and rec.get("file") and os.path.exists(os.path.join(folder, rec["file"]))
+    }
+    # 매니페스트가 가리키는 파일명 - 재실행에서 URL 순서가 바뀌어도 덮어쓰지 않도록
+    taken = {rec["file"] for rec in done.values() if rec.get("file")}
+    next_free = [1]
+    lock = threading.Lock()
+    stats = {"saved": 0, "duplicate": 0, "skipped": 0, "failed": 0}
+    manifest = open(os.path.join(folder, MANIFEST_NAME), "a", encoding="utf-8")
+
+    def record(rec: Dict) -> None:
+        manifest.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        manifest.flush()
+
+    def free_name(index: int, ext: str, url: str) -> str:
+        """lock 안에서 호출. 지워진 파일을 다시 받으면 그 이름을, 아니면 prefix_index(쓰였으면 비어 있는 다음 번호)를 사용"""
+        old = (done.get(url) or {}).get("file")
+        if old and old.endswith(ext) and not os.path.exists(os.path.join(folder, old)):
+            return old
+        filename = f"{prefix}_{index}{ext}"
+        while filename in taken or os.path.exists(os.path.join(folder, filename)):
+            filename = f"{prefix}_{next_free[0]}{ext}"
+            next_free[0] += 1
+        taken.add(filename)
+        return filename
+
+    def job(index: int, url: str) -> None:
+        part_path = os.path.join(folder, f"{prefix}_{index}.part")
+        try:
+            digest, ext = _fetch_one(url, part_path, timeout, chunk_size)
+        except Exception as e:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            print(f"✗ 다운로드 실패 ({url}): {e}")
+            with lock:
+                stats["failed"] += 1
+            return
+        with lock:
+            owner = seen_hashes.get(digest)
+            if owner is not None and owner != url:
+                os.remove(part_path)
+                record({"url": url, "file": None, "sha256": digest})
+                stats["duplicate"] += 1
+                return
+            seen_hashes[digest] = url
+            filename = free_name(index, ext, url)
+            os.replace(part_path, os.path.join(folder, filename))
+            record({"url": url, "file": filename, "sha256": digest})
+            stats["saved"] += 1
+
+    pending: List[Tuple[int, str]] = []
+    for index, url in enumerate(dict.fromkeys(urls), start=1):
+        rec: Optional[Dict] = done.get(url)
+        if rec is not None and (
+            os.path.exists(os.path.join(folder, rec["file"])) if rec.get("file")
+            # 중복으로 버린 URL은 같은 내용의 파일이 남아 있을 때만 건너뜀
+            else rec.get("sha256") in seen_hashes
+        ):
+            stats["skipped"] += 1
+            continue
+        pending.append((index, url))
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = [pool.submit(job, index, url) for index, url in pending]
+            for fut in as_completed(futures):
+                fut.result()
+    finally:
+        manifest.close()
+    return stats
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="이미지 URL 목록 병렬 다운로드")
+    p.add_argument("url_file", help="한 줄에 하나씩 URL이 적힌 파일")
+    p.add_argument("--folder", required=True, help="저장할 폴더")
+    p.add_argument("--prefix", default="image", help="파일명 앞부분")
+    p.add_argument("--workers", type=int, default=8, help="동시 다운로드 수")
+    args = p.parse_args(argv)
+
+    with open(args.url_file, encoding="utf-8") as f:
+        urls = [line.strip() for line in f if line.strip()]
+    stats = download_images(urls, args.folder, args.prefix, workers=args.workers)
+    print(f"저장 {stats['saved']}개, 중복 {stats['duplicate']}개, 이전 완료 {stats['skipped']}개, 실패 {stats['failed']}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+import_profiler.py
+
+실행 파일로 묶는 스크립트(엔트리 포인트)의 시작 시 import 비용을 측정하는 도구.
+
+엔트리 포인트의 모듈 최상위 import 문만 뽑아 `python -X importtime`으로 새 프로세스에서 실행하고,
+stderr에 찍히는 모듈별 시간을 모아 엔트리 포인트마다 보고서를 만듭니다.
+인터프리터 시작 때 이미 import되는 모듈(site, encodings 등)은 빼고 계산하므로
+스크립트가 직접 늘린 시작 시간만 보입니다. (GUI 창을 띄우거나 게임 루프를 돌리지 않음)
+
+Usage:
+    python import_profiler.py                        # *.spec의 엔트리 포인트 + breakout_game.py
+    python import_profiler.py DemoForm2.py WebData5.py --top 10
+    python import_profiler.py --json importtime.json
+
+클래스: ImportRecord
+함수: entry_points, entry_imports, run_importtime, profile_entry, print_report
+"""
+import argparse
+import ast
+import glob
+import json
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+# spec 파일이 없는 빌드 대상 (build/breakout_game)
+EXTRA_ENTRY_POINTS = ["breakout_game.py"]
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def entry_points(folder: str = ".") -> List[str]:
+    """*.spec의 Analysis([...])에 적힌 스크립트와 EXTRA_ENTRY_POINTS 중 존재하는 파일"""
+    scripts: List[str] = []
+    for spec in sorted(glob.glob(os.path.join(folder, "*.spec"))):
+        with open(spec, encoding="utf-8") as f:
+            m = re.search(r"Analysis\(\s*\[([^\]]*)\]", f.read())
+        if m:
+            scripts += re.findall(r"['\"]([^'\"]+\.py)['\"]", m.group(1))
+    for name in EXTRA_ENTRY_POINTS:
+        if name not in scripts:
+            scripts.append(name)
+    return [s for s in scripts if os.path.exists(os.path.join(folder, s))]
+
+
+def entry_imports(script: str) -> str:
+    """스크립트에서 모듈 최상위(함수/클래스 밖) import 문만 모은 코드"""
+    with open(script, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=script)
+    lines = []
+    stack = list(tree.body)
+    while stack:
+        node = stack.pop(0)
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            lines.append(ast.unparse(node))
+        elif isinstance(node, (ast.If, ast.Try, ast.With)):
+            # `if __name__ == "__main__":` 블록은 실행 시에만 도는 코드이므로 제외
+            if isinstance(node, ast.If) and "__name__" in ast.unparse(node.test):
+                continue
+            for field in ("body", "orelse", "finalbody"):
+                stack.extend(getattr(node, field, []))
+            for handler in getattr(node, "handlers", []):
+                stack.extend(handler.body)
+    return "\n".join(lines)
+
+
+def run_importtime(code: str, cwd: str = ".", python: str = sys.executable) -> Tuple[List[ImportRecord], str]:
+    """code를 -X importtime으로 실행. Returns (기록 목록, import 외 오류 메시지)"""
+    out = subprocess.run(
+        [python, "-X", "importtime", "-c", code],
+        cwd=cwd, capture_output=True, text=True, encoding="utf-8", errors="replace",
+    )
+    records: List[ImportRecord] = []
+    errors = []
+    for line in out.stderr.splitlines():
+        m = _LINE.match(line)
+        if m:
+            records.append(ImportRecord(m.group(4), int(m.group(1)), int(m.group(2)), len(m.group(3)) // 2))
+        elif not line.startswith("import time:"):
+            errors.append(line)
+    return records, "\n".join(errors).strip() if out.returncode else ""
+
+
+def _startup_modules(cwd: str, python: str) -> Set[str]:
+    records, _ = run_importtime("pass", cwd, python)
+    return {r.module for r in records}
+
+
+def profile_entry(script: str, cwd: str = ".", python: str = sys.executable,
+                  startup: Optional[Set[str]] = None) -> Dict:
+    """엔트리 포인트 하나의 import 비용 요약"""
+    startup = _startup_modules(cwd, python) if startup is None else startup
+    code = entry_imports(os.path.join(cwd, script))
+    records, error = run_importtime(code, cwd, python)
+    own = [r for r in records if r.module not in startup]
+    # 시작 시 import되지 않은 모듈 중 가장 바깥(상위 모듈이 목록에 없는) 것들의 누적 시간 합 = 전체 시간
+    top_level = [r for r in own if r.depth == 0]
+    total_us = sum(r.cumulative_us for r in top_level)
+    packages: Dict[str, int] = {}
+    for r in own:
+        root = r.module.split(".")[0]
+        packages[root] = packages.get(root, 0) + r.self_us
+    return {
+        "script": script,
+        "imports": code.splitlines(),
+        "total_ms": total_us / 1000,
+        "modules": len(own),
+        "top_level": sorted(((r.module, r.cumulative_us / 1000) for r in top_level), key=lambda x: -x[1]),
+        "packages": sorted(((k, v / 1000) for k, v in packages.items()), key=lambda x: -x[1]),
+        "error": error,
+    }
+
+
+def print_report(report: Dict, top: int = 15) -> None:
+    print(f"=== {report['script']}: {report['total_ms']:.1f} ms, 모듈 {report['modules']}개 ===")
+    if report["error"]:
+        print(f"  ✗ import 실패: {report['error'].splitlines()[-1]}")
+    print("  최상위 import (누적):")
+    for name, ms in report["top_level"][:top]:
+        print(f"    {ms:9.1f} ms  {name}")
+    print("  패키지별 (자체 시간 합):")
+    for name, ms in report["packages"][:top]:
+        print(f"    {ms:9.1f} ms  {name}")
+    print()
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="엔트리 포인트별 import 시간 보고서 (-X importtime)")
+    p.add_argument("scripts", nargs="*", help="측정할 스크립트 (기본: *.spec 엔트리 포인트 + breakout_game.py)")
+    p.add_argument("--top", type=int, default=15, help="항목별로 보여줄 개수")
+    p.add_argument("--json", default=None, help="보고서를 JSON으로 저장할 경로")
+    p.add_argument("--python", default=sys.executable, help="측정에 사용할 파이썬 실행 파일")
+    args = p.parse_args(argv)
+
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    scripts = args.scripts or entry_points(cwd)
+    startup = _startup_modules(cwd, args.python)
+    reports = []
+    for script in scripts:
+        report = profile_entry(script, cwd, args.python, startup)
+        print_report(report, args.top)
+        reports.append(report)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(reports, f, ensure_ascii=False, indent=2)
+        print(f"보고서 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+keyword_matcher.py
+
+여러 키워드를 한 번에 검색하는 Aho–Corasick 기반 키워드 매처.
+
+크롤링 스크립트(클리앙중고장터검색.py, 오늘의 유머.py, WebData5.py)에서 제목마다
+re.search(키워드, title)를 반복하는 대신, 키워드 집합을 한 번만 오토마톤으로
+컴파일해 두고 제목 하나를 한 번만 훑어서 걸린 키워드를 모두 알려줍니다.
+검색 비용은 제목 길이(+ 매칭 수)에만 비례하며 키워드 개수와는 무관합니다.
+
+Usage:
+    python keyword_matcher.py --keywords 아이폰,갤럭시 "아이폰 15 팝니다"
+
+클래스 메서드: add, build, iter_matches, find_all, search, filter
+"""
+import argparse
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+class KeywordMatcher:
+    """키워드 집합을 Aho–Corasick 오토마톤으로 컴파일해 다중 키워드를 한 번에 매칭"""
+
+    def __init__(self, keywords: Optional[Iterable[str]] = None, ignore_case: bool = True):
+        self.ignore_case = ignore_case
+        # 노드 i의 전이 테이블 / 실패 링크 / 그 노드에서 끝나는 키워드 / build()가 실패 링크로 병합한 출력
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._own: List[Tuple[str, ...]] = [()]
+        self._out: List[Tuple[str, ...]] = [()]
+        self._keywords: List[str] = []
+        self._built = False
+        if keywords is not None:
+            for kw in keywords:
+                self.add(kw)
+            self.build()
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    @property
+    def keywords(self) -> List[str]:
+        return list(self._keywords)
+
+    def _norm(self, s: str) -> str:
+        return s.casefold() if self.ignore_case else s
+
+    def add(self, keyword: str) -> None:
+        """키워드 추가 (공백만 있는 키워드는 무시). 추가 후에는 build()를 다시 호출해야 함."""
+        keyword = keyword.strip()
+        if not keyword or keyword in self._keywords:
+            return
+        node = 0
+        for ch in self._norm(keyword):
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._own.append(())
+            node = nxt
+        self._own[node] = self._own[node] + (keyword,)
+        self._keywords.append(keyword)
+        self._built = False
+
+    def build(self) -> None:
+        """BFS로 실패 링크를 계산하고 출력 집합을 병합 (다시 호출해도 처음부터 계산)"""
+        out = list(self._own)
+        queue = deque()
+        for nxt in self._goto[0].values():
+            self._fail[nxt] = 0
+            queue.append(nxt)
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # BFS 순서라 실패 노드(더 얕은 노드)의 출력은 이미 병합되어 있음
+                if out[self._fail[nxt]]:
+                    out[nxt] = out[nxt] + out[self._fail[nxt]]
+        self._out = out
+        self._built = True
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """(끝 위치, 키워드) 형태로 text 안의 모든 매칭을 순서대로 생성"""
+        if not self._built:
+            self.build()
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(self._norm(text)):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                for kw in out[node]:
+                    yield i, kw
+
+    def find_all(self, text: str) -> Set[str]:
+        """text에 포함된 키워드 집합 반환"""
+        return {kw for _, kw in self.iter_matches(text)}
+
+    def search(self, text: str) -> bool:
+        """키워드가 하나라도 포함되어 있으면 True"""
+        for _ in self.iter_matches(text):
+            return True
+        return False
+
+    def filter(self, titles: Iterable[str]) -> Iterator[Tuple[str, Set[str]]]:
+        """키워드가 걸린 제목만 (제목, 걸린 키워드 집합) 형태로 생성"""
+        for title in titles:
+            hits = self.find_all(title)
+            if hits:
+                yield title, hits
+
+
+def parse_keywords(text: str, sep: str = ",") -> List[str]:
+    """'아이폰, 갤럭시' 같은 입력 문자열을 키워드 리스트로 변환"""
+    return [kw.strip() for kw in text.split(sep) if kw.strip()]
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="여러 키워드를 한 번에 매칭합니다.")
+    p.add_argument("--keywords", required=True, help="쉼표로 구분한 키워드 목록")
+    p.add_argument("--keywords-file", help="한 줄에 하나씩 키워드가 적힌 파일 (추가)")
+    p.add_argument("titles", nargs="*", help="검사할 제목들")
+    args = p.parse_args(argv)
+
+    keywords = parse_keywords(args.keywords)
+    if args.keywords_file:
+        with open(args.keywords_file, encoding="utf-8") as f:
+            keywords.extend(line.strip() for line in f if line.strip())
+
+    matcher = KeywordMatcher(keywords)
+    for title, hits in matcher.filter(args.titles):
+        print(f"{title}  <- {', '.join(sorted(hits))}")
+
+
+if __name__ == "__main__":
+    main()
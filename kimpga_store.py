@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+kimpga_store.py
+
+kimpga_top20.py 폴링 결과를 누적 저장하는 SQLite 시계열 저장소.
+
+HTML은 저장하지 않고 파싱된 값(가격/프리미엄은 숫자로 변환)만 스냅샷 단위로 추가하므로,
+"최근 1시간 동안 심볼 X의 프리미엄" 같은 조회를 다시 파싱하지 않고 인덱스로 바로 처리합니다.
+
+생성된 DB 파일: kimpga_history.db (기본값)
+테이블: Snapshots(ts REAL, source TEXT, rank INTEGER, symbol TEXT, name TEXT, price REAL, premium REAL)
+인덱스: (symbol, ts), (ts)
+
+Usage:
+    python kimpga_store.py --symbol BTC --since 3600
+
+클래스 메서드: append_snapshot, premium_history, latest_snapshot, symbols, count_rows
+"""
+import argparse
+import re
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+_NUMBER_RE = re.compile(r"-?\d[\d,]*(?:\.\d+)?")
+
+
+def parse_number(value) -> Optional[float]:
+    """'₩1,234.5', '+3.21%' 같은 문자열에서 숫자만 추출 (없으면 None)"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    m = _NUMBER_RE.search(str(value))
+    if not m:
+        return None
+    try:
+        return float(m.group(0).replace(",", ""))
+    except ValueError:
+        return None
+
+
+def coin_key(item: Dict) -> str:
+    """심볼이 비어 있는 경우가 많으므로 symbol → name 순으로 식별자를 결정"""
+    return (item.get("symbol") or item.get("name") or "").strip()
+
+
+class SnapshotStore:
+    def __init__(self, db_path: str = "kimpga_history.db"):
+        self.db_path = db_path
+        self.conn: Optional[sqlite3.Connection] = None
+
+    def connect(self):
+        if self.conn is None:
+            # 폴링 스레드와 조회가 같은 연결을 공유할 수 있도록 check_same_thread=False
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            cur = self.conn.cursor()
+            cur.execute("PRAGMA journal_mode = WAL")
+            cur.execute("PRAGMA synchronous = NORMAL")
+            cur.close()
+            self.create_table()
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    def create_table(self):
+        cur = self.conn.cursor()
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS Snapshots (
+                ts REAL NOT NULL,
+                source TEXT NOT NULL,
+                rank INTEGER,
+                symbol TEXT NOT NULL,
+                name TEXT,
+                price REAL,
+                premium REAL
+            )
+            """
+        )
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_symbol_ts ON Snapshots (symbol, ts)")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_ts ON Snapshots (ts)")
+        self.conn.commit()
+        cur.close()
+
+    def append_snapshot(self, items: Iterable[Dict], source: str = "", ts: Optional[float] = None) -> int:
+        """파싱된 코인 목록 한 번(스냅샷)을 같은 타임스탬프로 추가. Returns inserted rows."""
+        self.connect()
+        ts = time.time() if ts is None else ts
+        rows: List[Tuple] = []
+        for i, item in enumerate(items):
+            key = coin_key(item)
+            if not key:
+                continue
+            rank = parse_number(item.get("rank"))
+            rows.append((
+                ts,
+                source,
+                int(rank) if rank is not None else i + 1,
+                key,
+                item.get("name") or "",
+                parse_number(item.get("price")),
+                parse_number(item.get("premium")),
+            ))
+        if not rows:
+            return 0
+        cur = self.conn.cursor()
+        cur.executemany(
+            "INSERT INTO Snapshots (ts, source, rank, symbol, name, price, premium) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self.conn.commit()
+        cur.close()
+        return len(rows)
+
+    def premium_history(self, symbol: str, since_seconds: float = 3600, now: Optional[float] = None) -> List[Tuple[float, Optional[float], Optional[float]]]:
+        """최근 since_seconds 동안 symbol의 (ts, premium, price) 목록 (시간순)"""
+        self.connect()
+        now = time.time() if now is None else now
+        cur = self.conn.cursor()
+        cur.execute(
+            "SELECT ts, premium, price FROM Snapshots WHERE symbol = ? AND ts >= ? ORDER BY ts",
+            (symbol, now - since_seconds),
+        )
+        rows = cur.fetchall()
+        cur.close()
+        return rows
+
+    def latest_snapshot(self, source: Optional[str] = None) -> List[Tuple]:
+        """가장 최근 스냅샷의 (rank, symbol, name, price, premium) 목록"""
+        self.connect()
+        cur = self.conn.cursor()
+        if source is None:
+            cur.execute("SELECT MAX(ts) FROM Snapshots")
+        else:
+            cur.execute("SELECT MAX(ts) FROM Snapshots WHERE source = ?", (source,))
+        last = cur.fetchone()[0]
+        if last is None:
+            cur.close()
+            return []
+        if source is None:
+            cur.execute("SELECT rank, symbol, name, price, premium FROM Snapshots WHERE ts = ? ORDER BY rank", (last,))
+        else:
+            cur.execute(
+                "SELECT rank, symbol, name, price, premium FROM Snapshots WHERE ts = ? AND source = ? ORDER BY rank",
+                (last, source),
+            )
+        rows = cur.fetchall()
+        cur.close()
+        return rows
+
+    def symbols(self) -> List[str]:
+        self.connect()
+        cur = self.conn.cursor()
+        cur.execute("SELECT DISTINCT symbol FROM Snapshots ORDER BY symbol")
+        rows = [r[0] for r in cur.fetchall()]
+        cur.close()
+        return rows
+
+    def count_rows(self) -> int:
+        self.connect()
+        cur = self.conn.cursor()
+        cur.execute("SELECT COUNT(*) FROM Snapshots")
+        n = cur.fetchone()[0]
+        cur.close()
+        return n
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="kimpga 스냅샷 시계열 조회")
+    p.add_argument("--db", default="kimpga_history.db", help="시계열 DB 파일 경로")
+    p.add_argument("--symbol", help="조회할 심볼(또는 코인명)")
+    p.add_argument("--since", type=float, default=3600, help="조회 기간(초, 기본 3600)")
+    args = p.parse_args(argv)
+
+    store = SnapshotStore(args.db)
+    if not args.symbol:
+        print(f"저장된 행: {store.count_rows()}")
+        print("심볼 목록:", ", ".join(store.symbols()))
+    else:
+        for ts, premium, price in store.premium_history(args.symbol, args.since):
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+            print(f"{stamp}  premium={premium}  price={price}")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ JSON 및 CSV로 저장하고 표준 출력으로도 보여주는 간단한 스
 사용법:
     python kimpga_top20.py            # 기본적으로 상위 20개
     python kimpga_top20.py --top 10   # 상위 10개
+    python kimpga_top20.py --poll 5 --db kimpga_history.db   # 5초마다 폴링해 시계열 DB에 누적
 
 참고: 사이트 구조 변경에 대비해 여러 파싱 전략(테이블, 리스트, 스크립트 내 JSON)을 시도합니다.
 """
@@ -18,31 +19,72 @@ import csv
 import json
 import re
 import sys
-from typing import List, Dict, Optional
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
 
 DEFAULT_URL = "https://kimpga.com/"
 
-
-def fetch_html(url: str, timeout: int = 15) -> str:
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-    }
-    resp = requests.get(url, headers=headers, timeout=timeout)
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+}
+
+
+def make_session(pool_size: int = 4) -> requests.Session:
+    """keep-alive 연결을 재사용하는 세션 (폴링 시 매번 TCP/TLS 연결을 새로 맺지 않도록)"""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def fetch_html(url: str, timeout: int = 15, session: Optional[requests.Session] = None) -> str:
+    if session is None:
+        resp = requests.get(url, headers=HEADERS, timeout=timeout)
+    else:
+        resp = session.get(url, timeout=timeout)
     resp.raise_for_status()
     return resp.text
 
 
+# 행마다 반복 실행되는 정규식은 모듈 로드 시 한 번만 컴파일
+_WS_RE = re.compile(r"\s+")
+_PRICE_COL_RE = re.compile(r"[₩$€¥]|\d{1,3}(,\d{3})+(\.\d+)?")
+_PREMIUM_WORD_RE = re.compile(r"프리미엄|Premium", re.I)
+_INT_RE = re.compile(r"^\d+$")
+_PRICE_TEXT_RE = re.compile(r"[₩$€¥]\s*[\d,]+(?:\.\d+)?")
+_PCT_RE = re.compile(r"-?\d+\.?\d*%")
+# 스크립트 변수 대입문의 "= " 까지만 찾고, 값 자체는 JSONDecoder.raw_decode로 정확히 하나만 디코딩
+# (값을 .*? 로 잡으면 큰 페이지에서 백트래킹이 심하고 중간의 "};"에서 잘릴 수 있음)
+_JS_ASSIGNMENTS = [
+    re.compile(r"window\.__INITIAL_STATE__\s*=\s*"),
+    re.compile(r"var\s+initialData\s*=\s*"),
+]
+_JSON_DECODER = json.JSONDecoder()
+# 코인 항목으로 보이는 dict가 가질 만한 키
+_COIN_KEYS = {"symbol", "abbr", "name", "coin", "price", "value", "premium", "rank", "no"}
+
+LIST_SELECTORS = [
+    "div.coin", "li.coin", ".coin-row", ".market-row", ".crypto-row", ".coinListRow",
+]
+
+
 def _clean_text(s: Optional[str]) -> str:
     if not s:
         return ""
-    return re.sub(r"\s+", " ", s).strip()
+    return _WS_RE.sub(" ", s).strip()
 
 
 def parse_table_rows(rows, top_n: int) -> List[Dict]:
@@ -67,17 +109,17 @@ def parse_table_rows(rows, top_n: int) -> List[Dict]:
 
         # Find price-like and percent-like columns
         for t in texts:
-            if price is None and re.search(r"[₩$€¥]|\d{1,3}(,\d{3})+(\.\d+)?", t):
+            if price is None and _PRICE_COL_RE.search(t):
                 price = t
-            if premium is None and ("%" in t or re.search(r"프리미엄|Premium", t, re.I)):
+            if premium is None and ("%" in t or _PREMIUM_WORD_RE.search(t)):
                 premium = t
-            if rank is None and re.match(r"^\d+$", t):
+            if rank is None and _INT_RE.match(t):
                 rank = t
 
         if not name and texts:
             # try first textual column that isn't purely numeric
             for t in texts:
-                if not re.match(r"^\d+$", t):
+                if not _INT_RE.match(t):
                     name = t
                     break
 
@@ -97,27 +139,33 @@ def parse_table_rows(rows, top_n: int) -> List[Dict]:
     return results
 
 
-def parse_html_for_coins(html: str, top_n: int = 20) -> List[Dict]:
-    soup = BeautifulSoup(html, "lxml")
+def _prefer(candidates: list, hint) -> list:
+    """지난번에 성공한 후보(hint)를 맨 앞으로 옮긴 순서"""
+    if hint is None or hint not in candidates:
+        return candidates
+    return [hint] + [c for c in candidates if c != hint]
+
 
+def _strategy_table(html: str, get_soup, top_n: int, hint) -> Tuple[List[Dict], Optional[int]]:
     # 1) 가장 일반적인 경우: <table> 형식으로 상위 코인들이 정리되어 있음
-    tables = soup.find_all("table")
-    for table in tables:
+    tables = get_soup().find_all("table")
+    for idx in _prefer(list(range(len(tables))), hint):
         try:
-            tbody = table.find("tbody") or table
+            tbody = tables[idx].find("tbody") or tables[idx]
             rows = tbody.find_all("tr")
             if len(rows) >= 1:
                 parsed = parse_table_rows(rows, top_n)
                 if parsed:
-                    return parsed
+                    return parsed, idx
         except Exception:
             continue
+    return [], None
 
+
+def _strategy_list(html: str, get_soup, top_n: int, hint) -> Tuple[List[Dict], Optional[str]]:
     # 2) div/li 리스트 형식
-    selectors = [
-        "div.coin", "li.coin", ".coin-row", ".market-row", ".crypto-row", ".coinListRow",
-    ]
-    for sel in selectors:
+    soup = get_soup()
+    for sel in _prefer(LIST_SELECTORS, hint):
         rows = soup.select(sel)
         if rows:
             results = []
@@ -125,8 +173,8 @@ def parse_html_for_coins(html: str, top_n: int = 20) -> List[Dict]:
                 text = _clean_text(r.get_text(" ", strip=True))
                 a = r.find("a")
                 name = _clean_text(a.get_text()) if a else text.split()[0:2]
-                price_match = re.search(r"[₩$€¥]\s*[\d,]+(?:\.\d+)?", text)
-                pct_match = re.search(r"-?\d+\.?\d*%", text)
+                price_match = _PRICE_TEXT_RE.search(text)
+                pct_match = _PCT_RE.search(text)
                 results.append({
                     "rank": "",
                     "name": name if isinstance(name, str) else " ".join(name),
@@ -137,40 +185,154 @@ def parse_html_for_coins(html: str, top_n: int = 20) -> List[Dict]:
                     "raw_text": text,
                 })
             if results:
-                return results
+                return results, sel
+    return [], None
+
+
+def extract_js_value(html: str, pattern: re.Pattern) -> Optional[object]:
+    """pattern(대입문 앞부분)이 처음 나오는 위치 뒤에서 JSON 값 하나를 디코딩.
+    스캔과 디코딩 모두 문서 길이에 선형이며, 디코딩에 실패하면 다음 대입문을 찾는다."""
+    pos = 0
+    while True:
+        m = pattern.search(html, pos)
+        if not m:
+            return None
+        try:
+            value, _ = _JSON_DECODER.raw_decode(html, m.end())
+            return value
+        except ValueError:
+            pos = m.end()
+
+
+def _looks_like_coin_list(v) -> bool:
+    return (
+        isinstance(v, list)
+        and len(v) > 0
+        and isinstance(v[0], dict)
+        and bool(_COIN_KEYS & v[0].keys())
+    )
+
+
+def find_coin_list(data) -> Optional[List[Dict]]:
+    """상태 트리를 너비 우선으로 순회해 코인 목록 모양(dict 리스트, 코인 관련 키 포함)의 리스트를 찾는다.
+    그런 리스트가 없으면 처음 발견한 dict 리스트를 반환."""
+    fallback = None
+    queue = deque([data])
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, dict):
+            children = node.values()
+        elif isinstance(node, list):
+            if node and isinstance(node[0], dict):
+                if _looks_like_coin_list(node):
+                    return node
+                if fallback is None:
+                    fallback = node
+            children = node
+        else:
+            continue
+        for child in children:
+            if isinstance(child, (dict, list)):
+                queue.append(child)
+    return fallback
+
 
+def _strategy_script(html: str, get_soup, top_n: int, hint) -> Tuple[List[Dict], Optional[int]]:
     # 3) 페이지에 JSON 데이터가 포함된 경우 (스크립트 변수, window.__INITIAL_STATE__ 등)
     # 매우 일반적인 패턴을 몇 가지 시도
-    js_patterns = [r"window\.__INITIAL_STATE__\s*=\s*(\{.*?\})\s*;", r"var\s+initialData\s*=\s*(\[.*?\])\s*;"]
-    for p in js_patterns:
-        m = re.search(p, html, re.S)
-        if m:
-            try:
-                data = json.loads(m.group(1))
-                # 탐색해 코인 목록을 찾아 반환 — 구조가 다를 수 있으므로 간단히 시도
-                if isinstance(data, dict):
-                    # look for keys with coin/market
-                    for k, v in data.items():
-                        if isinstance(v, list) and len(v) and isinstance(v[0], dict):
-                            # take first list of dicts
-                            return [
-                                {
-                                    "rank": item.get("rank") or item.get("no") or "",
-                                    "name": item.get("name") or item.get("coin") or "",
-                                    "symbol": item.get("symbol") or item.get("abbr") or "",
-                                    "price": item.get("price") or item.get("value") or "",
-                                    "premium": item.get("premium") or "",
-                                    "url": item.get("url") or "",
-                                }
-                                for item in v[:top_n]
-                            ]
-            except Exception:
-                pass
+    for idx in _prefer(list(range(len(_JS_ASSIGNMENTS))), hint):
+        data = extract_js_value(html, _JS_ASSIGNMENTS[idx])
+        if data is None:
+            continue
+        coins = find_coin_list(data)
+        if coins:
+            return [
+                {
+                    "rank": item.get("rank") or item.get("no") or "",
+                    "name": item.get("name") or item.get("coin") or "",
+                    "symbol": item.get("symbol") or item.get("abbr") or "",
+                    "price": item.get("price") or item.get("value") or "",
+                    "premium": item.get("premium") or "",
+                    "url": item.get("url") or "",
+                }
+                for item in coins[:top_n]
+                if isinstance(item, dict)
+            ], idx
+    return [], None
+
+
+# 시도 순서대로 등록된 파싱 전략
+STRATEGIES = {
+    "table": _strategy_table,
+    "list": _strategy_list,
+    "script": _strategy_script,
+}
+
+# 페이지(URL)별로 마지막에 성공한 (전략, 그 안의 후보(테이블 번호/셀렉터/패턴 번호))
+# 여러 URL을 폴링해도 서로의 힌트를 덮어쓰지 않도록 URL마다 따로 기억
+_last_hit: Dict[Optional[str], Tuple[str, object]] = {}
+# 전략별 시도 횟수, 성공 횟수, 누적 소요 시간(초)
+_stats: Dict[str, Dict[str, float]] = {name: {"calls": 0, "hits": 0, "seconds": 0.0} for name in STRATEGIES}
+# _stats와 _last_hit을 함께 보호 (폴링 시 여러 스레드에서 파싱)
+_stats_lock = threading.Lock()
+
+
+def parse_html_for_coins(html: str, top_n: int = 20, source: Optional[str] = None) -> List[Dict]:
+    """source: 페이지 URL - 이 페이지에서 마지막으로 성공한 전략부터 시도"""
+    # BeautifulSoup 파싱은 비싸므로 실제로 필요한 전략이 있을 때만 수행
+    soup_cache: List[BeautifulSoup] = []
+
+    def get_soup() -> BeautifulSoup:
+        if not soup_cache:
+            soup_cache.append(BeautifulSoup(html, "lxml"))
+        return soup_cache[0]
+
+    with _stats_lock:
+        last_strategy, last_key = _last_hit.get(source, (None, None))
+    for name in _prefer(list(STRATEGIES), last_strategy):
+        hint = last_key if name == last_strategy else None
+        t0 = time.perf_counter()
+        try:
+            items, key = STRATEGIES[name](html, get_soup, top_n, hint)
+        except Exception:
+            items, key = [], None
+        elapsed = time.perf_counter() - t0
+        with _stats_lock:
+            st = _stats[name]
+            st["calls"] += 1
+            st["seconds"] += elapsed
+            if items:
+                st["hits"] += 1
+                _last_hit[source] = (name, key)
+        if items:
+            return items
 
     # 실패 시 빈 리스트 반환
     return []
 
 
+def strategy_report() -> str:
+    """전략별 시도/성공 횟수, 적중률, 평균 소요 시간 표"""
+    lines = [f"{'strategy':<8} {'calls':>6} {'hits':>6} {'hit%':>6} {'avg ms':>8}"]
+    with _stats_lock:
+        for name, st in _stats.items():
+            calls = int(st["calls"])
+            hits = int(st["hits"])
+            rate = hits / calls * 100 if calls else 0.0
+            avg = st["seconds"] / calls * 1000 if calls else 0.0
+            lines.append(f"{name:<8} {calls:>6} {hits:>6} {rate:>5.1f}% {avg:>8.2f}")
+        for source, (last, key) in _last_hit.items():
+            lines.append(f"last hit: {last} ({key})" + (f" - {source}" if source else ""))
+    return "\n".join(lines)
+
+
+def reset_strategy_stats() -> None:
+    with _stats_lock:
+        for st in _stats.values():
+            st.update(calls=0, hits=0, seconds=0.0)
+        _last_hit.clear()
+
+
 def save_json(data: List[Dict], path: str) -> None:
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
@@ -188,21 +350,97 @@ def save_csv(data: List[Dict], path: str) -> None:
             writer.writerow(row)
 
 
+def poll_once(urls: List[str], session: requests.Session, top_n: int, executor: ThreadPoolExecutor) -> Dict[str, List[Dict]]:
+    """여러 URL을 병렬로 가져와 파싱. Returns {url: items} (실패한 URL은 제외)"""
+    def job(url: str) -> List[Dict]:
+        return parse_html_for_coins(fetch_html(url, session=session), top_n=top_n, source=url)
+
+    results: Dict[str, List[Dict]] = {}
+    futures = {url: executor.submit(job, url) for url in urls}
+    for url, fut in futures.items():
+        try:
+            results[url] = fut.result()
+        except Exception as e:
+            print(f"[ERROR] {url}: {e}")
+    return results
+
+
+def poll_loop(urls: List[str], store, interval: float, top_n: int = 20, iterations: int = 0, report: bool = False) -> None:
+    """interval초마다 urls를 폴링해 store(kimpga_store.SnapshotStore)에 스냅샷을 추가.
+    iterations가 0이면 Ctrl+C로 중단할 때까지 반복. report이면 폴링마다 파싱 전략 통계를 출력."""
+    session = make_session(pool_size=max(4, len(urls)))
+    executor = ThreadPoolExecutor(max_workers=max(1, len(urls)))
+    n = 0
+    next_run = time.monotonic()
+    try:
+        while iterations <= 0 or n < iterations:
+            ts = time.time()
+            try:
+                # 요청/파싱 오류는 poll_once가 URL별로 출력하고 건너뜀
+                results = poll_once(urls, session, top_n, executor)
+            except Exception as e:
+                print(f"[ERROR] 폴링 실패: {e}")
+                results = {}
+            for url, items in results.items():
+                try:
+                    inserted = store.append_snapshot(items, source=url, ts=ts)
+                except Exception as e:
+                    # 한 번 저장에 실패해도 다음 폴링은 계속
+                    print(f"[ERROR] {url}: 저장 실패: {e}")
+                    continue
+                print(f"[{time.strftime('%H:%M:%S')}] {url}: {inserted}개 저장")
+            if report:
+                print(strategy_report())
+            n += 1
+            # 고정 주기 유지: 처리 시간만큼 다음 대기 시간을 줄임
+            next_run += interval
+            delay = next_run - time.monotonic()
+            if delay > 0 and (iterations <= 0 or n < iterations):
+                time.sleep(delay)
+            elif delay <= 0:
+                next_run = time.monotonic()
+    except KeyboardInterrupt:
+        print("폴링을 중단합니다.")
+    finally:
+        executor.shutdown(wait=False)
+        session.close()
+
+
 def main(argv=None):
     p = argparse.ArgumentParser(description="kimpga.com 상위 N개 코인 크롤러")
-    p.add_argument("--url", default=DEFAULT_URL, help="크롤링할 URL (기본: kimpga.com)")
+    p.add_argument("--url", action="append", help="크롤링할 URL (여러 번 지정 가능, 기본: kimpga.com)")
     p.add_argument("--top", type=int, default=20, help="가져올 상위 코인 수")
     p.add_argument("--out-json", default="kimpga_top.json", help="저장할 JSON 파일 경로")
     p.add_argument("--out-csv", default="kimpga_top.csv", help="저장할 CSV 파일 경로")
+    p.add_argument("--poll", type=float, default=0, help="폴링 주기(초). 0이면 한 번만 실행")
+    p.add_argument("--iterations", type=int, default=0, help="폴링 횟수 (0 = 무한)")
+    p.add_argument("--db", default="kimpga_history.db", help="폴링 결과를 누적할 시계열 DB 경로")
+    p.add_argument("--report", action="store_true", help="파싱 전략별 적중률/소요 시간 출력")
     args = p.parse_args(argv)
+    urls = args.url or [DEFAULT_URL]
+    if len(urls) > 1 and args.poll <= 0:
+        # 한 번 실행은 결과를 --out-json/--out-csv 한 쌍에만 저장하므로 URL 하나만 받음
+        p.error("--url을 여러 개 지정하려면 --poll과 함께 사용하세요.")
+
+    if args.poll > 0:
+        from kimpga_store import SnapshotStore
+
+        store = SnapshotStore(args.db)
+        try:
+            poll_loop(urls, store, args.poll, top_n=args.top, iterations=args.iterations, report=args.report)
+        finally:
+            store.close()
+        return
 
     try:
-        html = fetch_html(args.url)
+        html = fetch_html(urls[0])
     except Exception as e:
         print(f"[ERROR] 페이지를 가져오지 못했습니다: {e}")
         sys.exit(2)
 
-    items = parse_html_for_coins(html, top_n=args.top)
+    items = parse_html_for_coins(html, top_n=args.top, source=urls[0])
+    if args.report:
+        print(strategy_report())
 
     if not items:
         print("크롤링 결과가 비어있습니다. 사이트 구조가 변경되었을 수 있습니다.")
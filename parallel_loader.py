@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+parallel_loader.py
+
+대량 샘플 생성/CSV 피드 적재를 여러 코어로 나눠 처리하는 파이프라인 로더.
+
+    [생산자 프로세스 풀] --(크기 제한 큐)--> [쓰기 프로세스 1개: ProductDB.bulk_insert]
+
+- 생산자: 배치 단위로 행을 생성(generate_sample_items / generate_sample_data)하거나
+  CSV 파일의 바이트 구간을 나눠 파싱해서 큐에 넣음
+- 쓰기 프로세스: SQLite는 쓰기 연결이 하나일 때 가장 빠르므로 한 프로세스만 큐를 비우며 삽입
+- 역압(backpressure): 큐가 가득 차면 생산자의 put이 막혀 메모리가 무한정 늘지 않음
+- 단계별 지표: 생산자 처리량과 큐 대기(막힘) 시간, 쓰기 처리량과 큐 대기(굶음) 시간
+
+Usage:
+    python parallel_loader.py --db MyProduct.db --generate 10000000
+    python parallel_loader.py --db MyProduct.db --generate 1000000 --scheme data --workers 4
+    python parallel_loader.py --db MyProduct.db --csv products.csv
+
+함수: load_parallel, load_samples, load_csv, csv_ranges, print_metrics
+"""
+import argparse
+import csv
+import io
+import multiprocessing as mp
+import os
+import queue
+import random
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+_DONE = None
+
+# 생산자 프로세스 전역 (Pool initializer에서 설정)
+_queue = None
+_stop = None
+
+
+def _init_producer(q, stop) -> None:
+    global _queue, _stop
+    _queue, _stop = q, stop
+
+
+def _put(batch: List[Tuple[str, int]]) -> float:
+    """큐에 넣고 막혀 있던 시간 반환. 쓰기 프로세스가 죽으면 중단"""
+    t0 = time.perf_counter()
+    while True:
+        try:
+            _queue.put(batch, timeout=0.5)
+            return time.perf_counter() - t0
+        except queue.Full:
+            if _stop.is_set():
+                raise RuntimeError("쓰기 프로세스가 중단되어 적재를 멈춥니다.")
+
+
+def _produce(task: Tuple) -> Dict:
+    """task = (생산 함수, 인자...). 생성한 행을 batch_rows씩 큐에 넣고 지표 반환"""
+    func, args, batch_rows = task[0], task[1], task[2]
+    t0 = time.perf_counter()
+    rows = 0
+    blocked = 0.0
+    batch: List[Tuple[str, int]] = []
+    for item in func(*args):
+        batch.append(item)
+        if len(batch) >= batch_rows:
+            blocked += _put(batch)
+            rows += len(batch)
+            batch = []
+    if batch:
+        blocked += _put(batch)
+        rows += len(batch)
+    return {"pid": os.getpid(), "rows": rows, "seconds": time.perf_counter() - t0, "blocked": blocked}
+
+
+def _writer(db_path: str, q, results, stop, chunk_size: int) -> None:
+    """큐가 끝 표시(None)를 보낼 때까지 비우며 bulk_insert"""
+    from product_db import ProductDB
+
+    stats = {"rows": 0, "seconds": 0.0, "starved": 0.0, "batches": 0}
+    t0 = time.perf_counter()
+
+    def drain():
+        while True:
+            t = time.perf_counter()
+            batch = q.get()
+            stats["starved"] += time.perf_counter() - t
+            if batch is _DONE:
+                return
+            stats["batches"] += 1
+            yield from batch
+
+    try:
+        pdb = ProductDB(db_path=db_path)
+        pdb.create_table()
+        stats["rows"] = pdb.bulk_insert(drain(), chunk_size=chunk_size)
+        pdb.close()
+    except BaseException as e:
+        stop.set()
+        stats["error"] = repr(e)
+    stats["seconds"] = time.perf_counter() - t0
+    results.put(stats)
+
+
+def load_parallel(
+    db_path: str,
+    tasks: Sequence[Tuple[Callable, tuple]],
+    workers: Optional[int] = None,
+    queue_size: int = 16,
+    batch_rows: int = 10000,
+    chunk_size: int = 50000,
+) -> Dict:
+    """
+    tasks의 각 (함수, 인자)를 생산자 풀에서 실행하고 한 쓰기 프로세스로 적재
+
+    Args:
+        tasks: [(행 이터러블을 돌려주는 최상위 함수, 인자 튜플), ...] - 프로세스로 보내야 하므로 pickle 가능해야 함
+        workers: 생산자 프로세스 수 (기본: CPU 수 - 1, 쓰기 프로세스 몫을 남김)
+        queue_size: 큐에 쌓아 둘 최대 배치 수 (역압 기준)
+        batch_rows: 생산자가 한 번에 큐에 넣는 행 수
+        chunk_size: 쓰기 프로세스의 커밋 단위
+
+    Returns:
+        {"rows", "seconds", "producers": {...}, "writer": {...}} 단계별 지표
+    """
+    workers = workers or max(1, (os.cpu_count() or 2) - 1)
+    q = mp.Queue(maxsize=queue_size)
+    results = mp.Queue()
+    stop = mp.Event()
+
+    t0 = time.perf_counter()
+    writer = mp.Process(target=_writer, args=(db_path, q, results, stop, chunk_size), daemon=True)
+    writer.start()
+
+    jobs = [(func, args, batch_rows) for func, args in tasks]
+    writer_stats: Optional[Dict] = None
+    try:
+        with mp.Pool(workers, initializer=_init_producer, initargs=(q, stop)) as pool:
+            async_result = pool.map_async(_produce, jobs, chunksize=1)
+            while not async_result.ready():
+                async_result.wait(0.5)
+                if not writer.is_alive():
+                    stop.set()
+            produced = async_result.get()
+            # terminate()로 끝내면 생산자 큐의 전송 스레드에 남은 배치가 버려지므로 정상 종료를 기다림
+            pool.close()
+            pool.join()
+        q.put(_DONE)
+        writer_stats = results.get()
+    finally:
+        if writer_stats is None:
+            # 생산자 오류 등으로 중간에 빠져나옴: 쓰기 프로세스가 q.get()에서 영원히 기다리며
+            # 쓰기 연결을 잡고 있지 않도록 끝 표시를 보내고 정리
+            stop.set()
+            try:
+                q.put(_DONE, timeout=1)
+            except queue.Full:
+                pass
+            writer.join(timeout=10)
+            if writer.is_alive():
+                writer.terminate()
+                writer.join()
+            try:
+                writer_stats = results.get(timeout=0.5)
+            except queue.Empty:
+                pass
+        else:
+            writer.join()
+        if writer_stats is not None and "error" in writer_stats:
+            # 생산자 예외를 처리하는 중이면 그 예외도 "During handling..."으로 함께 표시됨
+            raise RuntimeError(f"쓰기 프로세스 오류: {writer_stats['error']}")
+    elapsed = time.perf_counter() - t0
+
+    rows = sum(p["rows"] for p in produced)
+    busy = sum(p["seconds"] - p["blocked"] for p in produced)
+    blocked = sum(p["blocked"] for p in produced)
+    return {
+        "rows": writer_stats["rows"],
+        "seconds": elapsed,
+        "producers": {
+            "workers": workers,
+            "tasks": len(produced),
+            "rows": rows,
+            "busy_seconds": busy,
+            "blocked_seconds": blocked,
+            # 프로세스 하나당 순수 생산 속도 × 프로세스 수
+            "rows_per_sec": rows / busy * workers if busy else 0.0,
+        },
+        "writer": {
+            **writer_stats,
+            "insert_seconds": writer_stats["seconds"] - writer_stats["starved"],
+            "rows_per_sec": writer_stats["rows"] / max(writer_stats["seconds"] - writer_stats["starved"], 1e-9),
+        },
+    }
+
+
+def _sample_items(start: int, count: int, seed: int):
+    from product_db import generate_sample_items
+
+    random.seed(seed)
+    return generate_sample_items(count, start=start)
+
+
+def _sample_data(count: int, seed: int):
+    from product_manager import generate_sample_data
+
+    random.seed(seed)
+    return generate_sample_data(count)
+
+
+def load_samples(db_path: str, total: int, scheme: str = "items", task_rows: int = 200000,
+                 seed: int = 0, **kwargs) -> Dict:
+    """
+    샘플 데이터 total개를 task_rows개씩 나눠 병렬 생성 후 적재
+
+    Args:
+        scheme: "items"(product_db의 Product_000001 형식) 또는 "data"(product_manager의 "브랜드 종류 모델" 형식)
+    """
+    tasks = []
+    for n, start in enumerate(range(0, total, task_rows)):
+        count = min(task_rows, total - start)
+        if scheme == "items":
+            tasks.append((_sample_items, (start + 1, count, seed + n)))
+        else:
+            tasks.append((_sample_data, (count, seed + n)))
+    return load_parallel(db_path, tasks, **kwargs)
+
+
+def csv_ranges(path: str, parts: int) -> List[Tuple[int, int]]:
+    """CSV 파일을 줄 경계에 맞춘 (시작, 끝) 바이트 구간 parts개로 나눔"""
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            f.seek(max(size * i // parts, bounds[-1]))
+            f.readline()
+            pos = f.tell()
+            if pos >= size:
+                break
+            if pos > bounds[-1]:
+                bounds.append(pos)
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def _parse_csv_range(path: str, start: int, end: int, name_col: int, price_col: int):
+    """구간 안의 "제품명,가격" 행 파싱 (가격이 숫자가 아닌 행=헤더 등은 건너뜀)"""
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    reader = csv.reader(io.StringIO(data.decode("utf-8-sig")))
+    for row in reader:
+        if len(row) <= max(name_col, price_col):
+            continue
+        try:
+            price = int(row[price_col].replace(",", ""))
+        except ValueError:
+            continue
+        yield (row[name_col], price)
+
+
+def load_csv(db_path: str, csv_path: str, name_col: int = 0, price_col: int = 1,
+             parts: Optional[int] = None, **kwargs) -> Dict:
+    """CSV 피드를 바이트 구간으로 나눠 병렬 파싱 후 적재 (인용부호 안의 줄바꿈은 지원하지 않음)"""
+    parts = parts or (os.cpu_count() or 2) * 4
+    tasks = [(_parse_csv_range, (csv_path, a, b, name_col, price_col)) for a, b in csv_ranges(csv_path, parts)]
+    return load_parallel(db_path, tasks, **kwargs)
+
+
+def print_metrics(m: Dict) -> None:
+    p, w = m["producers"], m["writer"]
+    print(f"Inserted {m['rows']:,} rows in {m['seconds']:.2f} seconds ({m['rows'] / m['seconds']:,.0f} rows/s)")
+    print(f"  생산자 {p['workers']}개, 작업 {p['tasks']}개: {p['rows_per_sec']:,.0f} rows/s, "
+          f"큐가 차서 막힌 시간 {p['blocked_seconds']:.2f}s / 작업 시간 {p['busy_seconds']:.2f}s")
+    print(f"  쓰기 프로세스: {w['rows_per_sec']:,.0f} rows/s, 배치 {w['batches']}개, "
+          f"큐를 기다린 시간 {w['starved']:.2f}s / 전체 {w['seconds']:.2f}s")
+    if w["starved"] > w["seconds"] * 0.2:
+        print("  → 쓰기 프로세스가 자주 기다립니다. --workers를 늘려 보세요.")
+    elif p["blocked_seconds"] > p["busy_seconds"]:
+        print("  → 생산자가 쓰기 속도를 기다리고 있습니다. (쓰기 단계가 병목)")
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Products 병렬 파이프라인 적재")
+    p.add_argument("--db", default="MyProduct.db", help="Database file path (default: MyProduct.db)")
+    src = p.add_mutually_exclusive_group(required=True)
+    src.add_argument("--generate", type=int, help="생성할 샘플 행 수")
+    src.add_argument("--csv", help="적재할 CSV 파일 (제품명,가격)")
+    p.add_argument("--scheme", choices=["items", "data"], default="items", help="샘플 이름 형식")
+    p.add_argument("--workers", type=int, default=None, help="생산자 프로세스 수 (기본: CPU 수 - 1)")
+    p.add_argument("--queue", type=int, default=16, help="큐에 쌓아 둘 최대 배치 수")
+    p.add_argument("--batch", type=int, default=10000, help="큐로 보내는 배치 크기")
+    p.add_argument("--chunk", type=int, default=50000, help="Chunk size for bulk insert")
+    args = p.parse_args(argv)
+
+    opts = dict(workers=args.workers, queue_size=args.queue, batch_rows=args.batch, chunk_size=args.chunk)
+    if args.csv:
+        metrics = load_csv(args.db, args.csv, **opts)
+    else:
+        metrics = load_samples(args.db, args.generate, scheme=args.scheme, **opts)
+    print_metrics(metrics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+price_analytics.py
+
+Products 테이블의 가격 통계를 NumPy로 계산하는 분석 모듈.
+
+가격과 브랜드 열을 DB에서 한 번만 읽어 NumPy 배열로 올려 두고, 히스토그램/백분위수/
+브랜드별 통계/가격 범위 개수를 배열 연산으로 계산합니다. 범위 개수는 정렬된 가격 배열에서
+searchsorted로 찾으므로 select_by_price_range()처럼 매번 테이블 전체를 훑지 않습니다.
+
+브랜드는 generate_sample_data()의 이름 규칙("{브랜드} {제품종류} {모델번호}")에서 첫 단어로 얻고,
+공백이 없는 이름(예: product_db.py의 "Product_000001")은 OTHER_BRAND로 묶습니다.
+
+Usage:
+    python price_analytics.py --db MyProduct.db
+    python price_analytics.py --db MyProduct.db --bins 10 --bench 100000
+
+클래스: PriceAnalytics
+"""
+import argparse
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+OTHER_BRAND = "(기타)"
+
+# 이름의 첫 단어(브랜드)를 SQLite에서 잘라서 가져옴
+SQL_BRAND_PRICE = """
+SELECT CASE WHEN instr(productName, ' ') > 0
+            THEN substr(productName, 1, instr(productName, ' ') - 1)
+            ELSE NULL END,
+       productPrice
+FROM Products
+"""
+
+
+def _connection(db):
+    """ProductDB(conn) / ProductManager(connection)의 sqlite3 연결"""
+    if hasattr(db, "connect") and getattr(db, "conn", "missing") is None:
+        db.connect()
+    return db.conn if hasattr(db, "conn") else db.connection
+
+
+class PriceAnalytics:
+    def __init__(self, prices: np.ndarray, brand_codes: Optional[np.ndarray] = None, brands: Sequence[str] = ()):
+        """
+        Args:
+            prices: 가격 배열 (int64)
+            brand_codes: 행마다 brands 목록의 인덱스
+            brands: 브랜드 이름 목록
+        """
+        self.prices = np.asarray(prices, dtype=np.int64)
+        self.brand_codes = (
+            np.zeros(len(self.prices), dtype=np.int32) if brand_codes is None else np.asarray(brand_codes, dtype=np.int32)
+        )
+        self.brands = list(brands) or [OTHER_BRAND]
+        self.sorted_prices = np.sort(self.prices)
+
+    @classmethod
+    def from_db(cls, db, chunk_size: int = 50000) -> "PriceAnalytics":
+        """ProductDB/ProductManager에서 가격과 브랜드 열을 한 번 읽어 생성"""
+        cur = _connection(db).cursor()
+        # row_factory가 설정된 연결이어도 이 커서는 튜플로 받음
+        cur.row_factory = None
+        prices = array("q")
+        codes = array("i")
+        lookup: Dict[str, int] = {}
+        brands: List[str] = []
+        try:
+            cur.execute(SQL_BRAND_PRICE)
+            while True:
+                rows = cur.fetchmany(chunk_size)
+                if not rows:
+                    break
+                for brand, price in rows:
+                    brand = brand or OTHER_BRAND
+                    code = lookup.get(brand)
+                    if code is None:
+                        code = lookup[brand] = len(brands)
+                        brands.append(brand)
+                    codes.append(code)
+                    prices.append(price)
+        finally:
+            cur.close()
+        return cls(np.frombuffer(prices, dtype=np.int64), np.frombuffer(codes, dtype=np.int32), brands)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def count_between(self, min_price: int, max_price: int) -> int:
+        """min_price <= 가격 <= max_price 인 제품 수 (select_by_price_range와 같은 BETWEEN 의미)"""
+        lo = np.searchsorted(self.sorted_prices, min_price, side="left")
+        hi = np.searchsorted(self.sorted_prices, max_price, side="right")
+        return int(max(hi - lo, 0))
+
+    def count_between_many(self, min_prices, max_prices) -> np.ndarray:
+        """여러 범위의 개수를 한 번에 계산"""
+        lo = np.searchsorted(self.sorted_prices, np.asarray(min_prices), side="left")
+        hi = np.searchsorted(self.sorted_prices, np.asarray(max_prices), side="right")
+        return np.maximum(hi - lo, 0)
+
+    def histogram(self, bins=20, price_range: Optional[Tuple[int, int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns (구간별 개수, 구간 경계)"""
+        return np.histogram(self.prices, bins=bins, range=price_range)
+
+    def percentiles(self, qs: Sequence[float] = (10, 25, 50, 75, 90, 99)) -> Dict[float, float]:
+        if not len(self.prices):
+            return {}
+        values = np.percentile(self.sorted_prices, qs)
+        return dict(zip(qs, values.tolist()))
+
+    def brand_stats(self) -> List[Dict]:
+        """브랜드별 개수/평균/최소/최대 (개수 많은 순)"""
+        if not len(self.prices):
+            return []
+        order = np.argsort(self.brand_codes, kind="stable")
+        codes = self.brand_codes[order]
+        prices = self.prices[order]
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(codes)) + 1))
+        counts = np.diff(np.append(starts, len(codes)))
+        sums = np.add.reduceat(prices, starts)
+        mins = np.minimum.reduceat(prices, starts)
+        maxs = np.maximum.reduceat(prices, starts)
+        stats = [
+            {
+                "brand": self.brands[codes[s]],
+                "count": int(c),
+                "mean": float(total) / int(c),
+                "min": int(lo),
+                "max": int(hi),
+            }
+            for s, c, total, lo, hi in zip(starts, counts, sums, mins, maxs)
+        ]
+        stats.sort(key=lambda r: (-r["count"], r["brand"]))
+        return stats
+
+    def summary(self) -> Dict:
+        if not len(self.prices):
+            return {"count": 0}
+        return {
+            "count": len(self.prices),
+            "mean": float(self.prices.mean()),
+            "min": int(self.sorted_prices[0]),
+            "max": int(self.sorted_prices[-1]),
+        }
+
+
+def main(argv=None):
+    from product_db import ProductDB
+
+    p = argparse.ArgumentParser(description="Products 가격 통계 (NumPy)")
+    p.add_argument("--db", default="MyProduct.db", help="Database file path (default: MyProduct.db)")
+    p.add_argument("--bins", type=int, default=10, help="히스토그램 구간 수")
+    p.add_argument("--bench", type=int, default=0, help="무작위 가격 범위 질의를 N번 실행해 초당 처리량 측정")
+    args = p.parse_args(argv)
+
+    pdb = ProductDB(db_path=args.db)
+    t0 = time.perf_counter()
+    pa = PriceAnalytics.from_db(pdb)
+    pdb.close()
+    print(f"Loaded {len(pa):,} prices in {time.perf_counter() - t0:.2f} seconds")
+    if not len(pa):
+        return
+
+    s = pa.summary()
+    print(f"\n평균 {s['mean']:,.0f}원, 최소 {s['min']:,}원, 최대 {s['max']:,}원")
+
+    print("\n[백분위수]")
+    for q, v in pa.percentiles().items():
+        print(f"  {q:>4}%: {v:>14,.0f}원")
+
+    print("\n[히스토그램]")
+    counts, edges = pa.histogram(args.bins)
+    peak = counts.max() or 1
+    for c, lo, hi in zip(counts, edges[:-1], edges[1:]):
+        print(f"  {lo:>12,.0f} ~ {hi:>12,.0f}  {c:>9,}  {'#' * int(40 * c / peak)}")
+
+    print("\n[브랜드별]")
+    for r in pa.brand_stats():
+        print(f"  {r['brand']:<10} {r['count']:>9,}개  평균 {r['mean']:>12,.0f}  최소 {r['min']:>10,}  최대 {r['max']:>10,}")
+
+    if args.bench:
+        rng = np.random.default_rng(0)
+        a = rng.integers(s["min"], s["max"] + 1, size=args.bench)
+        b = rng.integers(s["min"], s["max"] + 1, size=args.bench)
+        lo, hi = np.minimum(a, b), np.maximum(a, b)
+        t0 = time.perf_counter()
+        for x, y in zip(lo.tolist(), hi.tolist()):
+            pa.count_between(x, y)
+        single = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        pa.count_between_many(lo, hi)
+        batch = time.perf_counter() - t0
+        print(f"\n범위 질의 {args.bench:,}회: 하나씩 {args.bench / single:,.0f}/s, 일괄 {args.bench / batch:,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,28 +6,111 @@ product_db.py
 
 생성된 DB 파일: MyProduct.db (현재 작업 디렉토리)
 테이블: Products(productID INTEGER PRIMARY KEY AUTOINCREMENT, productName TEXT, productPrice INTEGER)
+변경 로그(선택): ProductChanges(seq, op, productID, old/new 이름·가격, ts) - 트리거로 기록, changes_since()로 증분 조회
 
 Usage:
     python d:/work/product_db.py --generate 100000
+    python d:/work/product_db.py --enable-change-log --changes-since 0
 
-클래스 메서드: insert_product, bulk_insert, update_product, delete_product, get_product, select_all, count_products
+클래스 메서드: insert_product, bulk_insert, update_product, delete_product, get_product, select_all, iter_products, count_products, write_snapshot,
+            enable_change_log, changes_since, latest_change_seq, prune_changes, backup
+쿼리 계측(선택): ProductDB(metrics=db_metrics.QueryMetrics()) - 문장별 지연 히스토그램/행 수/느린 쿼리 (db_metrics.py)
 """
 import sqlite3
 import os
 import random
 import time
 import argparse
-from typing import Iterable, List, Optional, Tuple
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class Change(NamedTuple):
+    """One row of the ProductChanges log. op is 'I' (insert), 'U' (update) or 'D' (delete).
+
+    An update that changes productID itself is logged as 'D' of the old ID followed by 'I' of the new ID.
+    """
+    seq: int
+    op: str
+    productID: int
+    old_name: Optional[str]
+    old_price: Optional[int]
+    new_name: Optional[str]
+    new_price: Optional[int]
+    ts: float
+
+
+# Append-only change log filled by triggers, so every writer (ProductDB, ProductManager,
+# other tools) is captured. AUTOINCREMENT keeps seq strictly increasing even after pruning.
+_NOW = "(julianday('now') - 2440587.5) * 86400.0"
+CHANGE_LOG_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS ProductChanges (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        op TEXT NOT NULL CHECK (op IN ('I', 'U', 'D')),
+        productID INTEGER NOT NULL,
+        old_name TEXT,
+        old_price INTEGER,
+        new_name TEXT,
+        new_price INTEGER,
+        ts REAL NOT NULL
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS Products_cdc_insert AFTER INSERT ON Products
+    BEGIN
+        INSERT INTO ProductChanges (op, productID, new_name, new_price, ts)
+        VALUES ('I', NEW.productID, NEW.productName, NEW.productPrice, {_NOW});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS Products_cdc_update AFTER UPDATE ON Products
+    WHEN OLD.productID IS NEW.productID
+         AND (OLD.productName IS NOT NEW.productName OR OLD.productPrice IS NOT NEW.productPrice)
+    BEGIN
+        INSERT INTO ProductChanges (op, productID, old_name, old_price, new_name, new_price, ts)
+        VALUES ('U', NEW.productID, OLD.productName, OLD.productPrice, NEW.productName, NEW.productPrice, {_NOW});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS Products_cdc_rekey AFTER UPDATE ON Products
+    WHEN OLD.productID IS NOT NEW.productID
+    BEGIN
+        INSERT INTO ProductChanges (op, productID, old_name, old_price, ts)
+        VALUES ('D', OLD.productID, OLD.productName, OLD.productPrice, {_NOW});
+        INSERT INTO ProductChanges (op, productID, new_name, new_price, ts)
+        VALUES ('I', NEW.productID, NEW.productName, NEW.productPrice, {_NOW});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS Products_cdc_delete AFTER DELETE ON Products
+    BEGIN
+        INSERT INTO ProductChanges (op, productID, old_name, old_price, ts)
+        VALUES ('D', OLD.productID, OLD.productName, OLD.productPrice, {_NOW});
+    END
+    """,
+]
+CHANGE_LOG_TRIGGERS = ("Products_cdc_insert", "Products_cdc_update", "Products_cdc_rekey", "Products_cdc_delete")
 
 
 class ProductDB:
-    def __init__(self, db_path: str = "MyProduct.db"):
+    def __init__(self, db_path: str = "MyProduct.db", row_factory: Optional[Callable] = None, metrics=None):
+        """row_factory: 조회 행 변환 함수 (예: product_record.product_row_factory). None이면 튜플
+        metrics: db_metrics.QueryMetrics - 주면 모든 쿼리의 시간/행 수를 기록"""
         self.db_path = db_path
+        self.row_factory = row_factory
+        self.metrics = metrics
         self.conn: Optional[sqlite3.Connection] = None
 
     def connect(self):
         if self.conn is None:
-            self.conn = sqlite3.connect(self.db_path)
+            if self.metrics is not None:
+                from db_metrics import connect
+
+                self.conn = connect(self.db_path, self.metrics)
+            else:
+                self.conn = sqlite3.connect(self.db_path)
+            if self.row_factory is not None:
+                self.conn.row_factory = self.row_factory
             # Performance-friendly pragmas for bulk insert
             cur = self.conn.cursor()
             cur.execute("PRAGMA synchronous = OFF")
@@ -143,6 +226,20 @@ class ProductDB:
         cur.close()
         return rows
 
+    def iter_products(self, chunk_size: int = 5000) -> Iterator[Tuple[int, str, int]]:
+        """Stream all rows ordered by productID, fetching chunk_size rows at a time."""
+        self.connect()
+        cur = self.conn.cursor()
+        try:
+            cur.execute("SELECT productID, productName, productPrice FROM Products ORDER BY productID")
+            while True:
+                rows = cur.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cur.close()
+
     def count_products(self) -> int:
         self.connect()
         cur = self.conn.cursor()
@@ -151,10 +248,97 @@ class ProductDB:
         cur.close()
         return n
 
+    def enable_change_log(self) -> None:
+        """Create the ProductChanges table and the triggers that fill it (idempotent).
+
+        Existing triggers are recreated so a DB set up by an older version gets the current definitions.
+        """
+        self.create_table()
+        with self.conn:
+            for name in CHANGE_LOG_TRIGGERS:
+                self.conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            for ddl in CHANGE_LOG_DDL:
+                self.conn.execute(ddl)
+
+    def disable_change_log(self) -> None:
+        """Drop the triggers (e.g. before a huge bulk load); the logged history is kept."""
+        self.connect()
+        with self.conn:
+            for name in CHANGE_LOG_TRIGGERS:
+                self.conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+    def changes_since(self, seq: int = 0, limit: Optional[int] = None, chunk_size: int = 5000) -> Iterator[Change]:
+        """Stream changes with sequence number > seq in order (at most limit rows).
 
-def generate_sample_items(n: int) -> Iterable[Tuple[str, int]]:
-    # predictable-ish but fast generator
-    for i in range(1, n + 1):
+        Consumers remember the last seq they applied and call this again to sync incrementally.
+        Yields nothing if enable_change_log() was never called (like latest_change_seq() returning 0).
+        """
+        self.connect()
+        if not self._has_change_log():
+            return
+        cur = self.conn.cursor()
+        cur.row_factory = None
+        try:
+            cur.execute(
+                "SELECT seq, op, productID, old_name, old_price, new_name, new_price, ts "
+                "FROM ProductChanges WHERE seq > ? ORDER BY seq LIMIT ?",
+                (seq, -1 if limit is None else limit),
+            )
+            while True:
+                rows = cur.fetchmany(chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield Change(*row)
+        finally:
+            cur.close()
+
+    def _has_change_log(self) -> bool:
+        row = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'ProductChanges'"
+        ).fetchone()
+        return row is not None
+
+    def latest_change_seq(self) -> int:
+        """Highest sequence number logged so far (0 if none)."""
+        self.connect()
+        try:
+            row = self.conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'ProductChanges'").fetchone()
+        except sqlite3.OperationalError:
+            # no AUTOINCREMENT table created yet
+            return 0
+        return row[0] if row else 0
+
+    def prune_changes(self, upto_seq: int) -> int:
+        """Delete log rows with seq <= upto_seq once every consumer has applied them. Returns rows deleted."""
+        self.connect()
+        if not self._has_change_log():
+            return 0
+        with self.conn:
+            cur = self.conn.execute("DELETE FROM ProductChanges WHERE seq <= ?", (upto_seq,))
+        return cur.rowcount
+
+    def backup(self, dest_path: str, pages: int = 256, sleep: float = 0.01,
+               progress: Optional[Callable[[int, int], None]] = None, compact: bool = False) -> dict:
+        """Online backup in paced page batches while this store keeps writing (see db_backup.py).
+
+        compact=True also runs VACUUM INTO on the copy. Returns backup stats.
+        """
+        from db_backup import online_backup
+
+        self.connect()
+        return online_backup(self.conn, dest_path, pages, sleep, progress, compact)
+
+    def write_snapshot(self, path: str, chunk_size: int = 5000) -> int:
+        """Write a memory-mappable column snapshot (see product_snapshot.py). Returns row count."""
+        from product_snapshot import write_snapshot
+
+        return write_snapshot(self, path, chunk_size)
+
+
+def generate_sample_items(n: int, start: int = 1) -> Iterable[Tuple[str, int]]:
+    # predictable-ish but fast generator (start lets parallel producers number disjoint ranges)
+    for i in range(start, start + n):
         name = f"Product_{i:06d}"
         price = random.randint(100, 100000)
         yield (name, price)
@@ -165,6 +349,11 @@ def main():
     parser.add_argument("--db", default="MyProduct.db", help="Database file path (default: MyProduct.db)")
     parser.add_argument("--generate", type=int, default=0, help="How many sample rows to generate (0 = skip)")
     parser.add_argument("--chunk", type=int, default=5000, help="Chunk size for bulk insert")
+    parser.add_argument("--enable-change-log", action="store_true", help="Create the ProductChanges log and its triggers")
+    parser.add_argument("--changes-since", type=int, default=None, metavar="SEQ", help="Print logged changes after SEQ")
+    parser.add_argument("--limit", type=int, default=20, help="Max changes to print with --changes-since")
+    parser.add_argument("--metrics", choices=["prometheus", "json"], default=None, help="Print query metrics at exit")
+    parser.add_argument("--slow-ms", type=float, default=100.0, help="Slow query log threshold in ms (with --metrics)")
     args = parser.parse_args()
 
     db_path = args.db
@@ -172,8 +361,15 @@ def main():
 
     print(f"DB file: {os.path.abspath(db_path)}")
 
-    pdb = ProductDB(db_path=db_path)
+    metrics = None
+    if args.metrics:
+        from db_metrics import QueryMetrics
+
+        metrics = QueryMetrics(slow_ms=args.slow_ms)
+    pdb = ProductDB(db_path=db_path, metrics=metrics)
     pdb.create_table()
+    if args.enable_change_log:
+        pdb.enable_change_log()
 
     if generator_count > 0:
         print(f"Generating and inserting {generator_count} items (chunk={args.chunk})...")
@@ -193,7 +389,14 @@ def main():
         for r in sample:
             print(r)
 
+    if args.changes_since is not None:
+        print(f"Changes after seq {args.changes_since} (latest seq: {pdb.latest_change_seq()}):")
+        for change in pdb.changes_since(args.changes_since, limit=args.limit):
+            print(change)
+
     pdb.close()
+    if metrics is not None:
+        print(metrics.to_prometheus() if args.metrics == "prometheus" else metrics.to_json())
 
 
 if __name__ == "__main__":
@@ -1,18 +1,22 @@
 import sqlite3
 import os
-from typing import List, Tuple, Optional
+from typing import Callable, Iterator, List, Tuple, Optional
 
 class ProductManager:
     """SQLite 데이터베이스를 사용하여 전자제품 데이터를 관리하는 클래스"""
     
-    def __init__(self, db_name: str = "MyProduct.db"):
+    def __init__(self, db_name: str = "MyProduct.db", row_factory: Optional[Callable] = None, metrics=None):
         """
         데이터베이스 초기화
         
         Args:
             db_name (str): 데이터베이스 파일명
+            row_factory (Callable): 조회 행 변환 함수 (예: product_record.product_row_factory, None이면 튜플)
+            metrics (QueryMetrics): db_metrics.QueryMetrics - 주면 쿼리 시간/행 수/오류 횟수를 기록
         """
         self.db_name = db_name
+        self.row_factory = row_factory
+        self.metrics = metrics
         self.connection = None
         self.cursor = None
         self.connect()
@@ -21,7 +25,14 @@ class ProductManager:
     def connect(self):
         """데이터베이스 연결"""
         try:
-            self.connection = sqlite3.connect(self.db_name)
+            if self.metrics is not None:
+                from db_metrics import connect
+                
+                self.connection = connect(self.db_name, self.metrics)
+            else:
+                self.connection = sqlite3.connect(self.db_name)
+            if self.row_factory is not None:
+                self.connection.row_factory = self.row_factory
             self.cursor = self.connection.cursor()
             print(f"✓ '{self.db_name}' 데이터베이스에 연결되었습니다.")
         except sqlite3.Error as e:
@@ -103,6 +114,29 @@ class ProductManager:
             print(f"✗ 데이터 조회 오류: {e}")
             return []
     
+    def iter_all(self, chunk_size: int = 5000) -> Iterator[Tuple]:
+        """
+        모든 제품을 chunk_size개씩 나눠 가져오며 순회 (전체를 메모리에 올리지 않음)
+        
+        Args:
+            chunk_size (int): 한 번에 가져올 행 수
+        
+        Returns:
+            Iterator[Tuple]: (productID, productName, productPrice)
+        """
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("SELECT productID, productName, productPrice FROM Products ORDER BY productID")
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield from rows
+        except sqlite3.Error as e:
+            print(f"✗ 데이터 조회 오류: {e}")
+        finally:
+            cursor.close()
+    
     def select_by_id(self, product_id: int) -> Optional[Tuple]:
         """
         특정 ID의 제품 조회
@@ -265,6 +299,31 @@ class ProductManager:
             print(f"✗ 개수 조회 오류: {e}")
             return 0
     
+    def backup(self, dest_path: str, pages: int = 256, sleep: float = 0.01,
+               progress: Optional[Callable[[int, int], None]] = None, compact: bool = False) -> dict:
+        """
+        실행 중에 데이터베이스를 온라인 백업 (db_backup.online_backup 사용)
+        
+        Args:
+            dest_path (str): 백업 파일 경로
+            pages (int): 한 단계에 복사할 페이지 수
+            sleep (float): 단계 사이 대기 시간(초) - 그동안 쓰기 작업이 진행될 수 있음
+            progress (Callable): progress(복사한 페이지 수, 전체 페이지 수)
+            compact (bool): VACUUM INTO로 조각 모음한 사본을 만들지 여부
+        
+        Returns:
+            dict: 백업 통계 (실패하면 빈 dict)
+        """
+        from db_backup import online_backup
+        
+        try:
+            stats = online_backup(self.connection, dest_path, pages, sleep, progress, compact)
+            print(f"✓ '{dest_path}'에 백업했습니다. ({stats['bytes']:,} bytes)")
+            return stats
+        except (sqlite3.Error, OSError, RuntimeError) as e:
+            print(f"✗ 백업 오류: {e}")
+            return {}
+    
     def close(self):
         """데이터베이스 연결 종료"""
         if self.connection:
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+product_record.py
+
+Products 테이블 행을 담는 메모리 절약형 레코드 타입.
+
+- Product: __slots__ 데이터클래스 (인스턴스마다 __dict__가 없음). 튜플처럼 풀기·인덱싱·len()·비교·해시 지원. sqlite3 row_factory로
+  ProductDB(row_factory=product_row_factory), ProductManager(row_factory=product_row_factory)에 연결
+- ProductColumns: 대량 결과를 열 단위로 보관하는 컨테이너. ID/가격은 array('q'),
+  제품명은 UTF-8 바이트를 이어 붙인 bytearray + 시작 위치 배열로 저장하므로
+  행마다 튜플/문자열/정수 객체를 만들지 않습니다.
+
+Usage:
+    python product_record.py --db MyProduct.db      # 튜플 리스트 / Product 리스트 / ProductColumns 메모리 비교
+
+클래스: Product, ProductColumns
+함수: product_row_factory
+"""
+import argparse
+import sqlite3
+import sys
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Sequence, Tuple, Union
+
+PRODUCT_COLUMNS = ("productID", "productName", "productPrice")
+
+
+@dataclass(slots=True, eq=False)
+class Product:
+    productID: int
+    productName: str
+    productPrice: int
+
+    def __iter__(self) -> Iterator:
+        # 튜플처럼 풀어 쓸 수 있도록 (pid, name, price = product)
+        yield self.productID
+        yield self.productName
+        yield self.productPrice
+
+    def __getitem__(self, index):
+        # 튜플 행처럼 product[0], product[1:] 로 접근할 수 있도록
+        return self.astuple()[index]
+
+    def __len__(self) -> int:
+        return 3
+
+    # 튜플 행과 같은 값이면 같다고 보고 같은 해시를 돌려줌 (set/dict 키, 튜플과의 비교가 그대로 동작)
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (Product, tuple)):
+            return self.astuple() == tuple(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.astuple())
+
+    def astuple(self) -> Tuple[int, str, int]:
+        return (self.productID, self.productName, self.productPrice)
+
+
+def product_row_factory(cursor: sqlite3.Cursor, row: tuple):
+    """(productID, productName, productPrice) 행은 Product로, 그 외(COUNT 등)는 튜플 그대로 반환"""
+    if len(row) == 3 and cursor.description[0][0] == PRODUCT_COLUMNS[0]:
+        return Product(*row)
+    return row
+
+
+class ProductColumns:
+    """array 기반 열 저장소. 인덱싱/순회 시에만 Product를 만들어 반환"""
+
+    def __init__(self):
+        self.ids = array("q")
+        self.prices = array("q")
+        self._names = bytearray()
+        # i번째 이름은 _names[_offsets[i]:_offsets[i + 1]]
+        self._offsets = array("q", [0])
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Union[Sequence, Product]]) -> "ProductColumns":
+        cols = cls()
+        cols.extend(rows)
+        return cols
+
+    @classmethod
+    def from_db(cls, db, chunk_size: int = 5000) -> "ProductColumns":
+        """ProductDB.iter_products / ProductManager.iter_all로 스트리밍하며 채움"""
+        rows = db.iter_products(chunk_size) if hasattr(db, "iter_products") else db.iter_all(chunk_size)
+        return cls.from_rows(rows)
+
+    def append(self, product_id: int, name: str, price: int) -> None:
+        self.ids.append(product_id)
+        self.prices.append(price)
+        self._names += name.encode("utf-8")
+        self._offsets.append(len(self._names))
+
+    def extend(self, rows: Iterable[Union[Sequence, Product]]) -> None:
+        ids, prices, names, offsets = self.ids, self.prices, self._names, self._offsets
+        for product_id, name, price in rows:
+            ids.append(product_id)
+            prices.append(price)
+            names += name.encode("utf-8")
+            offsets.append(len(names))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def name(self, i: int) -> str:
+        return self._names[self._offsets[i]:self._offsets[i + 1]].decode("utf-8")
+
+    def __getitem__(self, i: int) -> Product:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("ProductColumns index out of range")
+        return Product(self.ids[i], self.name(i), self.prices[i])
+
+    def __iter__(self) -> Iterator[Product]:
+        for i in range(len(self)):
+            yield Product(self.ids[i], self.name(i), self.prices[i])
+
+    def names(self) -> Iterator[str]:
+        for i in range(len(self)):
+            yield self.name(i)
+
+    def nbytes(self) -> int:
+        """버퍼가 차지하는 바이트 수 (array/bytearray 여유 용량 제외)"""
+        return (
+            self.ids.itemsize * len(self.ids)
+            + self.prices.itemsize * len(self.prices)
+            + self._offsets.itemsize * len(self._offsets)
+            + len(self._names)
+        )
+
+
+def _deep_size(rows) -> int:
+    """리스트와 그 안의 행/필드 객체 크기 합 (같은 객체는 한 번만 셈)"""
+    seen = set()
+    total = sys.getsizeof(rows)
+    for row in rows:
+        for obj in (row, *row):
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                total += sys.getsizeof(obj)
+    return total
+
+
+def main(argv=None):
+    from product_db import ProductDB
+
+    p = argparse.ArgumentParser(description="제품 행 표현별 메모리 사용량 비교")
+    p.add_argument("--db", default="MyProduct.db", help="Database file path (default: MyProduct.db)")
+    p.add_argument("--limit", type=int, default=None, help="비교할 행 수 (기본: 전체)")
+    args = p.parse_args(argv)
+
+    pdb = ProductDB(db_path=args.db)
+    tuples = pdb.select_all(limit=args.limit)
+    pdb.close()
+    records = [Product(*r) for r in tuples]
+    cols = ProductColumns.from_rows(tuples)
+
+    n = len(tuples)
+    print(f"행 {n:,}개")
+    for label, size in (
+        ("튜플 리스트", _deep_size(tuples)),
+        ("Product 리스트", _deep_size(records)),
+        ("ProductColumns", cols.nbytes() + sys.getsizeof(cols)),
+    ):
+        per_row = size / n if n else 0
+        print(f"  {label:<15} {size / 1024 / 1024:9.1f} MB  (행당 {per_row:.0f} bytes)")
+
+
+if __name__ == "__main__":
+    main()
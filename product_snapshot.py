@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+product_snapshot.py
+
+Products 테이블의 읽기 전용 열(column) 스냅샷 파일.
+
+파일 구조 (모두 little-endian, 8바이트 정렬):
+    헤더     : magic(8) | 행 수 n(int64) | 이름 blob 길이(int64)
+    ids      : int64[n]   (productID 오름차순)
+    prices   : int64[n]
+    offsets  : int64[n+1] (i번째 이름 = blob[offsets[i]:offsets[i+1]])
+    blob     : UTF-8 제품명을 이어 붙인 바이트
+
+ProductSnapshot은 파일을 mmap으로 열고 배열을 복사 없이 바로 가리키므로(NumPy가 있으면
+numpy.frombuffer, 없으면 memoryview.cast) 여는 시간이 카탈로그 크기와 무관하고,
+같은 파일을 여는 여러 워커 프로세스가 OS 페이지 캐시를 공유합니다.
+ID 조회는 정렬된 ids 배열에서 이진 탐색(O(log n))으로 찾습니다.
+
+Usage:
+    python product_snapshot.py write --db MyProduct.db --out products.snap
+    python product_snapshot.py get --snap products.snap 1 42 99999
+
+클래스: ProductSnapshot
+함수: write_snapshot
+"""
+import argparse
+import bisect
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from typing import Optional
+
+from product_record import Product, ProductColumns
+
+MAGIC = b"PRODSNP1"
+_HEADER = struct.Struct("<8sqq")
+_INT64 = 8
+
+
+def write_snapshot(db, path: str, chunk_size: int = 5000) -> int:
+    """ProductDB/ProductManager의 전체 행을 스냅샷 파일로 기록 (임시 파일에 쓴 뒤 교체). Returns 행 수"""
+    cols = ProductColumns.from_db(db, chunk_size)
+    n = len(cols)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, n, len(cols._names)))
+        for arr in (cols.ids, cols.prices, cols._offsets):
+            if arr.itemsize != _INT64:
+                raise ValueError("int64 배열이 필요합니다.")
+            if sys.byteorder == "big":
+                arr = array("q", arr)
+                arr.byteswap()
+            arr.tofile(f)
+        f.write(cols._names)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return n
+
+
+class ProductSnapshot:
+    """mmap으로 연 스냅샷. ids/prices/offsets는 파일을 직접 가리키는 int64 배열"""
+
+    def __init__(self, path: str, use_numpy: bool = True):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 빈 파일은 mmap할 수 없음
+            self._file.close()
+            raise ValueError(f"스냅샷 파일이 비어 있습니다: {path}")
+        magic, n, blob_len = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"스냅샷 형식이 아닙니다: {path}")
+        self.n = n
+        ids_at = _HEADER.size
+        prices_at = ids_at + n * _INT64
+        offsets_at = prices_at + n * _INT64
+        self._blob_at = offsets_at + (n + 1) * _INT64
+        if self._blob_at + blob_len > len(self._mm):
+            self.close()
+            raise ValueError(f"스냅샷 파일이 잘렸습니다: {path}")
+
+        self.np = None
+        if use_numpy:
+            try:
+                import numpy as np
+
+                self.np = np
+            except ImportError:
+                pass
+        if self.np is not None:
+            i8 = self.np.dtype("<i8")
+            self.ids = self.np.frombuffer(self._mm, dtype=i8, count=n, offset=ids_at)
+            self.prices = self.np.frombuffer(self._mm, dtype=i8, count=n, offset=prices_at)
+            self.offsets = self.np.frombuffer(self._mm, dtype=i8, count=n + 1, offset=offsets_at)
+        else:
+            view = memoryview(self._mm)
+            self.ids = view[ids_at:prices_at].cast("q")
+            self.prices = view[prices_at:offsets_at].cast("q")
+            self.offsets = view[offsets_at:self._blob_at].cast("q")
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __enter__(self) -> "ProductSnapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def name(self, i: int) -> str:
+        start = self._blob_at + int(self.offsets[i])
+        end = self._blob_at + int(self.offsets[i + 1])
+        return self._mm[start:end].decode("utf-8")
+
+    def __getitem__(self, i: int) -> Product:
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("ProductSnapshot index out of range")
+        return Product(int(self.ids[i]), self.name(i), int(self.prices[i]))
+
+    def index_of(self, product_id: int) -> int:
+        """product_id의 위치 (없으면 -1)"""
+        if self.np is not None:
+            i = int(self.np.searchsorted(self.ids, product_id))
+        else:
+            i = bisect.bisect_left(self.ids, product_id)
+        if i < self.n and self.ids[i] == product_id:
+            return i
+        return -1
+
+    def index_many(self, product_ids):
+        """여러 ID의 위치를 한 번에 찾음 (NumPy 필요, 없는 ID는 -1)"""
+        np = self.np
+        if np is None:
+            return [self.index_of(pid) for pid in product_ids]
+        wanted = np.asarray(product_ids, dtype=np.int64)
+        idx = np.searchsorted(self.ids, wanted)
+        found = idx < self.n
+        found[found] = self.ids[idx[found]] == wanted[found]
+        return np.where(found, idx, -1)
+
+    def get(self, product_id: int) -> Optional[Product]:
+        i = self.index_of(product_id)
+        return self[i] if i >= 0 else None
+
+    def close(self) -> None:
+        # NumPy 배열이 버퍼를 잡고 있으면 mmap을 닫을 수 없으므로 먼저 놓아 줌
+        for attr in ("ids", "prices", "offsets"):
+            arr = getattr(self, attr, None)
+            if isinstance(arr, memoryview):
+                arr.release()
+            if hasattr(self, attr):
+                delattr(self, attr)
+        if getattr(self, "_mm", None) is not None:
+            try:
+                self._mm.close()
+            except BufferError:
+                # 호출 측이 배열 참조를 아직 들고 있음 - GC될 때 해제됨
+                pass
+            self._mm = None
+        if not self._file.closed:
+            self._file.close()
+
+
+def main(argv=None):
+    from product_db import ProductDB
+
+    p = argparse.ArgumentParser(description="Products 열 스냅샷 쓰기/조회")
+    p.add_argument("command", choices=["write", "get"], help="write: DB→스냅샷, get: ID 조회")
+    p.add_argument("ids", nargs="*", type=int, help="조회할 productID")
+    p.add_argument("--db", default="MyProduct.db", help="Database file path (default: MyProduct.db)")
+    p.add_argument("--snap", "--out", dest="snap", default="products.snap", help="스냅샷 파일 경로")
+    # 옵션 뒤에 ID를 적어도 되도록
+    args = p.parse_intermixed_args(argv)
+
+    if args.command == "write":
+        pdb = ProductDB(db_path=args.db)
+        t0 = time.time()
+        n = pdb.write_snapshot(args.snap)
+        pdb.close()
+        print(f"Wrote {n} rows to {args.snap} in {time.time() - t0:.2f} seconds")
+        return
+
+    t0 = time.perf_counter()
+    with ProductSnapshot(args.snap) as snap:
+        print(f"Opened {len(snap)} rows in {(time.perf_counter() - t0) * 1000:.2f} ms")
+        for product_id in args.ids:
+            print(snap.get(product_id) or f"productID {product_id} 없음")
+
+
+if __name__ == "__main__":
+    main()
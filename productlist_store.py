@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+productlist_store.py
+
+ProductList.py / ProductList3.py 창에서 쓰는 ProductList.db 데이터 접근 모듈.
+
+테이블: Products(id INTEGER PRIMARY KEY AUTOINCREMENT, Name TEXT, Price INTEGER)
+
+- 모든 SQL은 ? 자리표시자를 쓰는 고정 문장이라 SQL 인젝션이 불가능하고,
+  연결의 문장 캐시(cached_statements)에서 준비된 문장을 재사용합니다.
+- 조회 결과는 ProductRow(id, name, price) 이름 있는 튜플로 반환합니다.
+
+Usage:
+    store = ProductListStore("ProductList.db")
+    new_id = store.add("노트북", 1500000)
+    for row in store.all():
+        print(row.id, row.name, row.price)
+
+클래스: ProductRow, ProductListStore
+"""
+import sqlite3
+from typing import List, NamedTuple, Optional, Union
+
+# 창에서 반복 실행하는 문장 수보다 넉넉하게 (기본값 128)
+CACHED_STATEMENTS = 512
+
+SQL_CREATE = "CREATE TABLE IF NOT EXISTS Products (id integer primary key autoincrement, Name text, Price integer)"
+SQL_INSERT = "INSERT INTO Products (Name, Price) VALUES (?, ?)"
+SQL_UPDATE = "UPDATE Products SET Name = ?, Price = ? WHERE id = ?"
+SQL_DELETE = "DELETE FROM Products WHERE id = ?"
+SQL_SELECT_ALL = "SELECT id, Name, Price FROM Products ORDER BY id"
+SQL_SELECT_ONE = "SELECT id, Name, Price FROM Products WHERE id = ?"
+SQL_COUNT = "SELECT COUNT(*) FROM Products"
+
+
+class ProductRow(NamedTuple):
+    id: int
+    name: str
+    price: int
+
+
+def _product_row(cursor: sqlite3.Cursor, row: tuple) -> ProductRow:
+    return ProductRow(*row)
+
+
+def _to_int(value: Union[int, str], field: str) -> int:
+    """입력 위젯의 문자열을 정수로 변환 (잘못된 값은 ValueError)"""
+    try:
+        return int(str(value).strip().replace(",", ""))
+    except ValueError:
+        raise ValueError(f"{field}는 정수여야 합니다: {value!r}") from None
+
+
+class ProductListStore:
+    def __init__(self, db_path: str = "ProductList.db", cached_statements: int = CACHED_STATEMENTS):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, cached_statements=cached_statements)
+        self.conn.execute(SQL_CREATE)
+        self.conn.commit()
+
+    def _rows(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        cur = self.conn.cursor()
+        cur.row_factory = _product_row
+        return cur.execute(sql, params)
+
+    def add(self, name: str, price: Union[int, str]) -> int:
+        """제품 추가. Returns 새 id"""
+        with self.conn:
+            cur = self.conn.execute(SQL_INSERT, (name, _to_int(price, "가격")))
+        return cur.lastrowid
+
+    def update(self, product_id: Union[int, str], name: str, price: Union[int, str]) -> int:
+        """제품 수정. Returns 수정된 행 수"""
+        with self.conn:
+            cur = self.conn.execute(SQL_UPDATE, (name, _to_int(price, "가격"), _to_int(product_id, "제품ID")))
+        return cur.rowcount
+
+    def remove(self, product_id: Union[int, str]) -> int:
+        """제품 삭제. Returns 삭제된 행 수"""
+        with self.conn:
+            cur = self.conn.execute(SQL_DELETE, (_to_int(product_id, "제품ID"),))
+        return cur.rowcount
+
+    def get(self, product_id: Union[int, str]) -> Optional[ProductRow]:
+        return self._rows(SQL_SELECT_ONE, (_to_int(product_id, "제품ID"),)).fetchone()
+
+    def all(self) -> List[ProductRow]:
+        return self._rows(SQL_SELECT_ALL).fetchall()
+
+    def count(self) -> int:
+        return self.conn.execute(SQL_COUNT).fetchone()[0]
+
+    def close(self) -> None:
+        self.conn.close()
@@ -0,0 +1,75 @@
+"""
+spatial_grid.py
+
+블럭깨기 게임(breakout_game.py, demGame.py)용 균일 격자(uniform grid) 충돌 검사.
+
+움직이지 않는 Block 스프라이트를 격자 칸에 미리 등록해 두고, 공이 걸치는 칸에 들어 있는
+블럭만 검사하므로 블럭 수가 늘어나도 프레임당 충돌 검사 비용이 거의 일정합니다.
+pygame.sprite.spritecollide(ball, block_group, True)를 그대로 대체할 수 있습니다.
+
+클래스 메서드: add, remove, query, spritecollide
+"""
+from typing import Dict, Iterable, List, Set, Tuple
+
+import pygame
+
+
+class SpatialGrid:
+    def __init__(self, cell_size: int = 64, sprites: Iterable[pygame.sprite.Sprite] = ()):
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], Set[pygame.sprite.Sprite]] = {}
+        # 스프라이트가 등록된 칸 목록 (제거할 때 다시 계산하지 않도록)
+        self._where: Dict[pygame.sprite.Sprite, List[Tuple[int, int]]] = {}
+        for s in sprites:
+            self.add(s)
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def _cells_for(self, rect: pygame.Rect) -> List[Tuple[int, int]]:
+        cs = self.cell_size
+        x0, x1 = rect.left // cs, (rect.right - 1) // cs
+        y0, y1 = rect.top // cs, (rect.bottom - 1) // cs
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def add(self, sprite: pygame.sprite.Sprite) -> None:
+        if sprite in self._where:
+            self.remove(sprite)
+        keys = self._cells_for(sprite.rect)
+        self._where[sprite] = keys
+        for key in keys:
+            self._cells.setdefault(key, set()).add(sprite)
+
+    def remove(self, sprite: pygame.sprite.Sprite) -> None:
+        for key in self._where.pop(sprite, ()):
+            bucket = self._cells.get(key)
+            if bucket is not None:
+                bucket.discard(sprite)
+                if not bucket:
+                    del self._cells[key]
+
+    def query(self, rect: pygame.Rect) -> Set[pygame.sprite.Sprite]:
+        """rect가 걸치는 칸에 등록된 스프라이트 후보 (실제로 겹치는지는 확인하지 않음)"""
+        found: Set[pygame.sprite.Sprite] = set()
+        for key in self._cells_for(rect):
+            bucket = self._cells.get(key)
+            if bucket:
+                found |= bucket
+        return found
+
+    def spritecollide(self, sprite: pygame.sprite.Sprite, dokill: bool) -> List[pygame.sprite.Sprite]:
+        """pygame.sprite.spritecollide와 같은 결과를 후보 칸만 검사해서 반환"""
+        rect = sprite.rect
+        hits = []
+        for other in self.query(rect):
+            if not other.alive():
+                # 다른 곳에서 kill()된 블럭은 격자에서도 정리
+                self.remove(other)
+                continue
+            if rect.colliderect(other.rect):
+                hits.append(other)
+        if dokill:
+            for other in hits:
+                self.remove(other)
+                other.kill()
+        return hits
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+ui_loader.py
+
+Qt Designer .ui 파일을 미리 파이썬 모듈(ui_<이름>.py)로 컴파일해 두고,
+실행할 때는 컴파일된 모듈을 import해서 폼 클래스를 가져오는 로더.
+
+uic.loadUiType()은 실행할 때마다 XML을 파싱하고 파이썬 코드를 만들어 exec하므로
+시작이 느립니다. 컴파일된 모듈은 .pyc로 캐시되어 import만 하면 되고,
+컴파일된 모듈이 없거나 .ui보다 오래됐으면 예전처럼 uic.loadUiType()으로 대체합니다.
+
+Usage:
+    python ui_loader.py build                 # 현재 폴더의 모든 .ui 컴파일
+    python ui_loader.py build DemoForm2.ui    # 지정한 파일만
+    python ui_loader.py bench DemoForm2.ui    # loadUiType / 컴파일 모듈 로딩 시간 비교
+
+    # 스크립트에서
+    from ui_loader import load_ui_class
+    form_class = load_ui_class("DemoForm2.ui")
+
+함수: compiled_module_name, compile_ui, compile_all, load_ui_class
+"""
+import argparse
+import glob
+import importlib
+import os
+import sys
+from typing import List, Optional
+
+
+def compiled_module_name(ui_path: str) -> str:
+    """DemoForm2.ui → ui_DemoForm2 (c:\\work\\ProductList.ui 같은 윈도우 경로도 처리)"""
+    stem = os.path.splitext(os.path.basename(ui_path.replace("\\", "/")))[0]
+    return "ui_" + stem
+
+
+def _resolve(ui_path: str) -> str:
+    """상대 경로는 현재 폴더 → 스크립트 폴더 → PyInstaller 번들 폴더 순서로 찾음"""
+    if os.path.isabs(ui_path) or os.path.exists(ui_path):
+        return ui_path
+    bases = [os.path.dirname(os.path.abspath(sys.argv[0])), getattr(sys, "_MEIPASS", None)]
+    for base in bases:
+        if base and os.path.exists(os.path.join(base, ui_path)):
+            return os.path.join(base, ui_path)
+    return ui_path
+
+
+def compile_ui(ui_path: str, out_dir: Optional[str] = None) -> str:
+    """ui_path를 out_dir(기본: .ui와 같은 폴더)에 ui_<이름>.py로 컴파일. Returns 생성한 파일 경로"""
+    from PyQt5 import uic
+
+    out_dir = out_dir or os.path.dirname(os.path.abspath(ui_path))
+    py_path = os.path.join(out_dir, compiled_module_name(ui_path) + ".py")
+    tmp = py_path + ".tmp"
+    with open(ui_path, "r", encoding="utf-8") as src, open(tmp, "w", encoding="utf-8") as dst:
+        uic.compileUi(src, dst)
+    os.replace(tmp, py_path)
+    return py_path
+
+
+def compile_all(paths: Optional[List[str]] = None, out_dir: Optional[str] = None, force: bool = False) -> List[str]:
+    """여러 .ui 컴파일 (이미 최신인 파일은 건너뜀). Returns 새로 생성한 파일 목록"""
+    paths = paths or sorted(glob.glob("*.ui"))
+    built = []
+    for ui_path in paths:
+        target_dir = out_dir or os.path.dirname(os.path.abspath(ui_path))
+        py_path = os.path.join(target_dir, compiled_module_name(ui_path) + ".py")
+        if not force and os.path.exists(py_path) and os.path.getmtime(py_path) >= os.path.getmtime(ui_path):
+            continue
+        built.append(compile_ui(ui_path, out_dir))
+    return built
+
+
+def _form_class(module):
+    for name, obj in vars(module).items():
+        if name.startswith("Ui_") and isinstance(obj, type) and hasattr(obj, "setupUi"):
+            return obj
+    return None
+
+
+def load_ui_class(ui_path: str):
+    """
+    loadUiType(ui_path)[0]과 같은 폼 클래스 반환
+
+    컴파일된 ui_<이름> 모듈이 있고 .ui보다 오래되지 않았으면 그 안의 Ui_ 클래스를,
+    아니면 uic.loadUiType()으로 만든 클래스를 반환합니다.
+    """
+    ui_file = _resolve(ui_path)
+    try:
+        module = importlib.import_module(compiled_module_name(ui_path))
+    except ImportError:
+        module = None
+    if module is not None:
+        py_file = getattr(module, "__file__", None)
+        stale = (
+            py_file is not None
+            and os.path.exists(py_file)
+            and os.path.exists(ui_file)
+            and os.path.getmtime(py_file) < os.path.getmtime(ui_file)
+        )
+        form = _form_class(module)
+        if form is not None and not stale:
+            return form
+
+    from PyQt5 import uic
+
+    return uic.loadUiType(ui_file)[0]
+
+
+def _bench(ui_path: str, repeat: int) -> None:
+    """새 프로세스에서 첫 로딩 시간을 재야 하므로 각 방식을 서브프로세스로 실행"""
+    import subprocess
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    code = {
+        "uic.loadUiType": f"from PyQt5 import uic; uic.loadUiType({ui_path!r})",
+        "compiled module": f"import {compiled_module_name(ui_path)}",
+    }
+    for label, stmt in code.items():
+        script = f"import time; t=time.perf_counter(); {stmt}; print(time.perf_counter()-t)"
+        samples = []
+        for _ in range(repeat):
+            out = subprocess.run([sys.executable, "-c", script], cwd=here, capture_output=True, text=True)
+            if out.returncode != 0:
+                print(f"{label}: 실패\n{out.stderr.strip()}")
+                break
+            samples.append(float(out.stdout))
+        if samples:
+            samples.sort()
+            print(f"{label}: 중앙값 {samples[len(samples) // 2] * 1000:.1f} ms ({repeat}회)")
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description=".ui 파일 사전 컴파일")
+    p.add_argument("command", choices=["build", "bench"], help="build: .ui → ui_*.py, bench: 로딩 시간 비교")
+    p.add_argument("ui", nargs="*", help=".ui 파일 (기본: 현재 폴더의 모든 .ui)")
+    p.add_argument("--out", default=None, help="출력 폴더 (기본: .ui와 같은 폴더)")
+    p.add_argument("--force", action="store_true", help="최신이어도 다시 컴파일")
+    p.add_argument("--repeat", type=int, default=5, help="bench 반복 횟수")
+    args = p.parse_args(argv)
+
+    if args.command == "build":
+        built = compile_all(args.ui, args.out, args.force)
+        for path in built:
+            print(f"✓ {path}")
+        print(f"{len(built)}개 컴파일")
+    else:
+        for ui_path in args.ui or sorted(glob.glob("*.ui")):
+            print(f"[{ui_path}]")
+            _bench(ui_path, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
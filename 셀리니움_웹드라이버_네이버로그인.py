@@ -1,29 +1,30 @@
 # 셀리니움_웹드라이버_네이버로그인.py
-from selenium import webdriver
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.by import By
+#웹드라이버 풀과 명시적 대기 헬퍼
+from driver_pool import DriverPool, wait_for, wait_clickable
 import clipboard
-import time
 
 #selenium 4.6이상은 웹드라이버 설치 없이 사용 
-driver = webdriver.Chrome()
-driver.get('https://nid.naver.com/nidlogin.login?mode=form&url=https://www.naver.com/')
+#클립보드 붙여넣기를 쓰므로 헤드리스는 끔
+pool = DriverPool(size=1, headless=False)
+with pool.acquire() as driver:
+    driver.get('https://nid.naver.com/nidlogin.login?mode=form&url=https://www.naver.com/')
 
-# 로그인 창에 아이디/비밀번호 입력
-loginID = "sss6739"
-clipboard.copy(loginID)
-#mac은 COMMAND, window는 CONTROL
-driver.find_element(By.XPATH,'//*[@id="id"]').send_keys(
-    Keys.CONTROL, 'v')
+    # 로그인 창에 아이디/비밀번호 입력
+    loginID = "sss6739"
+    clipboard.copy(loginID)
+    #mac은 COMMAND, window는 CONTROL
+    wait_for(driver, (By.XPATH,'//*[@id="id"]')).send_keys(
+        Keys.CONTROL, 'v')
 
-loginPW = "christ890890"
-clipboard.copy(loginPW)
-driver.find_element(By.XPATH,'//*[@id="pw"]').send_keys(
-    Keys.CONTROL, 'v')
-time.sleep(1)
+    loginPW = "christ890890"
+    clipboard.copy(loginPW)
+    driver.find_element(By.XPATH,'//*[@id="pw"]').send_keys(
+        Keys.CONTROL, 'v')
 
-# 로그인 버튼 클릭
-driver.find_element(By.XPATH,'//*[@id="log.login"]').click()
+    # 로그인 버튼이 클릭 가능해지면 클릭 (고정 1초 대기 대신)
+    wait_clickable(driver, (By.XPATH,'//*[@id="log.login"]')).click()
 
-while True:
-    pass 
\ No newline at end of file
+    while True:
+        pass
\ No newline at end of file
@@ -1,26 +1,26 @@
-from selenium import webdriver
 from selenium.webdriver.common.keys import Keys 
 from selenium.webdriver.common.by import By
-import time 
+#웹드라이버 풀과 명시적 대기 헬퍼
+from driver_pool import DriverPool, wait_for
 
-#크롬드라이버 실행
-driver = webdriver.Chrome() 
-#url주소 추가해서 실행 
-driver.get("https://www.google.co.kr")
-#창이 오픈되고 3초를 대기한다. 
-time.sleep(3)
+#크롬드라이버 실행 (결과 화면을 보기 위해 헤드리스는 끔)
+pool = DriverPool(size=1, headless=False)
+with pool.acquire() as driver:
+    #url주소 추가해서 실행 
+    driver.get("https://www.google.co.kr")
 
-#<textarea class="gLFyf" jsaction="paste:puy29d;" id="APjFqb" maxlength="2048" name="q" rows="1" aria-activedescendant="" aria-autocomplete="both" aria-controls="Alh6id" aria-expanded="false" aria-haspopup="both" aria-owns="Alh6id" autocapitalize="off" autocomplete="off" autocorrect="off" autofocus="" role="combobox" spellcheck="false" title="검색" type="search" value="" aria-label="검색" data-ved="0ahUKEwiN1oGW9oGEAxU0nq8BHYCKAqkQ39UDCA4"></textarea>
-#검색어창 찾기
-searchBox = driver.find_element(By.CLASS_NAME, "gLFyf")
-#XPath를 사용하는 경우
-#//*[@id="APjFqb"]
-#searchBox = driver.find_element(By.XPATH,"//*[@id='APjFqb']")
+    #<textarea class="gLFyf" jsaction="paste:puy29d;" id="APjFqb" maxlength="2048" name="q" rows="1" aria-activedescendant="" aria-autocomplete="both" aria-controls="Alh6id" aria-expanded="false" aria-haspopup="both" aria-owns="Alh6id" autocapitalize="off" autocomplete="off" autocorrect="off" autofocus="" role="combobox" spellcheck="false" title="검색" type="search" value="" aria-label="검색" data-ved="0ahUKEwiN1oGW9oGEAxU0nq8BHYCKAqkQ39UDCA4"></textarea>
+    #검색어창이 나타날 때까지 대기 후 찾기 (고정 3초 대기 대신)
+    searchBox = wait_for(driver, (By.CLASS_NAME, "gLFyf"))
+    #XPath를 사용하는 경우
+    #//*[@id="APjFqb"]
+    #searchBox = driver.find_element(By.XPATH,"//*[@id='APjFqb']")
 
-searchBox.send_keys("맥북")
-searchBox.send_keys(Keys.RETURN)
-time.sleep(5)
+    searchBox.send_keys("맥북")
+    searchBox.send_keys(Keys.RETURN)
+    #검색 결과 영역이 나타날 때까지 대기
+    wait_for(driver, (By.ID, "search"))
 
-#무한루프
-while True:
-    pass
\ No newline at end of file
+    #무한루프
+    while True:
+        pass
\ No newline at end of file
@@ -1,10 +1,13 @@
-from selenium import webdriver as wb
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-import time
+from selenium.webdriver.support.ui import WebDriverWait
 import os
-#이미지를 저장하기 위한 라이브러리 
-from urllib.request import urlretrieve
+#미리 띄운 헤드리스 세션을 빌려 쓰는 웹드라이버 풀
+from driver_pool import DriverPool, wait_count_above
+#이미지를 병렬로 저장하기 위한 모듈 (중복 제거, 이어받기 지원)
+from image_downloader import download_images
+
+THUMBNAIL = "._fe_image_tab_content_thumbnail_image"
 
 def createFolder (name) :
     if os.path.isdir(f'./{name}') == False :
@@ -13,29 +16,39 @@ def createFolder (name) :
     else :
         print('이미 존재하는 폴더입니다.')
 
+def scrollUntilNoNew (driver, selector, max_count=500, timeout=3) :
+    #고정 sleep 대신 새 썸네일이 나타날 때까지만 기다리고, 더 이상 늘지 않으면 중단
+    count = len(driver.find_elements(By.CSS_SELECTOR, selector))
+    while count < max_count :
+        driver.find_element(By.CSS_SELECTOR, "body").send_keys(Keys.END)
+        if not wait_count_above(driver, selector, count, timeout) :
+            break
+        count = len(driver.find_elements(By.CSS_SELECTOR, selector))
+    return count
+
 
 input_name = input("검색할 동물이름:")
-driver = wb.Chrome()
-driver.get(f"https://search.naver.com/search.naver?where=image&sm=tab_jum&query={input_name}")
-#약간의 대기 시간 주기 
-time.sleep(2) 
-for i in range(2) : 
-    driver.find_element(By.CSS_SELECTOR, "body").send_keys(Keys.END)
-    time.sleep(2) 
-print("스크롤 다운 완료")
-img = driver.find_elements(By.CSS_SELECTOR, "._fe_image_tab_content_thumbnail_image") 
+#썸네일 src만 필요하므로 웹폰트 로딩은 차단
+pool = DriverPool(size=1, block_fonts=True)
+with pool.acquire() as driver :
+    driver.get(f"https://search.naver.com/search.naver?where=image&sm=tab_jum&query={input_name}")
+    #첫 썸네일이 나타날 때까지 대기 
+    WebDriverWait(driver, 10).until(lambda d : d.find_elements(By.CSS_SELECTOR, THUMBNAIL))
+    scrollUntilNoNew(driver, THUMBNAIL)
+    print("스크롤 다운 완료")
+    img = driver.find_elements(By.CSS_SELECTOR, THUMBNAIL) 
 
-#이미지의 src속성값 가져오기 
-src = [i.get_attribute('src') for i in img] 
+    #이미지의 src속성값 가져오기 
+    src = [i.get_attribute('src') for i in img] 
 srclst = []
 #잘못된 주소를 가져온 src 데이터를 빼고 src_lst에 담기
 for i in src : 
-    if 'data:image' not in i :
+    if i and 'data:image' not in i :
             srclst.append(i)
+pool.close() # 브라우저 닫기 (다운로드에는 브라우저가 필요 없음)
 #먼저 폴더를 생성 
 createFolder(input_name) 
-#.jpg 이미지 파일로 저장
-for i in range(len(srclst)) : 
-    urlretrieve(srclst[i], f'./{input_name}/{input_name}_{i+1}.jpg')
-driver.close() # 브라우저 닫기
-print(f'{input_name} 이미지 수집, 저장 작업 완료')
\ No newline at end of file
+#이미지 파일로 병렬 저장 (이미 받은 파일은 건너뜀)
+stats = download_images(srclst, f'./{input_name}', input_name)
+print(f"저장 {stats['saved']}개, 중복 {stats['duplicate']}개, 이전 완료 {stats['skipped']}개, 실패 {stats['failed']}개")
+print(f'{input_name} 이미지 수집, 저장 작업 완료')
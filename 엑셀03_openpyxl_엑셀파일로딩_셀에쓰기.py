@@ -1,4 +1,5 @@
 import  openpyxl  as  op  
+from  excel_io  import  write_block
 
 wb = op.load_workbook("test2.xlsx") 
 ws = wb["직원명부"] 
@@ -9,10 +10,8 @@ ws["C1"].value = "입력테스트2"
 
 datalist = [2,4,8,16,32,64,128,256] #임의의 숫자 리스트 정의
 
-i=5  
-for  data  in  datalist:
-    ws.cell(row = i, column=1).value = data  #A열(Column=1)에 행을 바꾸면서 입력
-    i=i+1  
+#A5부터 A열에 행을 바꾸면서 한 번에 입력 (셀마다 ws.cell을 호출하지 않음)
+write_block(ws, [[data] for data in datalist], "A5")
 
 wb.save("result2.xlsx") #엑셀 파일 저장
 
@@ -9,4 +9,12 @@ ws = wb.active
 ws.delete_rows(1,2)
 
 #Workbook 객체 저장
-wb.save("sample20_result2.xlsx")
\ No newline at end of file
+wb.save("sample20_result2.xlsx")
+
+#흩어진 여러 행을 지울 때는 delete_rows를 반복하지 말고 한 번에 걸러서 새 파일로 저장
+#(1, 2행 삭제 + 첫 열 값이 비어 있는 행 삭제)
+from excel_io import filter_rows
+kept, dropped = filter_rows("sample20.xlsx", "sample20_result3.xlsx",
+                            keep=lambda idx, row: row and row[0] is not None,
+                            drop_rows={1, 2})
+print(f"남긴 행: {kept}, 지운 행: {dropped}")
\ No newline at end of file
@@ -1,4 +1,5 @@
 from openpyxl import Workbook
+from excel_io import write_block
 
 # 전자제품 판매 데이터 생성 (임의의 데이터)
 products_data = [
@@ -12,12 +13,10 @@ products_data = [
 wb = Workbook()
 ws = wb.active
 
-# 헤더 추가
-ws.append(["제품ID", "제품명", "수량", "가격"])
-
-# 데이터 추가
-for product in products_data:
-    ws.append([product["제품ID"], product["제품명"], product["수량"], product["가격"]])
+# 헤더 + 데이터를 한 번에 추가 (가격 열은 천 단위 구분 형식)
+header = ["제품ID", "제품명", "수량", "가격"]
+rows = [header] + [[product[key] for key in header] for product in products_data]
+write_block(ws, rows, "A1", number_formats=[None, None, None, "#,##0"])
 
 # 엑셀 파일 저장
 file_path = "c:/work/products.xlsx"
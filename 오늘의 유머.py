@@ -1,12 +1,14 @@
 # coding:utf-8
 from bs4 import BeautifulSoup
 import urllib.request
-import re 
+from keyword_matcher import KeywordMatcher
 
 #User-Agent를 조작하는 경우(아이폰에서 사용하는 사파리 브라우져의 헤더) 
 hdr = {'User-agent':'Mozilla/5.0 (iPhone; CPU iPhone OS 10_3 like Mac OS X) AppleWebKit/603.1.23 (KHTML, like Gecko) Version/10.0 Mobile/14E5239e Safari/602.1'}
 #파일 저장
 f = open("todayhumor.txt", "wt", encoding="utf-8"   )
+#검색할 키워드 목록 (한 번만 컴파일해서 모든 제목에 재사용)
+matcher = KeywordMatcher(['일본'])
 
 for n in range(1,11):
     #오늘의 유머 주소 
@@ -28,8 +30,8 @@ for n in range(1,11):
                 title = item.find('a').text.strip()
                 #속성을 검색할 경우
                 href = item.find('a')['href']
-                if re.search('일본', title):
-                #정규식으로 '아이폰' 문자열이 있는지 검색
+                if matcher.search(title):
+                #키워드 목록 중 하나라도 포함되어 있는지 한 번에 검색
                     print(title)
                     print('https://www.todayhumor.co.kr + href')
                     f.write(title + "\n")
@@ -1,10 +1,12 @@
 # coding:utf-8
 from bs4 import BeautifulSoup
 import urllib.request
-import re 
+from keyword_matcher import KeywordMatcher
 
 #User-Agent를 조작하는 경우(아이폰에서 사용하는 사파리 브라우져의 헤더) 
 hdr = {'User-agent':'Mozilla/5.0 (iPhone; CPU iPhone OS 10_3 like Mac OS X) AppleWebKit/603.1.23 (KHTML, like Gecko) Version/10.0 Mobile/14E5239e Safari/602.1'}
+#검색할 키워드 목록 (한 번만 컴파일해서 모든 제목에 재사용)
+matcher = KeywordMatcher(['아이폰'])
 
 for n in range(0,10):
         #클리앙의 중고장터 주소 
@@ -23,9 +25,10 @@ for n in range(0,10):
                         # span = item.contents[1]
                         # span2 = span.nextSibling.nextSibling
                         title = item.text.strip()
-                        #정규식으로 '아이폰' 문자열이 있는지 검색
-                        if (re.search('아이폰', title)):
-                                print(title.strip())
+                        #키워드 목록 중 하나라도 포함되어 있는지 한 번에 검색
+                        hits = matcher.find_all(title)
+                        if hits:
+                                print(title.strip(), sorted(hits))
                                 # print('https://www.clien.net'  + item['href'])
                 except:
                         pass